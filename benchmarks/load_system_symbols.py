@@ -0,0 +1,79 @@
+"""
+Compare the time taken to load the system symbols.
+
+Loading them from the generated opcode tables, as the symbol table does, is
+compared with building them from the symbol lists the tables are generated
+from. Each is timed in a new interpreter that has already imported the rest of
+the package, with a warm bytecode cache. Run from anywhere with:
+
+    python benchmarks/load_system_symbols.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+
+# Each snippet imports the module holding the system symbols, creates the
+# first symbol table or the symbols from it and prints the time taken in
+# seconds. The module is removed from the package as well as sys.modules so
+# that it is imported again.
+LOAD_OPCODE_TABLES = """
+import sys, time
+import pdp10asm
+from pdp10asm.symbol_table import SymbolTable
+sys.modules.pop("pdp10asm.opcode_tables", None)
+vars(pdp10asm).pop("opcode_tables", None)
+start = time.perf_counter()
+SymbolTable()
+print(time.perf_counter() - start)
+"""
+
+LOAD_SYMBOL_LISTS = """
+import importlib, sys, time
+import pdp10asm
+sys.modules.pop("pdp10asm.symbol_lists", None)
+vars(pdp10asm).pop("symbol_lists", None)
+start = time.perf_counter()
+symbol_lists = importlib.import_module("pdp10asm.symbol_lists")
+{symbol.name: symbol for symbol in symbol_lists.SymbolList.get_system_symbols()}
+print(time.perf_counter() - start)
+"""
+
+
+def load_time(code, pycache, repeat):
+    """Return the shortest time printed by code, after a warm up run."""
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (str(REPOSITORY), env.get("PYTHONPATH")))
+    )
+    times = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env=env,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat + 1)
+    ]
+    return min(times[1:])
+
+
+def main(repeat=5):
+    """Print the time taken to load the system symbols each way."""
+    with tempfile.TemporaryDirectory() as pycache:
+        opcode_tables_time = load_time(LOAD_OPCODE_TABLES, pycache, repeat)
+        symbol_lists_time = load_time(LOAD_SYMBOL_LISTS, pycache, repeat)
+    print(f"opcode tables: {opcode_tables_time * 1e6:.0f}us")
+    print(f"symbol lists:  {symbol_lists_time * 1e6:.0f}us")
+
+
+if __name__ == "__main__":
+    main()
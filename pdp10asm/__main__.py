@@ -4,9 +4,7 @@ import pdp10asm
 
 
 def main():
-    with open(sys.argv[1]) as f:
-        text = f.read()
-    assembler = pdp10asm.PDP10Assembler(text)
+    assembler = pdp10asm.PDP10Assembler.from_path(sys.argv[1])
     program = assembler.assemble()
     print(program.listing_text())
 
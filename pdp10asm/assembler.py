@@ -1,82 +1,367 @@
 """The main PDP10Assembler class."""
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from zlib import crc32
+
 from .exceptions import AssemblyError
+from .expression_cache import ExpressionCache
+from .incremental import IncrementalAssembly
+from .parse_cache import ParseCache, ParseCacheDirectory
 from .passes import FirstPassAssembler, SecondPassAssembler
-from .program import Program
+from .program import Diagnostic, Program
 from .source_line import SourceLine
+from .source_line_table import SourceLineTable
 from .symbol_table import SymbolTable
 
 
 class PDP10Assembler:
     """DEC PDP-10 Assembler."""
 
-    def __init__(self, text):
+    parse_chunk_size = 5000
+
+    def __init__(
+        self,
+        text,
+        workers=1,
+        columnar=False,
+        parse_cache_size=ParseCache.default_maxsize,
+        cache_dir=None,
+        collect_errors=False,
+        expression_cache_size=ExpressionCache.default_maxsize,
+    ):
         """
         DEC PDP-10 Assembler.
 
         Args:
             text(str): The source code to assemble.
+
+        Kwargs:
+            workers (int): The number of processes used to parse the source.
+            columnar (bool): If True the parsed source is kept in a
+                SourceLineTable rather than a list of SourceLine instances.
+            parse_cache_size (int): The number of parsed instructions to keep
+                for reuse by repeated lines, 0 disables the parse cache.
+            cache_dir (str or Path): Directory in which parsed chunks of source
+                are stored for reuse when the source is assembled again. Only
+                the chunks that are not stored are parsed by the workers.
+            collect_errors (bool): If True errors in lines of source are added
+                to the program's diagnostics and assembly continues with the
+                next line, rather than stopping at the first error.
+            expression_cache_size (int): The number of expression values to
+                keep for reuse, 0 disables the expression cache.
         """
         self.symbol_table = SymbolTable()
         self.text = text
+        self.lines = None
+        self.workers = workers
+        self.columnar = columnar
+        self.collect_errors = collect_errors
+        self.parse_cache = ParseCache(parse_cache_size) if parse_cache_size else None
+        self.expression_cache = None
+        if expression_cache_size:
+            self.expression_cache = ExpressionCache(expression_cache_size)
+        self.parse_cache_dir = None
+        if cache_dir is not None:
+            self.parse_cache_dir = ParseCacheDirectory(cache_dir, self.symbol_table)
         self.program = Program()
         self.source_line_number = 0
         self.first_pass = FirstPassAssembler(assembler=self)
         self.second_pass = SecondPassAssembler(assembler=self)
         self.radix = 8
         self.current_pass = self.first_pass
+        self.incremental = None
+
+    @classmethod
+    def from_lines(cls, lines, **kwargs):
+        """
+        Return an assembler that reads its source from an iterable of lines.
+
+        The lines are only read when the source is parsed, one at a time, so
+        the whole source is never held in memory as a single string.
+
+        Args:
+            lines (iterable(str)): The lines of source, with or without line
+                endings, such as an open text file.
+
+        Kwargs are passed to PDP10Assembler.
+        """
+        assembler = cls(text=None, **kwargs)
+        assembler.lines = lines
+        return assembler
+
+    @classmethod
+    def from_path(cls, path, **kwargs):
+        """
+        Return an assembler that reads its source from the file at path.
+
+        Kwargs are passed to PDP10Assembler.
+        """
+        return cls.from_lines(_read_file_lines(path), **kwargs)
 
     def parse_text(self, text):
         """Return a list of SourceLine instances for each line of source."""
-        source_lines = []
-        for source_line_number, line_text in enumerate(text.splitlines(), 1):
+        return self.parse_lines(_text_lines(text))
+
+    def parse_lines(self, lines, first_line_number=1):
+        """Return the SourceLine instances for each line in an iterable."""
+        if self.parse_cache_dir is not None:
+            return self._parse_with_cache_dir(lines, first_line_number)
+        if self.workers > 1:
+            chunks = _chunk_lines(lines, first_line_number, self.parse_chunk_size)
+            first_chunks = list(islice(chunks, 2))
+            if len(first_chunks) > 1:
+                return self._parse_chunks_in_parallel(chain(first_chunks, chunks))
+            lines = chain.from_iterable(chunk for chunk, _ in first_chunks)
+        source_lines = self._new_source_lines()
+        source_lines.extend(self._read_lines(lines, first_line_number))
+        return source_lines
+
+    def _parse_with_cache_dir(self, lines, first_line_number):
+        """
+        Return the parsed lines, loading the chunks stored by an earlier parse.
+
+        The chunks that were not stored are parsed in worker processes if
+        there are several of them and more than one worker.
+        """
+        cache_dir = self.parse_cache_dir
+        chunks = []
+        misses = []
+        for chunk, chunk_first_line_number in _content_chunks(
+            lines, first_line_number, self.parse_chunk_size
+        ):
+            key = cache_dir.key(chunk)
+            chunk_lines = cache_dir.load(key, chunk, chunk_first_line_number, self)
+            if chunk_lines is None:
+                misses.append((len(chunks), key, chunk, chunk_first_line_number))
+            chunks.append(chunk_lines)
+        if self.workers > 1 and len(misses) > 1:
+            parsed_chunks = self._parse_chunks_in_workers(
+                (chunk, chunk_first_line_number)
+                for _, _, chunk, chunk_first_line_number in misses
+            )
+        else:
+            parsed_chunks = (
+                list(self._read_lines(chunk, chunk_first_line_number))
+                for _, _, chunk, chunk_first_line_number in misses
+            )
+        diagnostic_count = len(self.program.diagnostics)
+        for chunk_lines, (index, key, _, _) in zip(parsed_chunks, misses, strict=True):
+            if len(self.program.diagnostics) == diagnostic_count:
+                cache_dir.store(key, chunk_lines)
+            diagnostic_count = len(self.program.diagnostics)
+            chunks[index] = chunk_lines
+        source_lines = self._new_source_lines()
+        for chunk_lines in chunks:
+            source_lines.extend(chunk_lines)
+        return source_lines
+
+    def _read_lines(self, lines, first_line_number):
+        for source_line_number, line_text in enumerate(lines, first_line_number):
             source_line = SourceLine(
                 assembler=self, source_line_number=source_line_number, text=line_text
             )
-            source_line.read_text()
-            source_lines.append(source_line)
+            try:
+                source_line.read_text()
+            except AssemblyError as e:
+                if self.collect_errors is not True:
+                    raise
+                self.add_diagnostic("source processing", source_line, e)
+                source_line = SourceLine(
+                    assembler=self,
+                    source_line_number=source_line_number,
+                    text=line_text,
+                )
+            yield source_line
+
+    def _new_source_lines(self):
+        if self.columnar is True:
+            return SourceLineTable(assembler=self)
+        return []
+
+    def _parse_chunks_in_parallel(self, chunks):
+        source_lines = self._new_source_lines()
+        for chunk_lines in self._parse_chunks_in_workers(chunks):
+            source_lines.extend(chunk_lines)
+        return source_lines
+
+    def _parse_chunks_in_workers(self, chunks):
+        """Yield the parsed lines of each chunk, parsed in worker processes."""
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for chunk, first_line_number in chunks:
+                pending.append(
+                    executor.submit(
+                        _parse_chunk,
+                        chunk,
+                        first_line_number,
+                        self._parse_cache_size(),
+                        self.collect_errors,
+                    )
+                )
+                if len(pending) > self.workers * 2:
+                    yield self._adopt_lines(*pending.popleft().result())
+            while pending:
+                yield self._adopt_lines(*pending.popleft().result())
+
+    def _parse_cache_size(self):
+        if self.parse_cache is None:
+            return 0
+        return self.parse_cache.maxsize
+
+    def _adopt_lines(self, source_lines, cache_hits, cache_misses, diagnostics):
+        for source_line in source_lines:
+            source_line.assembler = self
+        if self.parse_cache is not None:
+            self.parse_cache.record(cache_hits, cache_misses)
+        self.program.diagnostics.extend(diagnostics)
         return source_lines
 
     def assemble(self):
         """Assemble the source program."""
         self.run_text_parse()
         self.run_first_pass_assembly()
-        self.program.symbols = self.symbol_table.user_symbols()
+        self.program.set_symbols(self.symbol_table)
         self.current_pass = self.second_pass
         self.radix = 8
-        self.run_second_pass_assembly()
+        self.symbol_table.cross_references = self.program.cross_references
+        try:
+            self.run_second_pass_assembly()
+        finally:
+            self.symbol_table.cross_references = None
         return self.program
 
+    def update(self, text):
+        """
+        Return the program assembled from a new version of the source.
+
+        Work done assembling the previous version is reused for the lines that
+        have not changed, giving the same program as assembling text from
+        scratch. The first call assembles text from scratch.
+
+        Args:
+            text (str): The new source code.
+        """
+        if self.incremental is None:
+            self.incremental = IncrementalAssembly(assembler=self)
+        self.text = text
+        self.lines = None
+        return self.incremental.update(list(_text_lines(text)))
+
     def run_text_parse(self):
         """Run first pass assembly."""
-        try:
+        self._run_stage("source processing", self._parse_source)
+
+    def _parse_source(self):
+        if self.lines is None:
             self.program.source_lines = self.parse_text(self.text)
-        except AssemblyError as e:
-            for line in self._create_error_message("source processing", e):
-                e.add_note(line)
-            raise e
+        else:
+            self.program.source_lines = self.parse_lines(_split_lines(self.lines))
 
     def run_first_pass_assembly(self):
         """Run first pass assembly."""
-        try:
-            self.first_pass.run()
-        except AssemblyError as e:
-            for line in self._create_error_message("first pass", e):
-                e.add_note(line)
-            raise e
+        self._run_stage("first pass", self.first_pass.run)
 
     def run_second_pass_assembly(self):
         """Run second pass assembly."""
+        self._run_stage("second pass", self.second_pass.run)
+
+    def _run_stage(self, pass_name, run):
         try:
-            self.second_pass.run()
+            return run()
         except AssemblyError as e:
-            for line in self._create_error_message("second pass", e):
+            for line in self._create_error_message(pass_name, e):
                 e.add_note(line)
             raise e
 
+    def add_diagnostic(self, pass_name, source_line, exception):
+        """Add an error in a line of source to the program's diagnostics."""
+        self.program.diagnostics.append(
+            Diagnostic(
+                source_line_number=source_line.source_line_number,
+                pass_name=pass_name,
+                message=str(exception),
+                text=source_line.text.strip(),
+            )
+        )
+
     def _create_error_message(self, pass_name, exception):
         return [
             f"During {pass_name} on line {self.current_pass.source_line_number}:",
             f"{self.current_pass.current_line!r}",
             str(exception),
         ]
+
+
+def _text_lines(text):
+    """Yield the lines of text one at a time, split as by str.splitlines."""
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start) + 1 or len(text)
+        yield from text[start:end].splitlines()
+        start = end
+
+
+def _split_lines(lines):
+    """Yield each line of an iterable of lines without its line ending."""
+    for line in lines:
+        yield from line.splitlines() or [""]
+
+
+def _read_file_lines(path):
+    """Yield the lines of the file at path, keeping it open until exhausted."""
+    with open(path) as f:
+        yield from f
+
+
+def _chunk_lines(lines, first_line_number, size):
+    """Yield lists of up to size lines with the line number of their first line."""
+    lines = iter(lines)
+    while chunk := list(islice(lines, size)):
+        yield chunk, first_line_number
+        first_line_number += len(chunk)
+
+
+def _content_chunks(lines, first_line_number, size):
+    """
+    Yield lists of lines split where the content of a line chooses a boundary.
+
+    Chunks are at least half of size lines long, unless they end the source,
+    and no longer than four times size. Because the boundaries depend on the
+    lines rather than their positions, inserting or removing lines only
+    changes the chunks around the edit.
+    """
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= size * 4 or (
+            len(chunk) >= size // 2 and crc32(line.encode(), 1) % size == 0
+        ):
+            yield chunk, first_line_number
+            first_line_number += len(chunk)
+            chunk = []
+    if chunk:
+        yield chunk, first_line_number
+
+
+def _parse_chunk(lines, first_line_number, parse_cache_size, collect_errors=False):
+    """
+    Parse a chunk of source lines in a worker process.
+
+    Returns the parsed lines with the hits and misses of the worker's parse
+    cache and the diagnostics for lines that could not be parsed.
+    """
+    assembler = PDP10Assembler(
+        text="", parse_cache_size=parse_cache_size, collect_errors=collect_errors
+    )
+    source_lines = assembler.parse_lines(lines, first_line_number)
+    diagnostics = assembler.program.diagnostics
+    if assembler.parse_cache is None:
+        return source_lines, 0, 0, diagnostics
+    return (
+        source_lines,
+        assembler.parse_cache.hits,
+        assembler.parse_cache.misses,
+        diagnostics,
+    )
@@ -0,0 +1,125 @@
+"""Classes for resolving assignments that refer to symbols defined later."""
+
+
+class DeferredAssignment:
+    """An assignment waiting for the symbols its value refers to."""
+
+    __slots__ = ("source_line", "radix", "program_counter", "dependencies")
+
+    def __init__(self, source_line, radix, program_counter, dependencies):
+        """
+        An assignment waiting for the symbols its value refers to.
+
+        Args:
+            source_line (SourceLine): The line of the assignment.
+            radix (int): The radix in effect at the assignment.
+            program_counter (int): The program counter at the assignment.
+            dependencies (tuple(str)): The undefined symbols its value uses.
+        """
+        self.source_line = source_line
+        self.radix = radix
+        self.program_counter = program_counter
+        self.dependencies = dependencies
+
+    def __repr__(self):
+        return f"<DeferredAssignment: {self.symbol}>"
+
+    @property
+    def symbol(self):
+        """Return the symbol being assigned."""
+        return self.source_line.assignment_symbol
+
+
+class AssignmentGraph:
+    """
+    Dependency graph of assignments deferred until their symbols are defined.
+
+    Each deferred assignment waits for the undefined symbols its value refers
+    to. When a symbol is defined the assignments waiting for it are returned
+    so they can be evaluated, which may define more symbols, resolving the
+    assignments in topological order.
+    """
+
+    def __init__(self):
+        """Dependency graph of assignments deferred until their symbols are defined."""
+        self.pending = {}
+        self.waiting = {}
+        self.deferred_count = 0
+
+    def __len__(self):
+        return len(self.pending)
+
+    def defer(self, assignment):
+        """Add an assignment, replacing any pending assignment of its symbol."""
+        self.pending[assignment.symbol] = assignment
+        for dependency in assignment.dependencies:
+            self.waiting.setdefault(dependency, set()).add(assignment.symbol)
+        self.deferred_count += 1
+
+    def discard(self, symbol):
+        """Remove the pending assignment of symbol as it has been redefined."""
+        self.pending.pop(symbol, None)
+
+    def waiting_for(self, symbol):
+        """Remove and return the pending assignments waiting for symbol in source order."""
+        assignments = []
+        for waiting_symbol in self.waiting.pop(symbol, ()):
+            assignment = self.pending.get(waiting_symbol)
+            if assignment is not None and symbol in assignment.dependencies:
+                del self.pending[waiting_symbol]
+                assignments.append(assignment)
+        return _in_source_order(assignments)
+
+    def unresolved(self):
+        """Return the pending assignments in source order."""
+        return _in_source_order(self.pending.values())
+
+    def cycles(self):
+        """
+        Return the cycles of pending assignments by the symbols in them.
+
+        Each cycle is a list of symbols starting and ending with the symbol
+        it is returned for. The graph is searched depth first with an explicit
+        stack.
+        """
+        cycles = {}
+        finished = set()
+        for start in self.pending:
+            if start in finished:
+                continue
+            path = [start]
+            on_path = {start}
+            stack = [iter(self._pending_dependencies(start))]
+            while stack:
+                for dependency in stack[-1]:
+                    if dependency in on_path:
+                        cycle = path[path.index(dependency) :]
+                        for index, symbol in enumerate(cycle):
+                            cycles.setdefault(
+                                symbol, cycle[index:] + cycle[:index] + [symbol]
+                            )
+                    elif dependency not in finished:
+                        path.append(dependency)
+                        on_path.add(dependency)
+                        stack.append(iter(self._pending_dependencies(dependency)))
+                        break
+                else:
+                    stack.pop()
+                    symbol = path.pop()
+                    on_path.discard(symbol)
+                    finished.add(symbol)
+        return cycles
+
+    def _pending_dependencies(self, symbol):
+        return [
+            dependency
+            for dependency in self.pending[symbol].dependencies
+            if dependency in self.pending
+        ]
+
+
+def _in_source_order(assignments):
+    """Return assignments sorted by the line they are on."""
+    return sorted(
+        assignments, key=lambda assignment: assignment.source_line.source_line_number
+    )
@@ -20,6 +20,12 @@ HEXADECIMAL = "HEX"
 
 RADICIES = {BINARY: 2, OCTAL: 8, DECIMAL: 10, HEXADECIMAL: 16}
 
+DEFINED_ORDER = "DEFINED"
+NAME_ORDER = "NAME"
+VALUE_ORDER = "VALUE"
+
+SYMBOL_ORDERS = {DEFINED_ORDER: "defined", NAME_ORDER: "name", VALUE_ORDER: "value"}
+
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
 
@@ -106,6 +112,43 @@ CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
     show_default=True,
     help="The output format for binary values in the program listing.",
 )
+@click.option(
+    "-so",
+    "--symbol-order",
+    type=click.Choice([DEFINED_ORDER, NAME_ORDER, VALUE_ORDER], case_sensitive=False),
+    default=DEFINED_ORDER,
+    show_default=True,
+    help="The order of the symbols in the program listing.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The number of processes used to parse the source.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    help="Directory in which parsed source is cached between runs.",
+)
+@click.option(
+    "-s",
+    "--stats",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Show the hit ratios of the parse and expression caches.",
+)
+@click.option(
+    "-e",
+    "--all-errors",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Report every error in the source rather than stopping at the first.",
+)
 def cli(
     source,
     output_path,
@@ -117,17 +160,29 @@ def cli(
     paged,
     listing_format,
     listing_radix,
+    symbol_order,
+    jobs,
+    cache_dir,
+    stats,
+    all_errors,
 ):
     """DEC PDP-10 Assembler."""
     click.echo(f"Assembling {click.format_filename(source.name)}.\n")
     output_class = OUTPUT_FORMATS[format]
-    program = _assemble_program(source)
+    program = _assemble_program(
+        source,
+        workers=jobs,
+        cache_dir=cache_dir,
+        stats=stats,
+        collect_errors=all_errors,
+    )
     click.secho("Assembly successful\n", fg="green")
     if no_listing is False:
         _handle_listing(
             program=program,
             listing_format=listing_format,
             listing_radix=listing_radix,
+            symbol_order=symbol_order,
             paged=paged,
             listing_path=listing_path,
         )
@@ -137,29 +192,64 @@ def cli(
         click.secho(f"Saved binary to {click.format_filename(output_path)}", fg="green")
 
 
-def _assemble_program(source):
+def _assemble_program(
+    source, workers=1, cache_dir=None, stats=False, collect_errors=False
+):
     try:
-        assembler = PDP10Assembler(source.read())
+        assembler = PDP10Assembler.from_lines(
+            source,
+            workers=workers,
+            cache_dir=cache_dir,
+            collect_errors=collect_errors,
+        )
         program = assembler.assemble()
     except exceptions.AssemblyError as e:
         raise click.ClickException("\n".join(e.__notes__)) from e
     else:
+        if stats is True:
+            _show_stats(assembler)
+        if collect_errors is True and program.diagnostics:
+            raise click.ClickException(_diagnostics_text(program.diagnostics))
         return program
 
 
-def _get_listing_text(program, listing_format, listing_radix):
+def _diagnostics_text(diagnostics):
+    return "\n\n".join(
+        [str(diagnostic) for diagnostic in diagnostics]
+        + [f"{len(diagnostics)} errors found."]
+    )
+
+
+def _show_stats(assembler):
+    for cache in (
+        assembler.parse_cache,
+        assembler.parse_cache_dir,
+        assembler.expression_cache,
+    ):
+        if cache is not None:
+            click.echo(f"{cache.summary()}\n")
+
+
+def _get_listing_text(program, listing_format, listing_radix, symbol_order):
     try:
         listing_class = LISTING_FORMATS[listing_format]
         return program.listing_text(
-            listing_class=listing_class, radix=RADICIES[listing_radix]
+            listing_class=listing_class,
+            radix=RADICIES[listing_radix],
+            symbol_order=SYMBOL_ORDERS[symbol_order],
         )
     except exceptions.ListingError as e:
         raise click.ClickException(str(e)) from e
 
 
-def _handle_listing(program, listing_format, listing_radix, paged, listing_path):
+def _handle_listing(
+    program, listing_format, listing_radix, symbol_order, paged, listing_path
+):
     listing_text = _get_listing_text(
-        program=program, listing_format=listing_format, listing_radix=listing_radix
+        program=program,
+        listing_format=listing_format,
+        listing_radix=listing_radix,
+        symbol_order=symbol_order,
     )
     if paged is True:
         click.echo_via_pager(listing_text)
@@ -1,5 +1,8 @@
 """PDP 10 Assembler constant values."""
 
+import string
+from functools import lru_cache
+
 
 class Constants:
     """Class for storing constant values."""
@@ -24,6 +27,9 @@ class Constants:
     }
     BINARY_SHIFT_INDICATOR = "B"
     SYMBOL_SPECIAL_CHARACTERS = ["%", "$", "."]
+    SYMBOL_CHARACTERS = frozenset(
+        string.ascii_letters + string.digits + "".join(SYMBOL_SPECIAL_CHARACTERS)
+    )
     OPEN_INDEX_REGISTER = "("
     CLOSE_INDEX_REGISTER = ")"
     INDIRECT_BIT = 0o20000000
@@ -48,8 +54,13 @@ class Constants:
     TEXT_WORD_DELIMITERS = [SEVEN_BIT_DELIMIETER, SIX_BIT_DELIMITER]
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def is_symbol(word):
         """Return True if word is a symbol, otherwise False."""
+        if Constants.SYMBOL_CHARACTERS.issuperset(word):
+            return word != "." and not word[0].isnumeric()
+        if word.isascii():
+            return False
         if word[0].isnumeric():
             return False
         for character in word:
@@ -0,0 +1,54 @@
+"""Index of the lines on which symbols are referenced."""
+
+from array import array
+
+
+class CrossReferences:
+    """
+    The lines on which each symbol is referenced.
+
+    Line numbers are kept in an array for each symbol. References are added
+    for the current line, which is set as each line is assembled, and a
+    symbol referenced more than once on the same line is only added once.
+    The symbols added for the current line are kept so they can be added
+    again without assembling the line.
+    """
+
+    def __init__(self):
+        """The lines on which each symbol is referenced."""
+        self.lines = {}
+        self.line = 0
+        self.line_symbols = []
+
+    def __contains__(self, symbol):
+        return symbol in self.lines
+
+    def __iter__(self):
+        return iter(self.lines)
+
+    def __len__(self):
+        return len(self.lines)
+
+    def set_line(self, line):
+        """Set the line number that references are added for."""
+        self.line = line
+        self.line_symbols.clear()
+
+    def add(self, symbol):
+        """Add a reference to symbol on the current line."""
+        lines = self.lines.get(symbol)
+        if lines is None:
+            lines = self.lines[symbol] = array("L")
+        elif lines[-1] == self.line:
+            return
+        lines.append(self.line)
+        self.line_symbols.append(symbol)
+
+    def add_all(self, symbols):
+        """Add a reference to each of symbols on the current line."""
+        for symbol in symbols:
+            self.add(symbol)
+
+    def references(self, symbol):
+        """Return an array of the lines on which symbol is referenced, in order."""
+        return array("L", self.lines.get(symbol, ()))
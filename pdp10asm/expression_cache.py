@@ -0,0 +1,93 @@
+"""Cache of evaluated expressions."""
+
+from .expressions import ExpressionParser
+from .parse_cache import ParseCache
+
+
+class ExpressionCache(ParseCache):
+    """
+    Bounded least recently used cache of expression values.
+
+    Keys are the text of an expression. Each value is kept with the radix it
+    was evaluated with and the versions of the symbols the expression refers
+    to, and is only reused while the radix is the same and none of those
+    symbols have been redefined. Expressions that add the program counter to,
+    or subtract it from, the rest of the expression are kept relative to the
+    program counter.
+
+    Expressions are only cached the second time they are evaluated, so those
+    that appear once in a program do not evict others.
+    """
+
+    name = "Expression cache"
+
+    def __init__(self, maxsize=None):
+        """
+        Bounded least recently used cache of expression values.
+
+        Kwargs:
+            maxsize (int): The number of entries to keep.
+        """
+        super().__init__(maxsize=maxsize)
+        self.seen = set()
+
+    def value(self, text, assembler):
+        """Return the value of expression text, evaluating it if necessary."""
+        entry = self.entries.get(text)
+        if entry is not None and self._is_valid(entry, assembler):
+            self.entries.move_to_end(text)
+            self.hits += 1
+            cross_references = assembler.symbol_table.cross_references
+            if cross_references is not None:
+                cross_references.add_all(entry[3])
+            value, sign = entry[0], entry[5]
+            if sign == 0:
+                return value
+            return value + sign * assembler.current_pass.program_counter
+        self.misses += 1
+        if entry is not None:
+            symbols, sign = entry[3], entry[5]
+        elif text in self.seen:
+            symbols, sign = ExpressionParser.references(text)
+        else:
+            self._see(text)
+            return ExpressionParser(text, assembler).value
+        value = ExpressionParser(text, assembler).value
+        if sign is not None:
+            self._store(text, value, symbols, sign, assembler)
+        return value
+
+    def _is_valid(self, entry, assembler):
+        """Return True if the value in entry is valid for the assembler's state."""
+        symbol_table = assembler.symbol_table
+        if entry[1] != assembler.radix:
+            return False
+        if entry[2] == symbol_table.version:
+            return True
+        if symbol_table.symbol_versions(entry[3]) != entry[4]:
+            return False
+        entry[2] = symbol_table.version
+        return True
+
+    def _store(self, text, value, symbols, sign, assembler):
+        """Cache the value of text, relative to the program counter if it uses it."""
+        if sign != 0:
+            value -= sign * assembler.current_pass.program_counter
+        symbol_table = assembler.symbol_table
+        self.add(
+            text,
+            [
+                value,
+                assembler.radix,
+                symbol_table.version,
+                symbols,
+                symbol_table.symbol_versions(symbols),
+                sign,
+            ],
+        )
+
+    def _see(self, text):
+        """Record that text has been evaluated, forgetting texts if there are too many."""
+        if len(self.seen) >= self.maxsize:
+            self.seen.clear()
+        self.seen.add(text)
@@ -1,5 +1,8 @@
 """The ExpressionParser class."""
 
+import re
+from functools import lru_cache
+
 from .constants import Constants
 from .exceptions import AssemblyError
 
@@ -50,6 +53,39 @@ class ExpressionParser:
         Constants.SUBTRACTION_OPERATOR: Operations.subtraction_operation,
     }
 
+    precedence = {
+        operator: precedence
+        for precedence, operator in enumerate(reversed(Constants.OPERATORS))
+    }
+
+    open_bracket = "<"
+    close_bracket = ">"
+
+    split_characters = frozenset(
+        Constants.OPERATORS
+        + [open_bracket, close_bracket, Constants.PROGRAM_COUNTER_OPERAND]
+    )
+
+    token_pattern = re.compile(
+        "(?P<split>[{0}])|(?P<run>[^{0}]+)".format(
+            re.escape("".join(sorted(split_characters)))
+        )
+    )
+
+    qualifier_radixes = {
+        qualifier[len(Constants.QUALIFIER_INDICATOR) :]: radix
+        for qualifier, radix in Constants.RADIX_QUALIFIERS.items()
+    }
+
+    number_pattern = re.compile(
+        r"(?:{indicator}(?P<qualifier>[{qualifiers}])\s*)?"
+        r"(?P<digits>[0-9]+)(?:\s*(?P<suffix>[{suffixes}]))?".format(
+            indicator=re.escape(Constants.QUALIFIER_INDICATOR),
+            qualifiers="".join(qualifier_radixes),
+            suffixes="".join(Constants.MAGNITUDE_SUFFIXES),
+        )
+    )
+
     def __init__(self, text, assembler, radix=None):
         """
         Evaluate expression text.
@@ -96,18 +132,39 @@ class ExpressionParser:
 
     def value_to_int(self, value):
         """Return a value as an integer."""
-        value, radix = self.handle_radix(value)
-        value, magnitude = self.handle_magnitude(value)
-        return int(value, radix) * magnitude
+        value, radix, magnitude = self.split_number(value)
+        return int(value, radix or self.radix or self.assembler.radix) * magnitude
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def split_number(value):
+        """Return the digits of a number, its qualified radix or None and magnitude."""
+        match = ExpressionParser.number_pattern.fullmatch(value)
+        if match is None:
+            value, radix = ExpressionParser.split_radix_qualifier(value)
+            value, magnitude = ExpressionParser.handle_magnitude(value)
+            return value, radix, magnitude
+        return (
+            match["digits"],
+            ExpressionParser.qualifier_radixes.get(match["qualifier"]),
+            Constants.MAGNITUDE_SUFFIXES.get(match["suffix"], 1),
+        )
 
     def handle_radix(self, value):
         """Return the value with radix qualifier removed and the radix."""
+        value, radix = self.split_radix_qualifier(value)
+        return value, radix or self.radix or self.assembler.radix
+
+    @staticmethod
+    def split_radix_qualifier(value):
+        """Return the value with radix qualifier removed and its radix or None."""
         for indicator, radix in Constants.RADIX_QUALIFIERS.items():
             if indicator in value:
                 return value.replace(indicator, "").strip(), radix
-        return value, self.radix or self.assembler.radix
+        return value, None
 
-    def handle_magnitude(self, value):
+    @staticmethod
+    def handle_magnitude(value):
         """Return value with magnitude removed and the magnitude value."""
         for suffix, magnitude in Constants.MAGNITUDE_SUFFIXES.items():
             if value.endswith(suffix):
@@ -135,61 +192,479 @@ class ExpressionParser:
 
     @staticmethod
     def expression_lexer(string):
-        """Return string as a list of values and operators."""
-        string = string.strip()
+        """
+        Return string as a list of values and operators.
+
+        Bracketed expressions are returned as nested lists.
+        """
         tokens = []
-        while string is not None and len(string) > 0:
-            if string[0] == "<":
-                end_bracked_index = string.rfind(">")
-                bracketed = string[1:end_bracked_index].strip()
-                string = string[end_bracked_index + 1 :].strip()
-                tokens.append(ExpressionParser.expression_lexer(bracketed))
+        groups = []
+        for token in ExpressionParser.expression_tokens(string):
+            if token == ExpressionParser.open_bracket:
+                groups.append(tokens)
+                tokens = []
+            elif token == ExpressionParser.close_bracket:
+                if not groups:
+                    raise AssemblyError(f"Unmatched {token!r} in {string.strip()!r}.")
+                group, tokens = tokens, groups.pop()
+                tokens.append(group)
             else:
-                token, string = ExpressionParser.get_token(string)
                 tokens.append(token)
+        if groups:
+            raise AssemblyError(
+                f"Unmatched {ExpressionParser.open_bracket!r} in {string.strip()!r}."
+            )
         return tokens
 
+    @staticmethod
+    def expression_tokens(string):
+        """Yield the values, operators and brackets in string."""
+        for match in ExpressionParser.token_pattern.finditer(string):
+            token = match.group().strip()
+            if token:
+                yield token
+
     @staticmethod
     def get_token(string):
         """Return the first token in a string."""
-        token = []
-        split_characters = Constants.OPERATORS + ["<", ">", "."]
-        for char in split_characters:
-            if string[0].startswith(char):
-                return char.strip(), string[len(char) :].strip()
-        for i, char in enumerate(string):
-            token.append(char)
-            if i < len(string) - 1 and string[i + 1] in split_characters:
-                return "".join(token).strip(), string[i + 1 :].strip()
-        return "".join(token).strip(), None
+        match = ExpressionParser.token_pattern.match(string)
+        rest = string[match.end() :]
+        if match.lastgroup == "run" and not rest:
+            return match.group().strip(), None
+        return match.group().strip(), rest.strip()
+
+    @staticmethod
+    def constant(text, assembler):
+        """
+        Return the value of text and the radix it depends on if it is constant.
+
+        Expressions are constant if they do not refer to symbols or the
+        program counter. The radix is None if every number in text has a radix
+        qualifier. Returns None if text is not constant or cannot be evaluated.
+        """
+        constant_assembler = _ConstantAssembler(assembler.radix)
+        try:
+            value = ExpressionParser(text, constant_assembler).value
+        except (_NotConstant, AssemblyError, ValueError, ZeroDivisionError):
+            return None
+        if constant_assembler.uses_radix is True:
+            return value, assembler.radix
+        return value, None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def references(text):
+        """
+        Return the symbols expression text refers to and its use of the program counter.
+
+        The use of the program counter is 0 if text does not refer to it, 1 or
+        -1 if the value of text is the rest of the expression plus or minus
+        the program counter, and None if it is used in any other way.
+        """
+        token = text.strip()
+        if token and ExpressionParser.split_characters.isdisjoint(token):
+            expression = [token]
+        else:
+            expression = ExpressionParser.expression_lexer(text)
+        symbols = {}
+        program_counters = 0
+        groups = [expression]
+        while groups:
+            for token in groups.pop():
+                if isinstance(token, list):
+                    groups.append(token)
+                elif token == Constants.PROGRAM_COUNTER_OPERAND:
+                    program_counters += 1
+                elif token not in ExpressionParser.split_characters:
+                    try:
+                        if Constants.is_symbol(token):
+                            symbols[token] = None
+                    except IndexError:
+                        pass
+        if program_counters == 0:
+            return tuple(symbols), 0
+        if program_counters > 1 or Constants.PROGRAM_COUNTER_OPERAND not in expression:
+            return tuple(symbols), None
+        return tuple(symbols), ExpressionParser._program_counter_sign(expression)
+
+    @staticmethod
+    def _program_counter_sign(expression):
+        """
+        Return 1 or -1 if the program counter is added to or subtracted from expression.
+
+        Returns None if the program counter is an operand of any other
+        operator. Runs of subtraction group to the right, so the sign changes
+        with each subtraction operator before the program counter.
+        """
+        index = expression.index(Constants.PROGRAM_COUNTER_OPERAND)
+        sign = 1
+        for position in range(1, index):
+            if expression[position] == Constants.SUBTRACTION_OPERATOR and (
+                not _is_operator(expression[position - 1])
+            ):
+                sign = -sign
+        before = expression[index - 1] if index > 0 else None
+        if before == Constants.SUBTRACTION_OPERATOR and (
+            index == 1 or _is_operator(expression[index - 2])
+        ):
+            sign = -sign
+            before = expression[index - 2] if index > 1 else None
+        after = expression[index + 1] if index + 1 < len(expression) else None
+        linear_operators = (
+            None,
+            Constants.ADDITION_OPERATOR,
+            Constants.SUBTRACTION_OPERATOR,
+        )
+        if before not in linear_operators or after not in linear_operators:
+            return None
+        return sign
 
     def parse(self, text):
         """Return the parsed value of the expression text."""
-        expression = self.expression_lexer(text)
-        return self._parse_expression(expression)
+        return self.compile(text)(self)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def compile(text):
+        """
+        Return a function that evaluates the expression text.
+
+        The function takes an ExpressionParser and returns the value of the
+        expression using its assembler's symbols, program counter and radix.
+        Compiled expressions are cached by text so each expression is only
+        lexed and parsed once.
+        """
+        token = text.strip()
+        if token and ExpressionParser.split_characters.isdisjoint(token):
+            return ExpressionParser._compile_operand(token)
+        return ExpressionParser._compile_expression(
+            ExpressionParser.expression_lexer(text)
+        )
 
     def _parse_expression(self, expression):
-        for i, token in enumerate(expression):
+        return self._compile_expression(expression)(self)
+
+    @staticmethod
+    def _compile_expression(expression):
+        """
+        Return a function for a list of tokens, parsed by operator precedence.
+
+        Each operator has its own precedence, in the reverse order of
+        Constants.OPERATORS, and runs of the same operator group to the
+        right. The tokens are compiled to a list of instructions in postfix
+        order which is evaluated on a stack of values. Bracketed expressions
+        are compiled on a stack of groups rather than by recursion, so
+        expressions may be nested to any depth.
+        """
+        code = []
+        groups = [ExpressionParser._compile_group(expression, code)]
+        while groups:
+            group = next(groups[-1], None)
+            if group is None:
+                groups.pop()
+            else:
+                groups.append(ExpressionParser._compile_group(group, code))
+        return ExpressionParser._evaluator(code)
+
+    @staticmethod
+    def _compile_group(expression, code):
+        """
+        Add the instructions for a list of tokens to code.
+
+        Operands and operators are read once, reducing the operators on a
+        stack as an operator of lower precedence is reached, so the time
+        taken is linear in the number of tokens. Yields each bracketed
+        expression in turn so that its instructions can be added before
+        those that follow it.
+        """
+        sequence = ExpressionParser._operand_sequence(expression)
+        if sequence is None:
+            for token in expression:
+                if isinstance(token, list):
+                    yield token
+                else:
+                    code.append((_OPERAND, ExpressionParser._compile_token(token), 0))
+            code.append((_MISMATCH, ExpressionParser._mismatch, len(expression)))
+            return
+        precedence = ExpressionParser.precedence
+        operators = []
+        for token, negated in sequence:
+            if negated is None:
+                while operators and precedence[operators[-1]] > precedence[token]:
+                    ExpressionParser._reduce(operators, code)
+                operators.append(token)
+                continue
             if isinstance(token, list):
-                expression[i] = self._parse_expression(token)
-        if len(expression) == 1:
-            return self.symbol_or_value(expression[0])
-        for operator in reversed(Constants.OPERATORS):
-            if operator in expression:
-                operator_index = expression.index(operator)
-                if operator == Constants.SUBTRACTION_OPERATOR:
-                    if (
-                        operator_index == 0
-                        or expression[operator_index - 1] in Constants.OPERATORS
-                    ):
-                        value = expression.pop(operator_index + 1)
-                        expression[operator_index] = 0 - self._parse_expression([value])
-                        return self._parse_expression(expression)
-                left = expression[:operator_index]
-                right = expression[operator_index + 1 :]
-                method = self.operations[operator]
-                return method(
-                    self._parse_expression(left),
-                    self._parse_expression(right),
-                )
-        raise AssemblyError(f"Value operator mismatch {expression!r}.")
+                yield token
+            else:
+                code.append((_OPERAND, ExpressionParser._compile_operand(token), 0))
+            if negated:
+                code.append((_NEGATE, None, 1))
+        while operators:
+            ExpressionParser._reduce(operators, code)
+
+    @staticmethod
+    def _operand_sequence(tokens):
+        """
+        Return tokens as alternating operands and operators.
+
+        Each item is a token and whether it is negated, or None for
+        operators. A subtraction operator at the start of the tokens or after
+        another operator negates the token following it. Returns None if the
+        tokens do not alternate between operands and operators.
+        """
+        sequence = []
+        tokens = iter(tokens)
+        for token in tokens:
+            expects_operand = not sequence or sequence[-1][1] is None
+            if _is_operator(token):
+                if token == Constants.SUBTRACTION_OPERATOR and expects_operand:
+                    token = next(tokens, None)
+                    if token is None or _is_operator(token):
+                        return None
+                    sequence.append((token, True))
+                elif expects_operand:
+                    return None
+                else:
+                    sequence.append((token, None))
+            elif expects_operand:
+                sequence.append((token, False))
+            else:
+                return None
+        if not sequence or sequence[-1][1] is None:
+            return None
+        return sequence
+
+    @staticmethod
+    def _reduce(operators, code):
+        """Add an instruction for the run of operators on top of the stack."""
+        operator = operators.pop()
+        count = 2
+        while operators and operators[-1] == operator:
+            operators.pop()
+            count += 1
+        code.append((_APPLY, ExpressionParser.operations[operator], count))
+
+    @staticmethod
+    def _evaluator(code):
+        """
+        Return a function evaluating a list of instructions.
+
+        Each instruction pushes the value of an operand, negates the top
+        value, or replaces the top values with the result of a run of an
+        operator, grouped to the right.
+        """
+        if len(code) == 1 and code[0][0] == _OPERAND:
+            return code[0][1]
+        if len(code) == 3 and [kind for kind, _, _ in code] == [
+            _OPERAND,
+            _OPERAND,
+            _APPLY,
+        ]:
+            (_, left, _), (_, right, _), (_, method, _) = code
+            return lambda parser: method(left(parser), right(parser))
+        code = tuple(code)
+
+        def evaluate(parser):
+            stack = []
+            for kind, function, count in code:
+                if kind == _OPERAND:
+                    stack.append(function(parser))
+                elif kind == _NEGATE:
+                    stack[-1] = 0 - stack[-1]
+                elif kind == _APPLY and count == 2:
+                    value = stack.pop()
+                    stack[-1] = function(stack[-1], value)
+                else:
+                    values = stack[len(stack) - count :]
+                    del stack[len(stack) - count :]
+                    if kind == _MISMATCH:
+                        function(values)
+                    value = values.pop()
+                    for other in reversed(values):
+                        value = function(other, value)
+                    stack.append(value)
+            return stack[0]
+
+        return evaluate
+
+    @staticmethod
+    def _compile_token(token):
+        """Return a function for a token of an expression that is not evaluated."""
+        return lambda parser: token
+
+    @staticmethod
+    def _compile_operand(token):
+        """Return a function for the value of a single token of an expression."""
+        if token == Constants.PROGRAM_COUNTER_OPERAND:
+            return lambda parser: parser.assembler.current_pass.program_counter
+        try:
+            is_symbol = Constants.is_symbol(token)
+        except IndexError:
+            return lambda parser: parser.symbol_or_value(token)
+        if is_symbol:
+            return lambda parser: parser.assembler.symbol_table.get_symbol_value(token)
+        value, radix, magnitude = ExpressionParser.split_number(token)
+        if radix is None:
+            return lambda parser: (
+                int(value, parser.radix or parser.assembler.radix) * magnitude
+            )
+        try:
+            number = int(value, radix) * magnitude
+        except ValueError:
+            return lambda parser: parser.symbol_or_value(token)
+        return lambda parser: number
+
+    @staticmethod
+    def _mismatch(values):
+        """Raise an error for the values of an expression without operators."""
+        raise AssemblyError(f"Value operator mismatch {values!r}.")
+
+
+class ExpressionListParser(ExpressionParser):
+    """Methods for evaluating comma separated lists of expressions."""
+
+    separator = ","
+
+    list_token_pattern = re.compile(
+        "(?P<split>[{0}])|(?P<run>[^{0}]+)".format(
+            re.escape("".join(sorted(ExpressionParser.split_characters | {separator})))
+        )
+    )
+
+    number_list_pattern = re.compile(r"\s*[0-9]+\s*(?:,\s*[0-9]+\s*)*")
+
+    def __init__(self, text, assembler, radix=None):
+        """
+        Evaluate comma separated expression text.
+
+        Args:
+            text (str): The comma separated expressions to be evaluated.
+            assembler (PDP10Assembler): A reference to the assembler.
+        """
+        self.text = text
+        self.radix = radix
+        self.assembler = assembler
+
+    def as_twos_complement(self):
+        """Return the value of each expression as an integer."""
+        values = self.numbers()
+        if values is not None:
+            return values
+        values = []
+        for function in self.compile_list(self.text):
+            value = self.to_twos_complement(function(self))
+            self.validate_word(value)
+            values.append(value)
+        return values
+
+    def numbers(self):
+        """Return the values of a list of unqualified numbers or None."""
+        if self.number_list_pattern.fullmatch(self.text) is None:
+            return None
+        radix = self.radix or self.assembler.radix
+        try:
+            values = [int(number, radix) for number in self.text.split(self.separator)]
+        except ValueError:
+            return None
+        if max(values) > 0o777777777777:
+            return None
+        return values
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def compile_list(text):
+        """
+        Return a tuple of functions evaluating each expression in text.
+
+        The whole list is lexed at once. An expression with unmatched brackets
+        is compiled when it is evaluated, so its error is raised in order.
+        """
+        functions = []
+        for expression_text, expression in ExpressionListParser._split_list(text):
+            if expression is None:
+                functions.append(ExpressionListParser._compile_later(expression_text))
+            else:
+                functions.append(ExpressionParser._compile_expression(expression))
+        return tuple(functions)
+
+    @staticmethod
+    def _split_list(text):
+        """
+        Yield the text and tokens of each comma separated expression.
+
+        Bracketed expressions are nested lists of tokens as returned by
+        ExpressionParser.expression_lexer. The tokens are None if the
+        brackets in the expression do not match.
+        """
+        start = 0
+        tokens = []
+        groups = []
+        for match in ExpressionListParser.list_token_pattern.finditer(text):
+            token = match.group()
+            if token == ExpressionListParser.separator:
+                yield text[start : match.start()], None if groups else tokens
+                start = match.end()
+                tokens = []
+                groups = []
+            elif tokens is None:
+                continue
+            elif token == ExpressionParser.open_bracket:
+                groups.append(tokens)
+                tokens = []
+            elif token == ExpressionParser.close_bracket:
+                if groups:
+                    group, tokens = tokens, groups.pop()
+                    tokens.append(group)
+                else:
+                    tokens = None
+            else:
+                token = token.strip()
+                if token:
+                    tokens.append(token)
+        yield text[start:], None if groups else tokens
+
+    @staticmethod
+    def _compile_later(text):
+        """Return a function compiling and evaluating text when it is called."""
+        return lambda parser: ExpressionParser.compile(text)(parser)
+
+
+class _ConstantAssembler:
+    """
+    Stands in for an assembler while evaluating an expression at parse time.
+
+    Looking up a symbol or the program counter raises _NotConstant and reading
+    the radix is recorded.
+    """
+
+    __slots__ = ("_radix", "uses_radix")
+
+    def __init__(self, radix):
+        self._radix = radix
+        self.uses_radix = False
+
+    @property
+    def radix(self):
+        self.uses_radix = True
+        return self._radix
+
+    @property
+    def symbol_table(self):
+        raise _NotConstant()
+
+    @property
+    def current_pass(self):
+        raise _NotConstant()
+
+
+class _NotConstant(Exception):
+    """Raised when an expression refers to a symbol or the program counter."""
+
+
+_OPERAND, _NEGATE, _APPLY, _MISMATCH = range(4)
+
+
+def _is_operator(token):
+    """Return True if a token of an expression is an operator."""
+    return isinstance(token, str) and token in ExpressionParser.precedence
@@ -0,0 +1,434 @@
+"""Classes for reassembling edited source."""
+
+from array import array
+from bisect import bisect_left
+from itertools import islice
+
+from .passes import FirstPassAssembler, SecondPassAssembler
+from .program import Program
+from .symbol_table import SymbolTable, UserSymbol, UserSymbolIndex
+
+_MISSING = object()
+
+
+class AssemblyHistory:
+    """
+    Record of an assembly used to reassemble edited versions of its source.
+
+    The first pass state before each line it processed is kept, along with a
+    journal of the changes it made to the symbol table, so the pass can be
+    resumed from any line before the first assignment it deferred. The words
+    assembled from each line by the second pass, and the symbols the line
+    refers to, are kept so they can be reused for lines that have not changed.
+    """
+
+    def __init__(self, source_lines):
+        """
+        Record of an assembly used to reassemble edited versions of its source.
+
+        Args:
+            source_lines (list(SourceLine)): The parsed source.
+        """
+        self.source_lines = source_lines
+        self.program_counters = array("q")
+        self.radixes = array("B")
+        self.journal_starts = array("L")
+        self.journal = []
+        self.program_states = []
+        self.first_pass_end = 0
+        self.first_deferral = None
+        self.done = False
+        self.symbol_values = {}
+        self.assembled_words = {}
+
+    def record_line(self, program_counter, radix):
+        """Record the first pass state before a line is processed."""
+        self.program_counters.append(program_counter)
+        self.radixes.append(radix)
+        self.journal_starts.append(len(self.journal))
+
+    def journal_entries(self, index):
+        """Return the symbol table changes made by the line at index."""
+        start = self.journal_starts[index]
+        if index + 1 < len(self.journal_starts):
+            return self.journal[start : self.journal_starts[index + 1]]
+        return self.journal[start:]
+
+    def program_state(self, index):
+        """Return the program's title and subtitle before the line at index."""
+        position = bisect_left(self.program_states, index, key=lambda _: _[0])
+        if position == 0:
+            program = Program()
+            return program.title, program.subtitle
+        return self.program_states[position - 1][1:]
+
+    def truncate(self, index):
+        """Return a new history of the first pass before the line at index."""
+        history = AssemblyHistory(source_lines=None)
+        history.program_counters = self.program_counters[:index]
+        history.radixes = self.radixes[:index]
+        history.journal_starts = self.journal_starts[:index]
+        history.journal = self.journal[: self.journal_starts[index]]
+        history.program_states = [
+            state for state in self.program_states if state[0] < index
+        ]
+        return history
+
+
+class IncrementalAssembly:
+    """
+    Reassembles a program after its source is edited.
+
+    The new source is compared with the previous version by line and only
+    the lines between the unchanged start and end of the source are parsed.
+    The first pass resumes from the first changed line and, once its state
+    and the symbols it has defined match the previous assembly again, the
+    rest of the previous pass is replayed. The second pass reuses the words
+    assembled from unchanged lines if the symbols, program counter and radix
+    they were assembled with are the same. Unchanged lines are copied rather
+    than reused, so programs returned by earlier updates are not changed.
+    """
+
+    def __init__(self, assembler):
+        """
+        Reassembles a program after its source is edited.
+
+        Args:
+            assembler (PDP10Assembler): The assembler to update.
+        """
+        self.assembler = assembler
+        self.history = None
+        self.parser = None
+
+    def update(self, lines):
+        """Return the program assembled from a list of source lines."""
+        previous, self.history = self.history, None
+        assembler = self.assembler
+        if (
+            previous is None
+            or assembler.columnar is True
+            or assembler.collect_errors is True
+        ):
+            self.history = self._assemble(lines)
+        else:
+            self.history = self._reassemble(previous, lines)
+        return assembler.program
+
+    def _assemble(self, lines):
+        assembler = self.assembler
+        assembler.symbol_table = SymbolTable()
+        assembler.program = Program()
+        assembler.radix = 8
+        self._new_passes()
+        assembler.program.source_lines = self._parse(assembler, lines, 1)
+        history = AssemblyHistory(assembler.program.source_lines)
+        self._run_first_pass(history, 0, None)
+        self._run_second_pass(history, {})
+        return history
+
+    def _reassemble(self, previous, lines):
+        assembler = self.assembler
+        old_lines = previous.source_lines
+        limit = min(len(old_lines), len(lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix].text == lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < limit - prefix
+            and old_lines[len(old_lines) - suffix - 1].text
+            == lines[len(lines) - suffix - 1]
+        ):
+            suffix += 1
+        shift = len(lines) - len(old_lines)
+        assembler.program = Program()
+        self._new_passes()
+        changed_lines = self._parse(
+            self._parser(), lines[prefix : len(lines) - suffix], prefix + 1
+        )
+        source_lines = []
+        copies = {}
+        for source_line in old_lines[:prefix]:
+            copy = source_line.copy(source_line.source_line_number)
+            copies[copy] = source_line
+            source_lines.append(copy)
+        for source_line in changed_lines:
+            source_line.assembler = assembler
+            source_lines.append(source_line)
+        for source_line in old_lines[len(old_lines) - suffix :]:
+            copy = source_line.copy(source_line.source_line_number + shift)
+            copies[copy] = source_line
+            source_lines.append(copy)
+        assembler.program.source_lines = source_lines
+        start = min(prefix, previous.first_pass_end)
+        resync = None
+        if previous.first_deferral is not None:
+            start = min(start, previous.first_deferral)
+        else:
+            resync = _Resync(assembler, previous, start, len(lines) - suffix, shift)
+        history = self._restore(previous, start)
+        history.source_lines = source_lines
+        self._run_first_pass(history, start, resync)
+        reusable = {}
+        if previous.symbol_values == history.symbol_values:
+            for copy, source_line in copies.items():
+                words = previous.assembled_words.get(source_line)
+                if words is not None:
+                    reusable[copy] = words
+        self._run_second_pass(history, reusable)
+        return history
+
+    def _parser(self):
+        """Return an assembler with no user symbols to parse changed lines."""
+        if self.parser is None:
+            self.parser = type(self.assembler)(text="", parse_cache_size=0)
+            self.parser.parse_cache = self.assembler.parse_cache
+        return self.parser
+
+    def _parse(self, parser, lines, first_line_number):
+        return self.assembler._run_stage(
+            "source processing", lambda: parser.parse_lines(lines, first_line_number)
+        )
+
+    def _new_passes(self):
+        assembler = self.assembler
+        assembler.first_pass = FirstPassAssembler(assembler=assembler)
+        assembler.second_pass = SecondPassAssembler(assembler=assembler)
+        assembler.current_pass = assembler.first_pass
+
+    def _restore(self, previous, index):
+        """
+        Undo the first pass back to its state before the line at index.
+
+        A user symbol that is added back after being deleted or replaced would
+        be moved to the end of the user symbols, so in that case they are put
+        back in the order the earlier lines defined them.
+        """
+        assembler = self.assembler
+        symbol_table = assembler.symbol_table
+        journal_start = previous.journal_starts[index]
+        reordered = False
+        for name, symbol, new_symbol in reversed(previous.journal[journal_start:]):
+            if symbol is None:
+                symbol_table.delete_symbol(name)
+            else:
+                symbol_table.add_symbol(symbol)
+                reordered = reordered or (
+                    isinstance(symbol, UserSymbol)
+                    and not isinstance(new_symbol, UserSymbol)
+                )
+        if reordered:
+            symbol_table.user_symbol_index = _user_symbol_index(
+                symbol_table, previous.journal[:journal_start]
+            )
+        assembler.first_pass.program_counter = previous.program_counters[index]
+        assembler.first_pass.done = index == previous.first_pass_end and previous.done
+        assembler.radix = previous.radixes[index]
+        program = assembler.program
+        program.title, program.subtitle = previous.program_state(index)
+        return previous.truncate(index)
+
+    def _run_first_pass(self, history, start, resync):
+        assembler = self.assembler
+        symbol_table = assembler.symbol_table
+        symbol_table.journal = history.journal
+        try:
+            assembler._run_stage(
+                "first pass", lambda: self._first_pass(history, start, resync)
+            )
+        finally:
+            symbol_table.journal = None
+        assembler.program.set_symbols(symbol_table)
+        history.symbol_values = {
+            symbol.name: symbol.value for symbol in assembler.program.symbols
+        }
+
+    def _first_pass(self, history, index, resync):
+        self._first_pass_lines(history, index, resync)
+        self.assembler.first_pass.check_assignments()
+
+    def _first_pass_lines(self, history, index, resync):
+        assembler = self.assembler
+        first_pass = assembler.first_pass
+        program = assembler.program
+        source_lines = history.source_lines
+        while True:
+            if resync is not None and resync.matches(index):
+                self._replay(history, resync, index)
+                return
+            history.record_line(first_pass.program_counter, assembler.radix)
+            if first_pass.done is True or index == len(source_lines):
+                break
+            program_state = (program.title, program.subtitle)
+            journal_start = len(history.journal)
+            first_pass.run_line(source_lines[index])
+            if history.first_deferral is None and first_pass.assignments.deferred_count:
+                history.first_deferral = index
+            if (program.title, program.subtitle) != program_state:
+                history.program_states.append((index, program.title, program.subtitle))
+            if resync is not None:
+                resync.add_new(history.journal[journal_start:])
+            index += 1
+        history.first_pass_end = index
+        history.done = first_pass.done
+
+    def _replay(self, history, resync, index):
+        """Repeat the rest of the previous first pass from the line at index."""
+        assembler = self.assembler
+        symbol_table = assembler.symbol_table
+        previous = resync.previous
+        shift = resync.shift
+        for previous_index in range(index - shift, previous.first_pass_end + 1):
+            history.record_line(
+                previous.program_counters[previous_index],
+                previous.radixes[previous_index],
+            )
+            if previous_index == previous.first_pass_end:
+                break
+            for name, _, symbol in previous.journal_entries(previous_index):
+                if symbol is None:
+                    symbol_table.delete_symbol(name)
+                elif isinstance(symbol, UserSymbol):
+                    symbol_table.add_user_symbol(
+                        name, symbol.value, symbol.source_line + shift
+                    )
+                else:
+                    symbol_table.add_symbol(symbol)
+        history.program_states.extend(
+            (state_index + shift, title, subtitle)
+            for state_index, title, subtitle in previous.program_states
+            if state_index >= index - shift
+        )
+        program = assembler.program
+        program.title, program.subtitle = previous.program_state(
+            previous.first_pass_end + 1
+        )
+        history.first_pass_end = previous.first_pass_end + shift
+        history.done = previous.done
+        assembler.first_pass.done = previous.done
+
+    def _run_second_pass(self, history, reusable):
+        assembler = self.assembler
+        assembler.current_pass = assembler.second_pass
+        assembler.radix = 8
+        symbol_table = assembler.symbol_table
+        symbol_table.cross_references = assembler.program.cross_references
+        try:
+            assembler._run_stage(
+                "second pass", lambda: self._second_pass_lines(history, reusable)
+            )
+        finally:
+            symbol_table.cross_references = None
+
+    def _second_pass_lines(self, history, reusable):
+        assembler = self.assembler
+        second_pass = assembler.second_pass
+        by_memory_location = assembler.program.by_memory_location
+        cross_references = assembler.program.cross_references
+        assembled_words = history.assembled_words
+        for source_line in history.source_lines:
+            state = (second_pass.program_counter, assembler.radix)
+            words = reusable.get(source_line)
+            if words is not None and words[0] == state and second_pass.done is False:
+                second_pass.source_line_number = source_line.source_line_number
+                second_pass.current_line = source_line.text.strip()
+                cross_references.set_line(source_line.source_line_number)
+                cross_references.add_all(words[2])
+                second_pass.add_instructions(source_line, words[1])
+                assembled_words[source_line] = words
+                continue
+            word_count = len(by_memory_location)
+            if second_pass.run_line(source_line) is False:
+                return
+            word_count = len(by_memory_location) - word_count
+            if word_count > 0:
+                assembled_lines = islice(
+                    reversed(by_memory_location.values()), word_count
+                )
+                values = [
+                    assembled_line.binary_value for assembled_line in assembled_lines
+                ]
+                assembled_words[source_line] = (
+                    state,
+                    values[::-1],
+                    tuple(cross_references.line_symbols),
+                )
+
+
+class _Resync:
+    """Compares a resumed first pass with the previous first pass."""
+
+    def __init__(self, assembler, previous, start, suffix_start, shift):
+        self.assembler = assembler
+        self.previous = previous
+        self.previous_index = start
+        self.suffix_start = suffix_start
+        self.shift = shift
+        self.new_symbols = {}
+        self.previous_symbols = {}
+        self.differences = set()
+
+    def add_new(self, entries):
+        """Add the symbol table changes made by a line of the resumed pass."""
+        for name, _, symbol in entries:
+            self._set(self.new_symbols, self.previous_symbols, name, _key(symbol, 0))
+
+    def matches(self, index):
+        """Return True if the state before the line at index is unchanged."""
+        previous = self.previous
+        previous_index = index - self.shift
+        if index < self.suffix_start or previous_index > previous.first_pass_end:
+            return False
+        while self.previous_index < previous_index:
+            shift = 0
+            if self.previous_index >= self.suffix_start - self.shift:
+                shift = self.shift
+            for name, _, symbol in previous.journal_entries(self.previous_index):
+                self._set(
+                    self.previous_symbols, self.new_symbols, name, _key(symbol, shift)
+                )
+            self.previous_index += 1
+        if self.differences:
+            return False
+        assembler = self.assembler
+        program = assembler.program
+        return (
+            assembler.first_pass.program_counter
+            == previous.program_counters[previous_index]
+            and assembler.radix == previous.radixes[previous_index]
+            and (program.title, program.subtitle)
+            == previous.program_state(previous_index)
+            and assembler.first_pass.done
+            is (previous_index == previous.first_pass_end and previous.done)
+            and not assembler.first_pass.assignments.pending
+        )
+
+    def _set(self, symbols, other_symbols, name, key):
+        symbols[name] = key
+        if other_symbols.get(name, _MISSING) == key:
+            self.differences.discard(name)
+        else:
+            self.differences.add(name)
+
+
+def _user_symbol_index(symbol_table, journal):
+    """Return an index of the user symbols in the order journal defined them."""
+    names = {}
+    for name, _, symbol in journal:
+        if isinstance(symbol, UserSymbol):
+            names[name] = None
+        else:
+            names.pop(name, None)
+    index = UserSymbolIndex()
+    for name in names:
+        index.add(symbol_table.get_symbol(name))
+    return index
+
+
+def _key(symbol, shift):
+    """Return a comparable description of a symbol, with its line shifted."""
+    if symbol is None:
+        return None
+    if isinstance(symbol, UserSymbol):
+        return type(symbol), symbol.value, symbol.source_line + shift
+    return type(symbol), symbol.value, None
@@ -20,10 +20,19 @@ class BaseListing:
     memory_location_width = 10
     binary_value_width = 14
 
-    def __init__(self, program, radix=8):
-        """Class for creating assembly listings."""
+    def __init__(self, program, radix=8, symbol_order="defined"):
+        """
+        Class for creating assembly listings.
+
+        Kwargs:
+            radix (int): The radix in which values are listed.
+            symbol_order (str): "defined" to list symbols in the order they
+                were defined, "name" to sort them by name or "value" to sort
+                them by value.
+        """
         self.program = program
         self.radix = radix
+        self.symbol_order = symbol_order
 
     def heading_text(self):
         """Return the listing heading."""
@@ -39,10 +48,20 @@ class BaseListing:
         lines = []
         lines.append("SYMBOLS")
         lines.append("_______")
-        for symbol in self.program.symbols:
+        for symbol in self._symbols():
             lines.append(self._symbol_line(symbol))
         return "\n".join(lines)
 
+    def _symbols(self):
+        if self.symbol_order == "defined":
+            return self.program.symbols
+        elif self.symbol_order == "name":
+            return self.program.symbols_by_name()
+        elif self.symbol_order == "value":
+            return self.program.symbols_by_value()
+        else:
+            raise ListingError(f"Unsupported symbol order {self.symbol_order!r}.")
+
     def _symbol_line(self, symbol):
         line = [
             self._format_symbol_name(symbol),
@@ -0,0 +1,1566 @@
+"""
+Opcode tables of the PDP-10 system symbols.
+
+Generated from pdp10asm.symbol_lists by running
+python -m pdp10asm.symbol_lists. Do not edit.
+"""
+
+# Symbol name: (SymbolKind, shifted value).
+SYMBOLS = {
+    "HLL": (2, 0o500000000000),
+    "HLLI": (2, 0o501000000000),
+    "HLLM": (2, 0o502000000000),
+    "HLLS": (2, 0o503000000000),
+    "HRL": (2, 0o504000000000),
+    "HRLI": (2, 0o505000000000),
+    "HRLM": (2, 0o506000000000),
+    "HRLS": (2, 0o507000000000),
+    "HLLZ": (2, 0o510000000000),
+    "HLLZI": (2, 0o511000000000),
+    "HLLZM": (2, 0o512000000000),
+    "HLLZS": (2, 0o513000000000),
+    "HRLZ": (2, 0o514000000000),
+    "HRLZI": (2, 0o515000000000),
+    "HRLZM": (2, 0o516000000000),
+    "HRLZS": (2, 0o517000000000),
+    "HLLO": (2, 0o520000000000),
+    "HLLOI": (2, 0o521000000000),
+    "HLLOM": (2, 0o522000000000),
+    "HLLOS": (2, 0o523000000000),
+    "HRLO": (2, 0o524000000000),
+    "HRLOI": (2, 0o525000000000),
+    "HRLOM": (2, 0o526000000000),
+    "HRLOS": (2, 0o527000000000),
+    "HLLE": (2, 0o530000000000),
+    "HLLEI": (2, 0o531000000000),
+    "HLLEM": (2, 0o532000000000),
+    "HLLES": (2, 0o533000000000),
+    "HRLE": (2, 0o534000000000),
+    "HRLEI": (2, 0o535000000000),
+    "HRLEM": (2, 0o536000000000),
+    "HRLES": (2, 0o537000000000),
+    "HRR": (2, 0o540000000000),
+    "HRRI": (2, 0o541000000000),
+    "HRRM": (2, 0o542000000000),
+    "HRRS": (2, 0o543000000000),
+    "HLR": (2, 0o544000000000),
+    "HLRI": (2, 0o545000000000),
+    "HLRM": (2, 0o546000000000),
+    "HLRS": (2, 0o547000000000),
+    "HRRZ": (2, 0o550000000000),
+    "HRRZI": (2, 0o551000000000),
+    "HRRZM": (2, 0o552000000000),
+    "HRRZS": (2, 0o553000000000),
+    "HLRZ": (2, 0o554000000000),
+    "HLRZI": (2, 0o555000000000),
+    "HLRZM": (2, 0o556000000000),
+    "HLRZS": (2, 0o557000000000),
+    "HRRO": (2, 0o560000000000),
+    "HRROI": (2, 0o561000000000),
+    "HRROM": (2, 0o562000000000),
+    "HRROS": (2, 0o563000000000),
+    "HLRO": (2, 0o564000000000),
+    "HLROI": (2, 0o565000000000),
+    "HLROM": (2, 0o566000000000),
+    "HLROS": (2, 0o567000000000),
+    "HRRE": (2, 0o570000000000),
+    "HRREI": (2, 0o571000000000),
+    "HRREM": (2, 0o572000000000),
+    "HRRES": (2, 0o573000000000),
+    "HLRE": (2, 0o574000000000),
+    "HLREI": (2, 0o575000000000),
+    "HLREM": (2, 0o576000000000),
+    "HLRES": (2, 0o577000000000),
+    "EXCH": (2, 0o250000000000),
+    "BLT": (2, 0o251000000000),
+    "MOVE": (2, 0o200000000000),
+    "MOVEI": (2, 0o201000000000),
+    "MOVEM": (2, 0o202000000000),
+    "MOVES": (2, 0o203000000000),
+    "MOVS": (2, 0o204000000000),
+    "MOVSI": (2, 0o205000000000),
+    "MOVSM": (2, 0o206000000000),
+    "MOVSS": (2, 0o207000000000),
+    "MOVN": (2, 0o210000000000),
+    "MOVNI": (2, 0o211000000000),
+    "MOVNM": (2, 0o212000000000),
+    "MOVNS": (2, 0o213000000000),
+    "MOVM": (2, 0o214000000000),
+    "MOVMI": (2, 0o215000000000),
+    "MOVMM": (2, 0o216000000000),
+    "MOVMS": (2, 0o217000000000),
+    "PUSH": (2, 0o261000000000),
+    "POP": (2, 0o262000000000),
+    "LDB": (2, 0o135000000000),
+    "DPB": (2, 0o137000000000),
+    "IBP": (2, 0o133000000000),
+    "ILDB": (2, 0o134000000000),
+    "IDPB": (2, 0o136000000000),
+    "SETZ": (2, 0o400000000000),
+    "SETZI": (2, 0o401000000000),
+    "SETZM": (2, 0o402000000000),
+    "SETZB": (2, 0o403000000000),
+    "SETO": (2, 0o474000000000),
+    "SETOI": (2, 0o475000000000),
+    "SETOM": (2, 0o476000000000),
+    "SETOB": (2, 0o477000000000),
+    "SETA": (2, 0o424000000000),
+    "SETAI": (2, 0o425000000000),
+    "SETAM": (2, 0o426000000000),
+    "SETAB": (2, 0o427000000000),
+    "SETCA": (2, 0o450000000000),
+    "SETCAI": (2, 0o451000000000),
+    "SETCAM": (2, 0o452000000000),
+    "SETCAB": (2, 0o453000000000),
+    "SETM": (2, 0o454000000000),
+    "SETMI": (2, 0o455000000000),
+    "SETMM": (2, 0o456000000000),
+    "SETMB": (2, 0o457000000000),
+    "SETCM": (2, 0o460000000000),
+    "SETCMI": (2, 0o461000000000),
+    "SETCMM": (2, 0o462000000000),
+    "SETCMB": (2, 0o463000000000),
+    "AND": (2, 0o404000000000),
+    "ANDI": (2, 0o405000000000),
+    "ANDM": (2, 0o406000000000),
+    "ANDB": (2, 0o407000000000),
+    "ANDCA": (2, 0o420000000000),
+    "ANDCAI": (2, 0o411000000000),
+    "ANDCAM": (2, 0o412000000000),
+    "ANDCAB": (2, 0o413000000000),
+    "ANDCM": (2, 0o420000000000),
+    "ANDCMI": (2, 0o421000000000),
+    "ANDCMM": (2, 0o422000000000),
+    "ANDCMB": (2, 0o423000000000),
+    "ANDCB": (2, 0o440000000000),
+    "ANDCBI": (2, 0o441000000000),
+    "ANDCBM": (2, 0o442000000000),
+    "ANDCBB": (2, 0o443000000000),
+    "IOR": (2, 0o434000000000),
+    "IORI": (2, 0o435000000000),
+    "IORM": (2, 0o436000000000),
+    "IORB": (2, 0o437000000000),
+    "ORCA": (2, 0o454000000000),
+    "ORCAI": (2, 0o455000000000),
+    "ORCAM": (2, 0o456000000000),
+    "ORCAB": (2, 0o457000000000),
+    "ORCM": (2, 0o464000000000),
+    "ORCMI": (2, 0o465000000000),
+    "ORCMM": (2, 0o466000000000),
+    "ORCMB": (2, 0o467000000000),
+    "ORCB": (2, 0o470000000000),
+    "ORCBI": (2, 0o471000000000),
+    "ORCBM": (2, 0o472000000000),
+    "ORCBB": (2, 0o473000000000),
+    "XOR": (2, 0o430000000000),
+    "XORI": (2, 0o431000000000),
+    "XORM": (2, 0o432000000000),
+    "XORB": (2, 0o433000000000),
+    "EQV": (2, 0o444000000000),
+    "EQVI": (2, 0o444000000000),
+    "EQVM": (2, 0o444000000000),
+    "EQVB": (2, 0o444000000000),
+    "LSH": (2, 0o242000000000),
+    "LSHC": (2, 0o246000000000),
+    "ROT": (2, 0o241000000000),
+    "ROTC": (2, 0o245000000000),
+    "ADD": (2, 0o270000000000),
+    "ADDI": (2, 0o271000000000),
+    "ADDM": (2, 0o272000000000),
+    "ADDB": (2, 0o273000000000),
+    "SUB": (2, 0o274000000000),
+    "SUBI": (2, 0o275000000000),
+    "SUBM": (2, 0o276000000000),
+    "SUBB": (2, 0o277000000000),
+    "IMUL": (2, 0o220000000000),
+    "IMULI": (2, 0o221000000000),
+    "IMULM": (2, 0o222000000000),
+    "IMULB": (2, 0o223000000000),
+    "MUL": (2, 0o224000000000),
+    "MULI": (2, 0o225000000000),
+    "MULM": (2, 0o226000000000),
+    "MULB": (2, 0o227000000000),
+    "IDIV": (2, 0o230000000000),
+    "IDIVI": (2, 0o231000000000),
+    "IDIVM": (2, 0o232000000000),
+    "IDIVB": (2, 0o233000000000),
+    "DIV": (2, 0o234000000000),
+    "DIVI": (2, 0o235000000000),
+    "DIVM": (2, 0o236000000000),
+    "DIVB": (2, 0o237000000000),
+    "ASH": (2, 0o240000000000),
+    "ASHC": (2, 0o244000000000),
+    "FSC": (2, 0o132000000000),
+    "FADAR": (2, 0o144000000000),
+    "FADARI": (2, 0o145000000000),
+    "FADARM": (2, 0o146000000000),
+    "FADARB": (2, 0o147000000000),
+    "FSBR": (2, 0o154000000000),
+    "FSBRI": (2, 0o155000000000),
+    "FSBRM": (2, 0o156000000000),
+    "FSBRB": (2, 0o157000000000),
+    "FMPR": (2, 0o164000000000),
+    "FMPRI": (2, 0o165000000000),
+    "FMPRM": (2, 0o166000000000),
+    "FMPRB": (2, 0o167000000000),
+    "FDVR": (2, 0o174000000000),
+    "FDVRI": (2, 0o175000000000),
+    "FDVRM": (2, 0o176000000000),
+    "FDVRB": (2, 0o177000000000),
+    "DFN": (2, 0o131000000000),
+    "UFA": (2, 0o130000000000),
+    "FAD": (2, 0o140000000000),
+    "FADL": (2, 0o141000000000),
+    "FADM": (2, 0o142000000000),
+    "FADB": (2, 0o143000000000),
+    "FSB": (2, 0o150000000000),
+    "FSBL": (2, 0o151000000000),
+    "FSBM": (2, 0o152000000000),
+    "FSBB": (2, 0o153000000000),
+    "FMP": (2, 0o160000000000),
+    "FMPL": (2, 0o161000000000),
+    "FMPM": (2, 0o162000000000),
+    "FMPB": (2, 0o163000000000),
+    "FDV": (2, 0o170000000000),
+    "FDVL": (2, 0o171000000000),
+    "FDVM": (2, 0o172000000000),
+    "FDVB": (2, 0o173000000000),
+    "ADBJP": (2, 0o252000000000),
+    "AOBJN": (2, 0o253000000000),
+    "CAI": (2, 0o300000000000),
+    "CAIL": (2, 0o301000000000),
+    "CAIE": (2, 0o302000000000),
+    "CAILE": (2, 0o303000000000),
+    "CAIA": (2, 0o304000000000),
+    "CAIGE": (2, 0o305000000000),
+    "CAIN": (2, 0o306000000000),
+    "CAIG": (2, 0o307000000000),
+    "CAM": (2, 0o310000000000),
+    "CAML": (2, 0o311000000000),
+    "CAME": (2, 0o312000000000),
+    "CAMLE": (2, 0o313000000000),
+    "CAMA": (2, 0o314000000000),
+    "CAMGE": (2, 0o315000000000),
+    "CAMN": (2, 0o316000000000),
+    "CAMG": (2, 0o317000000000),
+    "JUMP": (2, 0o320000000000),
+    "JUMPL": (2, 0o321000000000),
+    "JUMPE": (2, 0o322000000000),
+    "JUMPLE": (2, 0o323000000000),
+    "JUMPA": (2, 0o324000000000),
+    "JUMPGE": (2, 0o325000000000),
+    "JUMPN": (2, 0o326000000000),
+    "JUMPG": (2, 0o327000000000),
+    "SKIP": (2, 0o330000000000),
+    "SKIPL": (2, 0o331000000000),
+    "SKIPE": (2, 0o332000000000),
+    "SKIPLE": (2, 0o333000000000),
+    "SKIPA": (2, 0o334000000000),
+    "SKIPGE": (2, 0o335000000000),
+    "SKIPN": (2, 0o336000000000),
+    "SKIPG": (2, 0o337000000000),
+    "AOJ": (2, 0o340000000000),
+    "AOJL": (2, 0o341000000000),
+    "AOJE": (2, 0o342000000000),
+    "AOJLE": (2, 0o343000000000),
+    "AOJA": (2, 0o344000000000),
+    "AOJGE": (2, 0o345000000000),
+    "AOJN": (2, 0o346000000000),
+    "AOJG": (2, 0o347000000000),
+    "AOS": (2, 0o350000000000),
+    "AOSL": (2, 0o351000000000),
+    "AOSE": (2, 0o352000000000),
+    "AOSLE": (2, 0o353000000000),
+    "AOSA": (2, 0o354000000000),
+    "AOSGE": (2, 0o355000000000),
+    "AOSN": (2, 0o356000000000),
+    "AOSG": (2, 0o357000000000),
+    "SOJ": (2, 0o360000000000),
+    "SOJL": (2, 0o361000000000),
+    "SOJE": (2, 0o362000000000),
+    "SOJLE": (2, 0o363000000000),
+    "SOJA": (2, 0o364000000000),
+    "SOJGE": (2, 0o365000000000),
+    "SOJN": (2, 0o366000000000),
+    "SOJG": (2, 0o367000000000),
+    "SOS": (2, 0o370000000000),
+    "SOSL": (2, 0o371000000000),
+    "SOSE": (2, 0o372000000000),
+    "SOSLE": (2, 0o373000000000),
+    "SOSA": (2, 0o374000000000),
+    "SOSGE": (2, 0o375000000000),
+    "SOSN": (2, 0o376000000000),
+    "SOSG": (2, 0o377000000000),
+    "TRN": (2, 0o600000000000),
+    "TRNE": (2, 0o602000000000),
+    "TRNA": (2, 0o604000000000),
+    "TRNN": (2, 0o606000000000),
+    "TRZ": (2, 0o620000000000),
+    "TRZE": (2, 0o622000000000),
+    "TRZA": (2, 0o624000000000),
+    "TRZN": (2, 0o626000000000),
+    "TRC": (2, 0o640000000000),
+    "TRCE": (2, 0o642000000000),
+    "TRCA": (2, 0o644000000000),
+    "TRCN": (2, 0o646000000000),
+    "TRO": (2, 0o660000000000),
+    "TROE": (2, 0o662000000000),
+    "TROA": (2, 0o664000000000),
+    "TRON": (2, 0o666000000000),
+    "TLN": (2, 0o601000000000),
+    "TLNE": (2, 0o603000000000),
+    "TLNA": (2, 0o605000000000),
+    "TLNN": (2, 0o607000000000),
+    "TLZ": (2, 0o621000000000),
+    "TLZE": (2, 0o623000000000),
+    "TLZA": (2, 0o625000000000),
+    "TLZN": (2, 0o627000000000),
+    "TLC": (2, 0o641000000000),
+    "TLCE": (2, 0o643000000000),
+    "TLCA": (2, 0o645000000000),
+    "TLCN": (2, 0o647000000000),
+    "TLO": (2, 0o661000000000),
+    "TLOE": (2, 0o663000000000),
+    "TLOA": (2, 0o665000000000),
+    "TLON": (2, 0o667000000000),
+    "TDN": (2, 0o610000000000),
+    "TDNE": (2, 0o612000000000),
+    "TDNA": (2, 0o614000000000),
+    "TDNN": (2, 0o616000000000),
+    "TDZ": (2, 0o630000000000),
+    "TDZE": (2, 0o632000000000),
+    "TDZA": (2, 0o634000000000),
+    "TDZN": (2, 0o636000000000),
+    "TDC": (2, 0o650000000000),
+    "TDCE": (2, 0o652000000000),
+    "TDCA": (2, 0o654000000000),
+    "TDCN": (2, 0o656000000000),
+    "TDO": (2, 0o670000000000),
+    "TDOE": (2, 0o672000000000),
+    "TDOA": (2, 0o674000000000),
+    "TDON": (2, 0o676000000000),
+    "TSN": (2, 0o611000000000),
+    "TSNE": (2, 0o613000000000),
+    "TSNA": (2, 0o615000000000),
+    "TSNN": (2, 0o617000000000),
+    "TSZ": (2, 0o631000000000),
+    "TSZE": (2, 0o633000000000),
+    "TSZA": (2, 0o635000000000),
+    "TSZN": (2, 0o637000000000),
+    "TSC": (2, 0o651000000000),
+    "TSCE": (2, 0o653000000000),
+    "TSCA": (2, 0o655000000000),
+    "TSCN": (2, 0o657000000000),
+    "TSO": (2, 0o671000000000),
+    "TSOE": (2, 0o673000000000),
+    "TSOA": (2, 0o675000000000),
+    "TSON": (2, 0o677000000000),
+    "XCT": (2, 0o256000000000),
+    "JFFO": (2, 0o243000000000),
+    "JFCL": (2, 0o255000000000),
+    "JSR": (2, 0o264000000000),
+    "JSP": (2, 0o265000000000),
+    "JRST": (2, 0o254000000000),
+    "JSA": (2, 0o266000000000),
+    "JRA": (2, 0o267000000000),
+    "PUSHJ": (2, 0o260000000000),
+    "POPJ": (2, 0o263000000000),
+    "Z": (2, 0o0),
+    "NOP": (2, 0o255000000000),
+    "JOV": (2, 0o255400000000),
+    "JCRY0": (2, 0o255200000000),
+    "JCRY1": (2, 0o255100000000),
+    "JCRY": (2, 0o255300000000),
+    "JFOV": (2, 0o255040000000),
+    "HALT": (2, 0o254200000000),
+    "JRSTF": (2, 0o254100000000),
+    "JEN": (2, 0o254500000000),
+    "CONO": (3, 0o700200000000),
+    "CONI": (3, 0o700240000000),
+    "DATAO": (3, 0o700140000000),
+    "DATAI": (3, 0o700040000000),
+    "CONSZ": (3, 0o700300000000),
+    "CONSE": (3, 0o700300000000),
+    "CONSO": (3, 0o700340000000),
+    "BLKO": (3, 0o100100000000),
+    "BLKI": (3, 0o700000000000),
+    "PI": (4, 0o4),
+    "APR": (4, 0o0),
+    "CPA": (4, 0o0),
+    "CCI": (4, 0o14),
+    "CCI2": (4, 0o20),
+    "ADC": (4, 0o24),
+    "ADC2": (4, 0o30),
+    "PTP": (4, 0o100),
+    "PTR": (4, 0o104),
+    "CDP": (4, 0o110),
+    "CDR": (4, 0o114),
+    "TTY": (4, 0o120),
+    "LPT": (4, 0o124),
+    "DIS": (4, 0o130),
+    "DIS2": (4, 0o135),
+    "PLT": (4, 0o140),
+    "PLT2": (4, 0o144),
+    "CR": (4, 0o150),
+    "CR2": (4, 0o154),
+    "DSK": (4, 0o170),
+    "DSK2": (4, 0o174),
+    "DC": (4, 0o200),
+    "DC2": (4, 0o204),
+    "UTC": (4, 0o210),
+    "UTS": (4, 0o214),
+    "MTC": (4, 0o220),
+    "MTS": (4, 0o224),
+    "MTM": (4, 0o230),
+    "DLS": (4, 0o240),
+    "DLS2": (4, 0o244),
+    "DPC": (4, 0o250),
+    "DPC2": (4, 0o254),
+    "MDF": (4, 0o260),
+    "MDF2": (4, 0o264),
+    "DF": (4, 0o270),
+    "DDCSA": (4, 0o300),
+    "DDCSB": (4, 0o304),
+    "DTC": (4, 0o320),
+    "DTS": (4, 0o324),
+    "DTC2": (4, 0o330),
+    "DTS2": (4, 0o334),
+    "TMC": (4, 0o340),
+    "TMS": (4, 0o344),
+    "TMC2": (4, 0o350),
+    "TMS2": (4, 0o354),
+}
+
+# Instruction id: (SymbolKind, shifted value).
+INSTRUCTIONS = (
+    None,
+    (2, 0o500000000000),
+    (2, 0o501000000000),
+    (2, 0o502000000000),
+    (2, 0o503000000000),
+    (2, 0o504000000000),
+    (2, 0o505000000000),
+    (2, 0o506000000000),
+    (2, 0o507000000000),
+    (2, 0o510000000000),
+    (2, 0o511000000000),
+    (2, 0o512000000000),
+    (2, 0o513000000000),
+    (2, 0o514000000000),
+    (2, 0o515000000000),
+    (2, 0o516000000000),
+    (2, 0o517000000000),
+    (2, 0o520000000000),
+    (2, 0o521000000000),
+    (2, 0o522000000000),
+    (2, 0o523000000000),
+    (2, 0o524000000000),
+    (2, 0o525000000000),
+    (2, 0o526000000000),
+    (2, 0o527000000000),
+    (2, 0o530000000000),
+    (2, 0o531000000000),
+    (2, 0o532000000000),
+    (2, 0o533000000000),
+    (2, 0o534000000000),
+    (2, 0o535000000000),
+    (2, 0o536000000000),
+    (2, 0o537000000000),
+    (2, 0o540000000000),
+    (2, 0o541000000000),
+    (2, 0o542000000000),
+    (2, 0o543000000000),
+    (2, 0o544000000000),
+    (2, 0o545000000000),
+    (2, 0o546000000000),
+    (2, 0o547000000000),
+    (2, 0o550000000000),
+    (2, 0o551000000000),
+    (2, 0o552000000000),
+    (2, 0o553000000000),
+    (2, 0o554000000000),
+    (2, 0o555000000000),
+    (2, 0o556000000000),
+    (2, 0o557000000000),
+    (2, 0o560000000000),
+    (2, 0o561000000000),
+    (2, 0o562000000000),
+    (2, 0o563000000000),
+    (2, 0o564000000000),
+    (2, 0o565000000000),
+    (2, 0o566000000000),
+    (2, 0o567000000000),
+    (2, 0o570000000000),
+    (2, 0o571000000000),
+    (2, 0o572000000000),
+    (2, 0o573000000000),
+    (2, 0o574000000000),
+    (2, 0o575000000000),
+    (2, 0o576000000000),
+    (2, 0o577000000000),
+    (2, 0o250000000000),
+    (2, 0o251000000000),
+    (2, 0o200000000000),
+    (2, 0o201000000000),
+    (2, 0o202000000000),
+    (2, 0o203000000000),
+    (2, 0o204000000000),
+    (2, 0o205000000000),
+    (2, 0o206000000000),
+    (2, 0o207000000000),
+    (2, 0o210000000000),
+    (2, 0o211000000000),
+    (2, 0o212000000000),
+    (2, 0o213000000000),
+    (2, 0o214000000000),
+    (2, 0o215000000000),
+    (2, 0o216000000000),
+    (2, 0o217000000000),
+    (2, 0o261000000000),
+    (2, 0o262000000000),
+    (2, 0o135000000000),
+    (2, 0o137000000000),
+    (2, 0o133000000000),
+    (2, 0o134000000000),
+    (2, 0o136000000000),
+    (2, 0o400000000000),
+    (2, 0o401000000000),
+    (2, 0o402000000000),
+    (2, 0o403000000000),
+    (2, 0o474000000000),
+    (2, 0o475000000000),
+    (2, 0o476000000000),
+    (2, 0o477000000000),
+    (2, 0o424000000000),
+    (2, 0o425000000000),
+    (2, 0o426000000000),
+    (2, 0o427000000000),
+    (2, 0o450000000000),
+    (2, 0o451000000000),
+    (2, 0o452000000000),
+    (2, 0o453000000000),
+    (2, 0o454000000000),
+    (2, 0o455000000000),
+    (2, 0o456000000000),
+    (2, 0o457000000000),
+    (2, 0o460000000000),
+    (2, 0o461000000000),
+    (2, 0o462000000000),
+    (2, 0o463000000000),
+    (2, 0o404000000000),
+    (2, 0o405000000000),
+    (2, 0o406000000000),
+    (2, 0o407000000000),
+    (2, 0o420000000000),
+    (2, 0o411000000000),
+    (2, 0o412000000000),
+    (2, 0o413000000000),
+    (2, 0o420000000000),
+    (2, 0o421000000000),
+    (2, 0o422000000000),
+    (2, 0o423000000000),
+    (2, 0o440000000000),
+    (2, 0o441000000000),
+    (2, 0o442000000000),
+    (2, 0o443000000000),
+    (2, 0o434000000000),
+    (2, 0o435000000000),
+    (2, 0o436000000000),
+    (2, 0o437000000000),
+    (2, 0o454000000000),
+    (2, 0o455000000000),
+    (2, 0o456000000000),
+    (2, 0o457000000000),
+    (2, 0o464000000000),
+    (2, 0o465000000000),
+    (2, 0o466000000000),
+    (2, 0o467000000000),
+    (2, 0o470000000000),
+    (2, 0o471000000000),
+    (2, 0o472000000000),
+    (2, 0o473000000000),
+    (2, 0o430000000000),
+    (2, 0o431000000000),
+    (2, 0o432000000000),
+    (2, 0o433000000000),
+    (2, 0o444000000000),
+    (2, 0o444000000000),
+    (2, 0o444000000000),
+    (2, 0o444000000000),
+    (2, 0o242000000000),
+    (2, 0o246000000000),
+    (2, 0o241000000000),
+    (2, 0o245000000000),
+    (2, 0o270000000000),
+    (2, 0o271000000000),
+    (2, 0o272000000000),
+    (2, 0o273000000000),
+    (2, 0o274000000000),
+    (2, 0o275000000000),
+    (2, 0o276000000000),
+    (2, 0o277000000000),
+    (2, 0o220000000000),
+    (2, 0o221000000000),
+    (2, 0o222000000000),
+    (2, 0o223000000000),
+    (2, 0o224000000000),
+    (2, 0o225000000000),
+    (2, 0o226000000000),
+    (2, 0o227000000000),
+    (2, 0o230000000000),
+    (2, 0o231000000000),
+    (2, 0o232000000000),
+    (2, 0o233000000000),
+    (2, 0o234000000000),
+    (2, 0o235000000000),
+    (2, 0o236000000000),
+    (2, 0o237000000000),
+    (2, 0o240000000000),
+    (2, 0o244000000000),
+    (2, 0o132000000000),
+    (2, 0o144000000000),
+    (2, 0o145000000000),
+    (2, 0o146000000000),
+    (2, 0o147000000000),
+    (2, 0o154000000000),
+    (2, 0o155000000000),
+    (2, 0o156000000000),
+    (2, 0o157000000000),
+    (2, 0o164000000000),
+    (2, 0o165000000000),
+    (2, 0o166000000000),
+    (2, 0o167000000000),
+    (2, 0o174000000000),
+    (2, 0o175000000000),
+    (2, 0o176000000000),
+    (2, 0o177000000000),
+    (2, 0o131000000000),
+    (2, 0o130000000000),
+    (2, 0o140000000000),
+    (2, 0o141000000000),
+    (2, 0o142000000000),
+    (2, 0o143000000000),
+    (2, 0o150000000000),
+    (2, 0o151000000000),
+    (2, 0o152000000000),
+    (2, 0o153000000000),
+    (2, 0o160000000000),
+    (2, 0o161000000000),
+    (2, 0o162000000000),
+    (2, 0o163000000000),
+    (2, 0o170000000000),
+    (2, 0o171000000000),
+    (2, 0o172000000000),
+    (2, 0o173000000000),
+    (2, 0o252000000000),
+    (2, 0o253000000000),
+    (2, 0o300000000000),
+    (2, 0o301000000000),
+    (2, 0o302000000000),
+    (2, 0o303000000000),
+    (2, 0o304000000000),
+    (2, 0o305000000000),
+    (2, 0o306000000000),
+    (2, 0o307000000000),
+    (2, 0o310000000000),
+    (2, 0o311000000000),
+    (2, 0o312000000000),
+    (2, 0o313000000000),
+    (2, 0o314000000000),
+    (2, 0o315000000000),
+    (2, 0o316000000000),
+    (2, 0o317000000000),
+    (2, 0o320000000000),
+    (2, 0o321000000000),
+    (2, 0o322000000000),
+    (2, 0o323000000000),
+    (2, 0o324000000000),
+    (2, 0o325000000000),
+    (2, 0o326000000000),
+    (2, 0o327000000000),
+    (2, 0o330000000000),
+    (2, 0o331000000000),
+    (2, 0o332000000000),
+    (2, 0o333000000000),
+    (2, 0o334000000000),
+    (2, 0o335000000000),
+    (2, 0o336000000000),
+    (2, 0o337000000000),
+    (2, 0o340000000000),
+    (2, 0o341000000000),
+    (2, 0o342000000000),
+    (2, 0o343000000000),
+    (2, 0o344000000000),
+    (2, 0o345000000000),
+    (2, 0o346000000000),
+    (2, 0o347000000000),
+    (2, 0o350000000000),
+    (2, 0o351000000000),
+    (2, 0o352000000000),
+    (2, 0o353000000000),
+    (2, 0o354000000000),
+    (2, 0o355000000000),
+    (2, 0o356000000000),
+    (2, 0o357000000000),
+    (2, 0o360000000000),
+    (2, 0o361000000000),
+    (2, 0o362000000000),
+    (2, 0o363000000000),
+    (2, 0o364000000000),
+    (2, 0o365000000000),
+    (2, 0o366000000000),
+    (2, 0o367000000000),
+    (2, 0o370000000000),
+    (2, 0o371000000000),
+    (2, 0o372000000000),
+    (2, 0o373000000000),
+    (2, 0o374000000000),
+    (2, 0o375000000000),
+    (2, 0o376000000000),
+    (2, 0o377000000000),
+    (2, 0o600000000000),
+    (2, 0o602000000000),
+    (2, 0o604000000000),
+    (2, 0o606000000000),
+    (2, 0o620000000000),
+    (2, 0o622000000000),
+    (2, 0o624000000000),
+    (2, 0o626000000000),
+    (2, 0o640000000000),
+    (2, 0o642000000000),
+    (2, 0o644000000000),
+    (2, 0o646000000000),
+    (2, 0o660000000000),
+    (2, 0o662000000000),
+    (2, 0o664000000000),
+    (2, 0o666000000000),
+    (2, 0o601000000000),
+    (2, 0o603000000000),
+    (2, 0o605000000000),
+    (2, 0o607000000000),
+    (2, 0o621000000000),
+    (2, 0o623000000000),
+    (2, 0o625000000000),
+    (2, 0o627000000000),
+    (2, 0o641000000000),
+    (2, 0o643000000000),
+    (2, 0o645000000000),
+    (2, 0o647000000000),
+    (2, 0o661000000000),
+    (2, 0o663000000000),
+    (2, 0o665000000000),
+    (2, 0o667000000000),
+    (2, 0o610000000000),
+    (2, 0o612000000000),
+    (2, 0o614000000000),
+    (2, 0o616000000000),
+    (2, 0o630000000000),
+    (2, 0o632000000000),
+    (2, 0o634000000000),
+    (2, 0o636000000000),
+    (2, 0o650000000000),
+    (2, 0o652000000000),
+    (2, 0o654000000000),
+    (2, 0o656000000000),
+    (2, 0o670000000000),
+    (2, 0o672000000000),
+    (2, 0o674000000000),
+    (2, 0o676000000000),
+    (2, 0o611000000000),
+    (2, 0o613000000000),
+    (2, 0o615000000000),
+    (2, 0o617000000000),
+    (2, 0o631000000000),
+    (2, 0o633000000000),
+    (2, 0o635000000000),
+    (2, 0o637000000000),
+    (2, 0o651000000000),
+    (2, 0o653000000000),
+    (2, 0o655000000000),
+    (2, 0o657000000000),
+    (2, 0o671000000000),
+    (2, 0o673000000000),
+    (2, 0o675000000000),
+    (2, 0o677000000000),
+    (2, 0o256000000000),
+    (2, 0o243000000000),
+    (2, 0o255000000000),
+    (2, 0o264000000000),
+    (2, 0o265000000000),
+    (2, 0o254000000000),
+    (2, 0o266000000000),
+    (2, 0o267000000000),
+    (2, 0o260000000000),
+    (2, 0o263000000000),
+    (2, 0o0),
+    (2, 0o255000000000),
+    (2, 0o255400000000),
+    (2, 0o255200000000),
+    (2, 0o255100000000),
+    (2, 0o255300000000),
+    (2, 0o255040000000),
+    (2, 0o254200000000),
+    (2, 0o254100000000),
+    (2, 0o254500000000),
+    (3, 0o700200000000),
+    (3, 0o700240000000),
+    (3, 0o700140000000),
+    (3, 0o700040000000),
+    (3, 0o700300000000),
+    (3, 0o700300000000),
+    (3, 0o700340000000),
+    (3, 0o100100000000),
+    (3, 0o700000000000),
+)
+
+# Instruction name: instruction id.
+INSTRUCTION_IDS = {
+    "HLL": 1,
+    "HLLI": 2,
+    "HLLM": 3,
+    "HLLS": 4,
+    "HRL": 5,
+    "HRLI": 6,
+    "HRLM": 7,
+    "HRLS": 8,
+    "HLLZ": 9,
+    "HLLZI": 10,
+    "HLLZM": 11,
+    "HLLZS": 12,
+    "HRLZ": 13,
+    "HRLZI": 14,
+    "HRLZM": 15,
+    "HRLZS": 16,
+    "HLLO": 17,
+    "HLLOI": 18,
+    "HLLOM": 19,
+    "HLLOS": 20,
+    "HRLO": 21,
+    "HRLOI": 22,
+    "HRLOM": 23,
+    "HRLOS": 24,
+    "HLLE": 25,
+    "HLLEI": 26,
+    "HLLEM": 27,
+    "HLLES": 28,
+    "HRLE": 29,
+    "HRLEI": 30,
+    "HRLEM": 31,
+    "HRLES": 32,
+    "HRR": 33,
+    "HRRI": 34,
+    "HRRM": 35,
+    "HRRS": 36,
+    "HLR": 37,
+    "HLRI": 38,
+    "HLRM": 39,
+    "HLRS": 40,
+    "HRRZ": 41,
+    "HRRZI": 42,
+    "HRRZM": 43,
+    "HRRZS": 44,
+    "HLRZ": 45,
+    "HLRZI": 46,
+    "HLRZM": 47,
+    "HLRZS": 48,
+    "HRRO": 49,
+    "HRROI": 50,
+    "HRROM": 51,
+    "HRROS": 52,
+    "HLRO": 53,
+    "HLROI": 54,
+    "HLROM": 55,
+    "HLROS": 56,
+    "HRRE": 57,
+    "HRREI": 58,
+    "HRREM": 59,
+    "HRRES": 60,
+    "HLRE": 61,
+    "HLREI": 62,
+    "HLREM": 63,
+    "HLRES": 64,
+    "EXCH": 65,
+    "BLT": 66,
+    "MOVE": 67,
+    "MOVEI": 68,
+    "MOVEM": 69,
+    "MOVES": 70,
+    "MOVS": 71,
+    "MOVSI": 72,
+    "MOVSM": 73,
+    "MOVSS": 74,
+    "MOVN": 75,
+    "MOVNI": 76,
+    "MOVNM": 77,
+    "MOVNS": 78,
+    "MOVM": 79,
+    "MOVMI": 80,
+    "MOVMM": 81,
+    "MOVMS": 82,
+    "PUSH": 83,
+    "POP": 84,
+    "LDB": 85,
+    "DPB": 86,
+    "IBP": 87,
+    "ILDB": 88,
+    "IDPB": 89,
+    "SETZ": 90,
+    "SETZI": 91,
+    "SETZM": 92,
+    "SETZB": 93,
+    "SETO": 94,
+    "SETOI": 95,
+    "SETOM": 96,
+    "SETOB": 97,
+    "SETA": 98,
+    "SETAI": 99,
+    "SETAM": 100,
+    "SETAB": 101,
+    "SETCA": 102,
+    "SETCAI": 103,
+    "SETCAM": 104,
+    "SETCAB": 105,
+    "SETM": 106,
+    "SETMI": 107,
+    "SETMM": 108,
+    "SETMB": 109,
+    "SETCM": 110,
+    "SETCMI": 111,
+    "SETCMM": 112,
+    "SETCMB": 113,
+    "AND": 114,
+    "ANDI": 115,
+    "ANDM": 116,
+    "ANDB": 117,
+    "ANDCA": 118,
+    "ANDCAI": 119,
+    "ANDCAM": 120,
+    "ANDCAB": 121,
+    "ANDCM": 122,
+    "ANDCMI": 123,
+    "ANDCMM": 124,
+    "ANDCMB": 125,
+    "ANDCB": 126,
+    "ANDCBI": 127,
+    "ANDCBM": 128,
+    "ANDCBB": 129,
+    "IOR": 130,
+    "IORI": 131,
+    "IORM": 132,
+    "IORB": 133,
+    "ORCA": 134,
+    "ORCAI": 135,
+    "ORCAM": 136,
+    "ORCAB": 137,
+    "ORCM": 138,
+    "ORCMI": 139,
+    "ORCMM": 140,
+    "ORCMB": 141,
+    "ORCB": 142,
+    "ORCBI": 143,
+    "ORCBM": 144,
+    "ORCBB": 145,
+    "XOR": 146,
+    "XORI": 147,
+    "XORM": 148,
+    "XORB": 149,
+    "EQV": 150,
+    "EQVI": 151,
+    "EQVM": 152,
+    "EQVB": 153,
+    "LSH": 154,
+    "LSHC": 155,
+    "ROT": 156,
+    "ROTC": 157,
+    "ADD": 158,
+    "ADDI": 159,
+    "ADDM": 160,
+    "ADDB": 161,
+    "SUB": 162,
+    "SUBI": 163,
+    "SUBM": 164,
+    "SUBB": 165,
+    "IMUL": 166,
+    "IMULI": 167,
+    "IMULM": 168,
+    "IMULB": 169,
+    "MUL": 170,
+    "MULI": 171,
+    "MULM": 172,
+    "MULB": 173,
+    "IDIV": 174,
+    "IDIVI": 175,
+    "IDIVM": 176,
+    "IDIVB": 177,
+    "DIV": 178,
+    "DIVI": 179,
+    "DIVM": 180,
+    "DIVB": 181,
+    "ASH": 182,
+    "ASHC": 183,
+    "FSC": 184,
+    "FADAR": 185,
+    "FADARI": 186,
+    "FADARM": 187,
+    "FADARB": 188,
+    "FSBR": 189,
+    "FSBRI": 190,
+    "FSBRM": 191,
+    "FSBRB": 192,
+    "FMPR": 193,
+    "FMPRI": 194,
+    "FMPRM": 195,
+    "FMPRB": 196,
+    "FDVR": 197,
+    "FDVRI": 198,
+    "FDVRM": 199,
+    "FDVRB": 200,
+    "DFN": 201,
+    "UFA": 202,
+    "FAD": 203,
+    "FADL": 204,
+    "FADM": 205,
+    "FADB": 206,
+    "FSB": 207,
+    "FSBL": 208,
+    "FSBM": 209,
+    "FSBB": 210,
+    "FMP": 211,
+    "FMPL": 212,
+    "FMPM": 213,
+    "FMPB": 214,
+    "FDV": 215,
+    "FDVL": 216,
+    "FDVM": 217,
+    "FDVB": 218,
+    "ADBJP": 219,
+    "AOBJN": 220,
+    "CAI": 221,
+    "CAIL": 222,
+    "CAIE": 223,
+    "CAILE": 224,
+    "CAIA": 225,
+    "CAIGE": 226,
+    "CAIN": 227,
+    "CAIG": 228,
+    "CAM": 229,
+    "CAML": 230,
+    "CAME": 231,
+    "CAMLE": 232,
+    "CAMA": 233,
+    "CAMGE": 234,
+    "CAMN": 235,
+    "CAMG": 236,
+    "JUMP": 237,
+    "JUMPL": 238,
+    "JUMPE": 239,
+    "JUMPLE": 240,
+    "JUMPA": 241,
+    "JUMPGE": 242,
+    "JUMPN": 243,
+    "JUMPG": 244,
+    "SKIP": 245,
+    "SKIPL": 246,
+    "SKIPE": 247,
+    "SKIPLE": 248,
+    "SKIPA": 249,
+    "SKIPGE": 250,
+    "SKIPN": 251,
+    "SKIPG": 252,
+    "AOJ": 253,
+    "AOJL": 254,
+    "AOJE": 255,
+    "AOJLE": 256,
+    "AOJA": 257,
+    "AOJGE": 258,
+    "AOJN": 259,
+    "AOJG": 260,
+    "AOS": 261,
+    "AOSL": 262,
+    "AOSE": 263,
+    "AOSLE": 264,
+    "AOSA": 265,
+    "AOSGE": 266,
+    "AOSN": 267,
+    "AOSG": 268,
+    "SOJ": 269,
+    "SOJL": 270,
+    "SOJE": 271,
+    "SOJLE": 272,
+    "SOJA": 273,
+    "SOJGE": 274,
+    "SOJN": 275,
+    "SOJG": 276,
+    "SOS": 277,
+    "SOSL": 278,
+    "SOSE": 279,
+    "SOSLE": 280,
+    "SOSA": 281,
+    "SOSGE": 282,
+    "SOSN": 283,
+    "SOSG": 284,
+    "TRN": 285,
+    "TRNE": 286,
+    "TRNA": 287,
+    "TRNN": 288,
+    "TRZ": 289,
+    "TRZE": 290,
+    "TRZA": 291,
+    "TRZN": 292,
+    "TRC": 293,
+    "TRCE": 294,
+    "TRCA": 295,
+    "TRCN": 296,
+    "TRO": 297,
+    "TROE": 298,
+    "TROA": 299,
+    "TRON": 300,
+    "TLN": 301,
+    "TLNE": 302,
+    "TLNA": 303,
+    "TLNN": 304,
+    "TLZ": 305,
+    "TLZE": 306,
+    "TLZA": 307,
+    "TLZN": 308,
+    "TLC": 309,
+    "TLCE": 310,
+    "TLCA": 311,
+    "TLCN": 312,
+    "TLO": 313,
+    "TLOE": 314,
+    "TLOA": 315,
+    "TLON": 316,
+    "TDN": 317,
+    "TDNE": 318,
+    "TDNA": 319,
+    "TDNN": 320,
+    "TDZ": 321,
+    "TDZE": 322,
+    "TDZA": 323,
+    "TDZN": 324,
+    "TDC": 325,
+    "TDCE": 326,
+    "TDCA": 327,
+    "TDCN": 328,
+    "TDO": 329,
+    "TDOE": 330,
+    "TDOA": 331,
+    "TDON": 332,
+    "TSN": 333,
+    "TSNE": 334,
+    "TSNA": 335,
+    "TSNN": 336,
+    "TSZ": 337,
+    "TSZE": 338,
+    "TSZA": 339,
+    "TSZN": 340,
+    "TSC": 341,
+    "TSCE": 342,
+    "TSCA": 343,
+    "TSCN": 344,
+    "TSO": 345,
+    "TSOE": 346,
+    "TSOA": 347,
+    "TSON": 348,
+    "XCT": 349,
+    "JFFO": 350,
+    "JFCL": 351,
+    "JSR": 352,
+    "JSP": 353,
+    "JRST": 354,
+    "JSA": 355,
+    "JRA": 356,
+    "PUSHJ": 357,
+    "POPJ": 358,
+    "Z": 359,
+    "NOP": 360,
+    "JOV": 361,
+    "JCRY0": 362,
+    "JCRY1": 363,
+    "JCRY": 364,
+    "JFOV": 365,
+    "HALT": 366,
+    "JRSTF": 367,
+    "JEN": 368,
+    "CONO": 369,
+    "CONI": 370,
+    "DATAO": 371,
+    "DATAI": 372,
+    "CONSZ": 373,
+    "CONSE": 374,
+    "CONSO": 375,
+    "BLKO": 376,
+    "BLKI": 377,
+}
+
+# Shifted instruction value: instruction name.
+OPCODES = {
+    0o500000000000: "HLL",
+    0o501000000000: "HLLI",
+    0o502000000000: "HLLM",
+    0o503000000000: "HLLS",
+    0o504000000000: "HRL",
+    0o505000000000: "HRLI",
+    0o506000000000: "HRLM",
+    0o507000000000: "HRLS",
+    0o510000000000: "HLLZ",
+    0o511000000000: "HLLZI",
+    0o512000000000: "HLLZM",
+    0o513000000000: "HLLZS",
+    0o514000000000: "HRLZ",
+    0o515000000000: "HRLZI",
+    0o516000000000: "HRLZM",
+    0o517000000000: "HRLZS",
+    0o520000000000: "HLLO",
+    0o521000000000: "HLLOI",
+    0o522000000000: "HLLOM",
+    0o523000000000: "HLLOS",
+    0o524000000000: "HRLO",
+    0o525000000000: "HRLOI",
+    0o526000000000: "HRLOM",
+    0o527000000000: "HRLOS",
+    0o530000000000: "HLLE",
+    0o531000000000: "HLLEI",
+    0o532000000000: "HLLEM",
+    0o533000000000: "HLLES",
+    0o534000000000: "HRLE",
+    0o535000000000: "HRLEI",
+    0o536000000000: "HRLEM",
+    0o537000000000: "HRLES",
+    0o540000000000: "HRR",
+    0o541000000000: "HRRI",
+    0o542000000000: "HRRM",
+    0o543000000000: "HRRS",
+    0o544000000000: "HLR",
+    0o545000000000: "HLRI",
+    0o546000000000: "HLRM",
+    0o547000000000: "HLRS",
+    0o550000000000: "HRRZ",
+    0o551000000000: "HRRZI",
+    0o552000000000: "HRRZM",
+    0o553000000000: "HRRZS",
+    0o554000000000: "HLRZ",
+    0o555000000000: "HLRZI",
+    0o556000000000: "HLRZM",
+    0o557000000000: "HLRZS",
+    0o560000000000: "HRRO",
+    0o561000000000: "HRROI",
+    0o562000000000: "HRROM",
+    0o563000000000: "HRROS",
+    0o564000000000: "HLRO",
+    0o565000000000: "HLROI",
+    0o566000000000: "HLROM",
+    0o567000000000: "HLROS",
+    0o570000000000: "HRRE",
+    0o571000000000: "HRREI",
+    0o572000000000: "HRREM",
+    0o573000000000: "HRRES",
+    0o574000000000: "HLRE",
+    0o575000000000: "HLREI",
+    0o576000000000: "HLREM",
+    0o577000000000: "HLRES",
+    0o250000000000: "EXCH",
+    0o251000000000: "BLT",
+    0o200000000000: "MOVE",
+    0o201000000000: "MOVEI",
+    0o202000000000: "MOVEM",
+    0o203000000000: "MOVES",
+    0o204000000000: "MOVS",
+    0o205000000000: "MOVSI",
+    0o206000000000: "MOVSM",
+    0o207000000000: "MOVSS",
+    0o210000000000: "MOVN",
+    0o211000000000: "MOVNI",
+    0o212000000000: "MOVNM",
+    0o213000000000: "MOVNS",
+    0o214000000000: "MOVM",
+    0o215000000000: "MOVMI",
+    0o216000000000: "MOVMM",
+    0o217000000000: "MOVMS",
+    0o261000000000: "PUSH",
+    0o262000000000: "POP",
+    0o135000000000: "LDB",
+    0o137000000000: "DPB",
+    0o133000000000: "IBP",
+    0o134000000000: "ILDB",
+    0o136000000000: "IDPB",
+    0o400000000000: "SETZ",
+    0o401000000000: "SETZI",
+    0o402000000000: "SETZM",
+    0o403000000000: "SETZB",
+    0o474000000000: "SETO",
+    0o475000000000: "SETOI",
+    0o476000000000: "SETOM",
+    0o477000000000: "SETOB",
+    0o424000000000: "SETA",
+    0o425000000000: "SETAI",
+    0o426000000000: "SETAM",
+    0o427000000000: "SETAB",
+    0o450000000000: "SETCA",
+    0o451000000000: "SETCAI",
+    0o452000000000: "SETCAM",
+    0o453000000000: "SETCAB",
+    0o454000000000: "SETM",
+    0o455000000000: "SETMI",
+    0o456000000000: "SETMM",
+    0o457000000000: "SETMB",
+    0o460000000000: "SETCM",
+    0o461000000000: "SETCMI",
+    0o462000000000: "SETCMM",
+    0o463000000000: "SETCMB",
+    0o404000000000: "AND",
+    0o405000000000: "ANDI",
+    0o406000000000: "ANDM",
+    0o407000000000: "ANDB",
+    0o420000000000: "ANDCA",
+    0o411000000000: "ANDCAI",
+    0o412000000000: "ANDCAM",
+    0o413000000000: "ANDCAB",
+    0o421000000000: "ANDCMI",
+    0o422000000000: "ANDCMM",
+    0o423000000000: "ANDCMB",
+    0o440000000000: "ANDCB",
+    0o441000000000: "ANDCBI",
+    0o442000000000: "ANDCBM",
+    0o443000000000: "ANDCBB",
+    0o434000000000: "IOR",
+    0o435000000000: "IORI",
+    0o436000000000: "IORM",
+    0o437000000000: "IORB",
+    0o464000000000: "ORCM",
+    0o465000000000: "ORCMI",
+    0o466000000000: "ORCMM",
+    0o467000000000: "ORCMB",
+    0o470000000000: "ORCB",
+    0o471000000000: "ORCBI",
+    0o472000000000: "ORCBM",
+    0o473000000000: "ORCBB",
+    0o430000000000: "XOR",
+    0o431000000000: "XORI",
+    0o432000000000: "XORM",
+    0o433000000000: "XORB",
+    0o444000000000: "EQV",
+    0o242000000000: "LSH",
+    0o246000000000: "LSHC",
+    0o241000000000: "ROT",
+    0o245000000000: "ROTC",
+    0o270000000000: "ADD",
+    0o271000000000: "ADDI",
+    0o272000000000: "ADDM",
+    0o273000000000: "ADDB",
+    0o274000000000: "SUB",
+    0o275000000000: "SUBI",
+    0o276000000000: "SUBM",
+    0o277000000000: "SUBB",
+    0o220000000000: "IMUL",
+    0o221000000000: "IMULI",
+    0o222000000000: "IMULM",
+    0o223000000000: "IMULB",
+    0o224000000000: "MUL",
+    0o225000000000: "MULI",
+    0o226000000000: "MULM",
+    0o227000000000: "MULB",
+    0o230000000000: "IDIV",
+    0o231000000000: "IDIVI",
+    0o232000000000: "IDIVM",
+    0o233000000000: "IDIVB",
+    0o234000000000: "DIV",
+    0o235000000000: "DIVI",
+    0o236000000000: "DIVM",
+    0o237000000000: "DIVB",
+    0o240000000000: "ASH",
+    0o244000000000: "ASHC",
+    0o132000000000: "FSC",
+    0o144000000000: "FADAR",
+    0o145000000000: "FADARI",
+    0o146000000000: "FADARM",
+    0o147000000000: "FADARB",
+    0o154000000000: "FSBR",
+    0o155000000000: "FSBRI",
+    0o156000000000: "FSBRM",
+    0o157000000000: "FSBRB",
+    0o164000000000: "FMPR",
+    0o165000000000: "FMPRI",
+    0o166000000000: "FMPRM",
+    0o167000000000: "FMPRB",
+    0o174000000000: "FDVR",
+    0o175000000000: "FDVRI",
+    0o176000000000: "FDVRM",
+    0o177000000000: "FDVRB",
+    0o131000000000: "DFN",
+    0o130000000000: "UFA",
+    0o140000000000: "FAD",
+    0o141000000000: "FADL",
+    0o142000000000: "FADM",
+    0o143000000000: "FADB",
+    0o150000000000: "FSB",
+    0o151000000000: "FSBL",
+    0o152000000000: "FSBM",
+    0o153000000000: "FSBB",
+    0o160000000000: "FMP",
+    0o161000000000: "FMPL",
+    0o162000000000: "FMPM",
+    0o163000000000: "FMPB",
+    0o170000000000: "FDV",
+    0o171000000000: "FDVL",
+    0o172000000000: "FDVM",
+    0o173000000000: "FDVB",
+    0o252000000000: "ADBJP",
+    0o253000000000: "AOBJN",
+    0o300000000000: "CAI",
+    0o301000000000: "CAIL",
+    0o302000000000: "CAIE",
+    0o303000000000: "CAILE",
+    0o304000000000: "CAIA",
+    0o305000000000: "CAIGE",
+    0o306000000000: "CAIN",
+    0o307000000000: "CAIG",
+    0o310000000000: "CAM",
+    0o311000000000: "CAML",
+    0o312000000000: "CAME",
+    0o313000000000: "CAMLE",
+    0o314000000000: "CAMA",
+    0o315000000000: "CAMGE",
+    0o316000000000: "CAMN",
+    0o317000000000: "CAMG",
+    0o320000000000: "JUMP",
+    0o321000000000: "JUMPL",
+    0o322000000000: "JUMPE",
+    0o323000000000: "JUMPLE",
+    0o324000000000: "JUMPA",
+    0o325000000000: "JUMPGE",
+    0o326000000000: "JUMPN",
+    0o327000000000: "JUMPG",
+    0o330000000000: "SKIP",
+    0o331000000000: "SKIPL",
+    0o332000000000: "SKIPE",
+    0o333000000000: "SKIPLE",
+    0o334000000000: "SKIPA",
+    0o335000000000: "SKIPGE",
+    0o336000000000: "SKIPN",
+    0o337000000000: "SKIPG",
+    0o340000000000: "AOJ",
+    0o341000000000: "AOJL",
+    0o342000000000: "AOJE",
+    0o343000000000: "AOJLE",
+    0o344000000000: "AOJA",
+    0o345000000000: "AOJGE",
+    0o346000000000: "AOJN",
+    0o347000000000: "AOJG",
+    0o350000000000: "AOS",
+    0o351000000000: "AOSL",
+    0o352000000000: "AOSE",
+    0o353000000000: "AOSLE",
+    0o354000000000: "AOSA",
+    0o355000000000: "AOSGE",
+    0o356000000000: "AOSN",
+    0o357000000000: "AOSG",
+    0o360000000000: "SOJ",
+    0o361000000000: "SOJL",
+    0o362000000000: "SOJE",
+    0o363000000000: "SOJLE",
+    0o364000000000: "SOJA",
+    0o365000000000: "SOJGE",
+    0o366000000000: "SOJN",
+    0o367000000000: "SOJG",
+    0o370000000000: "SOS",
+    0o371000000000: "SOSL",
+    0o372000000000: "SOSE",
+    0o373000000000: "SOSLE",
+    0o374000000000: "SOSA",
+    0o375000000000: "SOSGE",
+    0o376000000000: "SOSN",
+    0o377000000000: "SOSG",
+    0o600000000000: "TRN",
+    0o602000000000: "TRNE",
+    0o604000000000: "TRNA",
+    0o606000000000: "TRNN",
+    0o620000000000: "TRZ",
+    0o622000000000: "TRZE",
+    0o624000000000: "TRZA",
+    0o626000000000: "TRZN",
+    0o640000000000: "TRC",
+    0o642000000000: "TRCE",
+    0o644000000000: "TRCA",
+    0o646000000000: "TRCN",
+    0o660000000000: "TRO",
+    0o662000000000: "TROE",
+    0o664000000000: "TROA",
+    0o666000000000: "TRON",
+    0o601000000000: "TLN",
+    0o603000000000: "TLNE",
+    0o605000000000: "TLNA",
+    0o607000000000: "TLNN",
+    0o621000000000: "TLZ",
+    0o623000000000: "TLZE",
+    0o625000000000: "TLZA",
+    0o627000000000: "TLZN",
+    0o641000000000: "TLC",
+    0o643000000000: "TLCE",
+    0o645000000000: "TLCA",
+    0o647000000000: "TLCN",
+    0o661000000000: "TLO",
+    0o663000000000: "TLOE",
+    0o665000000000: "TLOA",
+    0o667000000000: "TLON",
+    0o610000000000: "TDN",
+    0o612000000000: "TDNE",
+    0o614000000000: "TDNA",
+    0o616000000000: "TDNN",
+    0o630000000000: "TDZ",
+    0o632000000000: "TDZE",
+    0o634000000000: "TDZA",
+    0o636000000000: "TDZN",
+    0o650000000000: "TDC",
+    0o652000000000: "TDCE",
+    0o654000000000: "TDCA",
+    0o656000000000: "TDCN",
+    0o670000000000: "TDO",
+    0o672000000000: "TDOE",
+    0o674000000000: "TDOA",
+    0o676000000000: "TDON",
+    0o611000000000: "TSN",
+    0o613000000000: "TSNE",
+    0o615000000000: "TSNA",
+    0o617000000000: "TSNN",
+    0o631000000000: "TSZ",
+    0o633000000000: "TSZE",
+    0o635000000000: "TSZA",
+    0o637000000000: "TSZN",
+    0o651000000000: "TSC",
+    0o653000000000: "TSCE",
+    0o655000000000: "TSCA",
+    0o657000000000: "TSCN",
+    0o671000000000: "TSO",
+    0o673000000000: "TSOE",
+    0o675000000000: "TSOA",
+    0o677000000000: "TSON",
+    0o256000000000: "XCT",
+    0o243000000000: "JFFO",
+    0o255000000000: "JFCL",
+    0o264000000000: "JSR",
+    0o265000000000: "JSP",
+    0o254000000000: "JRST",
+    0o266000000000: "JSA",
+    0o267000000000: "JRA",
+    0o260000000000: "PUSHJ",
+    0o263000000000: "POPJ",
+    0o0: "Z",
+    0o255400000000: "JOV",
+    0o255200000000: "JCRY0",
+    0o255100000000: "JCRY1",
+    0o255300000000: "JCRY",
+    0o255040000000: "JFOV",
+    0o254200000000: "HALT",
+    0o254100000000: "JRSTF",
+    0o254500000000: "JEN",
+    0o700200000000: "CONO",
+    0o700240000000: "CONI",
+    0o700140000000: "DATAO",
+    0o700040000000: "DATAI",
+    0o700300000000: "CONSZ",
+    0o700340000000: "CONSO",
+    0o100100000000: "BLKO",
+    0o700000000000: "BLKI",
+}
@@ -0,0 +1,227 @@
+"""Caches of parsed source lines."""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+from .source_line import SourceLine
+
+# Modules whose code decides how a line is parsed. Cached chunks are keyed by
+# a hash of their source, so chunks parsed by other versions are not used.
+PARSER_MODULES = (
+    "pdp10asm.characters",
+    "pdp10asm.constants",
+    "pdp10asm.expressions",
+    "pdp10asm.pseudo_operators.pseudo_operators",
+    "pdp10asm.pseudo_operators.pseudo_ops",
+    "pdp10asm.source_line",
+)
+
+
+class ParseCache:
+    """
+    Bounded least recently used cache of parsed instruction text.
+
+    Keys are the instruction text of a line, with its labels and comment
+    removed, and values are the fields set on a SourceLine by parsing it.
+    """
+
+    name = "Parse cache"
+    default_maxsize = 4096
+
+    def __init__(self, maxsize=None):
+        """
+        Bounded least recently used cache of parsed instruction text.
+
+        Kwargs:
+            maxsize (int): The number of entries to keep.
+        """
+        self.maxsize = self.default_maxsize if maxsize is None else maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """Return the fields cached for key or None if they are not cached."""
+        try:
+            fields = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return fields
+
+    def add(self, key, fields):
+        """Cache fields for key, evicting the least recently used entry if full."""
+        if self.maxsize < 1:
+            return
+        self.entries[key] = fields
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def record(self, hits, misses):
+        """Add hits and misses counted elsewhere, such as in a worker process."""
+        self.hits += hits
+        self.misses += misses
+
+    @property
+    def lookups(self):
+        """Return the number of times the cache has been searched."""
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self):
+        """Return the proportion of lookups that were found in the cache."""
+        if self.lookups == 0:
+            return 0.0
+        return self.hits / self.lookups
+
+    def summary(self):
+        """Return a description of the cache's hit ratio."""
+        return (
+            f"{self.name}: {self.hits} hits, {self.misses} misses "
+            f"({self.hit_ratio:.1%} hit ratio)."
+        )
+
+
+class ParseCacheDirectory:
+    """
+    Directory of parsed source chunks stored on disk.
+
+    Each chunk of source is stored in a file named by a hash of its text, so
+    unchanged chunks of a file can be loaded instead of parsed when it is
+    assembled again. Files hold the fields of each parsed line that differ
+    from a new SourceLine as compressed JSON, so loading a file never runs
+    code from it. Hashes include the source of the parser, so chunks are
+    parsed again whenever the parser changes.
+    """
+
+    format_version = 2
+    suffix = ".parse"
+
+    fields = tuple(
+        name
+        for name in SourceLine.__slots__
+        if name not in ("assembler", "text", "source_line_number", "_assembled_line")
+    )
+
+    def __init__(self, path, symbol_table):
+        """
+        Directory of parsed source chunks stored on disk.
+
+        Args:
+            path (str or Path): The cache directory, created if it does not exist.
+            symbol_table (SymbolTable): The symbol table used to parse lines.
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.salt = self._salt(symbol_table)
+        initial = SourceLine(assembler=None, source_line_number=None, text=None)
+        self.initial_values = {name: getattr(initial, name) for name in self.fields}
+
+    def _salt(self, symbol_table):
+        salt = hashlib.sha256()
+        salt.update(repr((self.format_version, self.fields)).encode())
+        salt.update(parser_source_hash())
+        salt.update(repr(sorted(symbol_table.instruction_ids.items())).encode())
+        return salt.digest()
+
+    def key(self, lines):
+        """Return the cache key for a chunk of lines."""
+        key = hashlib.sha256(self.salt)
+        for line in lines:
+            key.update(line.encode())
+            key.update(b"\n")
+        return key.hexdigest()
+
+    def key_path(self, key):
+        """Return the path of the file for key."""
+        return self.path / f"{key}{self.suffix}"
+
+    def load(self, key, lines, first_line_number, assembler):
+        """
+        Return the cached SourceLine instances for a chunk of lines.
+
+        Returns None if the chunk is not cached or its file cannot be read.
+        """
+        try:
+            with open(self.key_path(key), "rb") as f:
+                records = json.loads(zlib.decompress(f.read()))
+        except (OSError, ValueError, zlib.error):
+            self.misses += 1
+            return None
+        if not self._is_valid(records, lines):
+            self.misses += 1
+            return None
+        self.hits += 1
+        source_lines = []
+        for source_line_number, (text, record) in enumerate(
+            zip(lines, records, strict=True), first_line_number
+        ):
+            source_line = SourceLine(
+                assembler=assembler, source_line_number=source_line_number, text=text
+            )
+            for name, value in record.items():
+                if name == "labels":
+                    value = tuple(value)
+                setattr(source_line, name, value)
+            source_lines.append(source_line)
+        return source_lines
+
+    def _is_valid(self, records, lines):
+        """Return True if records are the fields of a parsed line for each line."""
+        return (
+            isinstance(records, list)
+            and len(records) == len(lines)
+            and all(
+                isinstance(record, dict) and self.initial_values.keys() >= record.keys()
+                for record in records
+            )
+        )
+
+    def store(self, key, source_lines):
+        """Write the parsed fields of source_lines to the file for key."""
+        initial_values = self.initial_values
+        records = [
+            {
+                name: getattr(source_line, name)
+                for name in self.fields
+                if getattr(source_line, name) != initial_values[name]
+            }
+            for source_line in source_lines
+        ]
+        data = zlib.compress(json.dumps(records, separators=(",", ":")).encode())
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.path, suffix=".tmp", delete=False
+        ) as f:
+            f.write(data)
+        os.replace(f.name, self.key_path(key))
+
+    def summary(self):
+        """Return a description of the chunks loaded from the directory."""
+        return (
+            f"Parse cache directory: {self.hits} chunks loaded, "
+            f"{self.misses} chunks parsed."
+        )
+
+
+@lru_cache(maxsize=None)
+def parser_source_hash():
+    """Return a hash of the source of the modules that parse lines."""
+    source_hash = hashlib.sha256()
+    for name in PARSER_MODULES:
+        source_hash.update(Path(sys.modules[name].__file__).read_bytes())
+    return source_hash.digest()
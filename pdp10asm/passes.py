@@ -3,6 +3,7 @@
 from pdp10asm.characters import Characters
 from pdp10asm.pseudo_operators import PseudoOperators
 
+from .assignments import AssignmentGraph, DeferredAssignment
 from .constants import Constants
 from .exceptions import AssemblyError
 from .expressions import ExpressionParser
@@ -11,6 +12,8 @@ from .expressions import ExpressionParser
 class BaseAssemblerPass:
     """Base class for assembler passes."""
 
+    name = "assembly"
+
     def __init__(self, assembler):
         """
         Base class for assembler passes.
@@ -25,18 +28,36 @@ class BaseAssemblerPass:
         self.source_line_number = 0
         self.current_line = ""
         self.current_line_comment = ""
+        self.constants = None
+        self.constants_radix = None
         self.done = False
 
     def run(self):
         """Run the assembly pass."""
         for source_line in self.assembler.program.source_lines:
-            self.source_line_number = source_line.source_line_number
-            self.current_line = source_line.text.strip()
-            if self.done is True:
+            if self.run_line(source_line) is False:
                 return
-            if source_line.is_empty:
-                continue
-            self.process_line(source_line)
+
+    def run_line(self, source_line):
+        """Process a source line, returning False if the pass is already done."""
+        self.source_line_number = source_line.source_line_number
+        self.current_line = source_line.text.strip()
+        self.constants = source_line.constants
+        self.constants_radix = source_line.constants_radix
+        if self.done is True:
+            return False
+        if not source_line.is_empty:
+            program_counter = self.program_counter
+            try:
+                self.process_line(source_line)
+            except AssemblyError as e:
+                if self.assembler.collect_errors is not True:
+                    raise
+                self.assembler.add_diagnostic(self.name, source_line, e)
+                self.program_counter = (
+                    program_counter + source_line.memory_location_count
+                )
+        return True
 
     def process_line(self, words):
         """Process a line of assembly."""
@@ -53,16 +74,86 @@ class BaseAssemblerPass:
 
     def literal_value(self, text):
         """Parse text and return as a literal value."""
-        return ExpressionParser(text, self.assembler).as_literal()
+        value = self.operand_value(text)
+        ExpressionParser.validate_word(value)
+        return value
 
     def twos_complement_value(self, text):
         """Parse text and return as a two's complement value."""
-        return ExpressionParser(text, self.assembler).as_twos_complement()
+        value = self.operand_value(text)
+        value = ExpressionParser.to_twos_complement(value)
+        ExpressionParser.validate_word(value)
+        return value
+
+    def operand_value(self, text):
+        """
+        Return the value of text, only evaluating it as an expression if necessary.
+
+        Constants folded when the line was parsed, defined symbols and the
+        program counter are used directly.
+        """
+        value = self.constant_value(text)
+        if value is None:
+            value = self.trivial_value(text)
+            if value is None:
+                value = self.expression_value(text)
+        return value
+
+    def trivial_value(self, text):
+        """
+        Return the value of text if it is a defined symbol or the program counter.
+
+        Returns None for any other text.
+        """
+        if text == Constants.PROGRAM_COUNTER_OPERAND:
+            return self.program_counter
+        return self.symbol_table.find_symbol_value(text)
+
+    def expression_value(self, text):
+        """Return the value of expression text, using the expression cache."""
+        expression_cache = self.assembler.expression_cache
+        if expression_cache is None:
+            return ExpressionParser(text, self.assembler).value
+        return expression_cache.value(text, self.assembler)
+
+    def constant_value(self, text):
+        """
+        Return the value of text folded when the current line was parsed.
+
+        Returns None if text was not folded or the line was folded with a
+        different radix to the one now in effect.
+        """
+        if self.constants is None:
+            return None
+        radix = self.constants_radix
+        if radix is not None and radix != self.assembler.radix:
+            return None
+        return self.constants.get(text)
 
 
 class FirstPassAssembler(BaseAssemblerPass):
     """Class for performing first pass assembly."""
 
+    name = "first pass"
+
+    def __init__(self, assembler):
+        """
+        Class for performing first pass assembly.
+
+        Assignments that refer to symbols which are not yet defined are
+        deferred until those symbols are defined.
+
+        Kwargs:
+            assembler (PDP10Assembler): The parent assembler.
+        """
+        super().__init__(assembler)
+        self.assignments = AssignmentGraph()
+
+    def run(self):
+        """Run the assembly pass."""
+        super().run()
+        self.check_assignments()
+
     def process_line(self, source_line):
         """Process a line of source."""
         if source_line.is_pseudo_operator:
@@ -85,31 +176,143 @@ class FirstPassAssembler(BaseAssemblerPass):
             self.add_label(label, source_line.source_line_number)
 
     def handle_assignments(self, source_line):
-        """Add symbols for an assignment."""
+        """Add symbols for an assignment, deferring it if it uses undefined symbols."""
         if not source_line.is_assignment:
             return
-        value = self.twos_complement_value(source_line.assignment_value)
-        self.symbol_table.add_user_symbol(
-            symbol=source_line.assignment_symbol,
-            value=value,
-            source_line=source_line.source_line_number,
+        try:
+            value = self.twos_complement_value(source_line.assignment_value)
+        except AssemblyError:
+            dependencies = self.undefined_symbols(source_line.assignment_value)
+            if not dependencies:
+                raise
+            self.defer_assignment(source_line, dependencies)
+            return
+        self.define_symbol(
+            source_line.assignment_symbol, value, source_line.source_line_number
         )
 
     def add_label(self, label_text, source_line_number):
         """Add a label to the symbol table."""
+        self.define_symbol(label_text, self.program_counter, source_line_number)
+
+    def define_symbol(self, symbol, value, source_line_number):
+        """Add a user symbol and resolve the assignments waiting for it."""
         self.symbol_table.add_user_symbol(
-            symbol=label_text,
-            value=self.program_counter,
-            source_line=source_line_number,
+            symbol=symbol, value=value, source_line=source_line_number
+        )
+        if self.assignments.pending:
+            self.assignments.discard(symbol)
+            self.resolve_assignments(symbol)
+
+    def undefined_symbols(self, text):
+        """Return the symbols in expression text that are not defined."""
+        return tuple(
+            symbol
+            for symbol in ExpressionParser.references(text)[0]
+            if not self.symbol_table.is_defined(symbol)
+        )
+
+    def defer_assignment(self, source_line, dependencies):
+        """
+        Defer an assignment until the symbols it depends on are defined.
+
+        Any earlier value of a user symbol being assigned is removed, as the
+        symbol's value is unknown until the assignment is resolved.
+        """
+        if self.symbol_table.is_user_symbol(source_line.assignment_symbol):
+            self.symbol_table.delete_symbol(source_line.assignment_symbol)
+        self.assignments.defer(
+            DeferredAssignment(
+                source_line=source_line,
+                radix=self.assembler.radix,
+                program_counter=self.program_counter,
+                dependencies=dependencies,
+            )
         )
 
+    def resolve_assignments(self, symbol):
+        """Evaluate the deferred assignments waiting for symbol to be defined."""
+        symbols = [symbol]
+        while symbols:
+            for assignment in self.assignments.waiting_for(symbols.pop()):
+                value = self.deferred_value(assignment)
+                if value is not None:
+                    self.symbol_table.add_user_symbol(
+                        symbol=assignment.symbol,
+                        value=value,
+                        source_line=assignment.source_line.source_line_number,
+                    )
+                    symbols.append(assignment.symbol)
+
+    def deferred_value(self, assignment):
+        """
+        Return the value of a deferred assignment.
+
+        The value is found with the radix and program counter in effect at the
+        assignment. Returns None if the assignment is deferred again because it
+        depends on other undefined symbols, or if its value is invalid.
+        """
+        text = assignment.source_line.assignment_value
+        dependencies = self.undefined_symbols(text)
+        if dependencies:
+            assignment.dependencies = dependencies
+            self.assignments.defer(assignment)
+            return None
+        radix, program_counter = self.assembler.radix, self.program_counter
+        self.assembler.radix = assignment.radix
+        self.program_counter = assignment.program_counter
+        try:
+            return self.twos_complement_value(text)
+        except AssemblyError as e:
+            self.assignment_error(assignment, e)
+            return None
+        finally:
+            self.assembler.radix, self.program_counter = radix, program_counter
+
+    def check_assignments(self):
+        """Raise an error for each deferred assignment that was not resolved."""
+        cycles = self.assignments.cycles()
+        for assignment in self.assignments.unresolved():
+            cycle = cycles.get(assignment.symbol)
+            if cycle is None:
+                error = AssemblyError(
+                    f"Symbol {assignment.dependencies[0]!r} is not defined."
+                )
+            else:
+                error = AssemblyError(f"Circular assignment {' -> '.join(cycle)}.")
+            self.assignment_error(assignment, error)
+
+    def assignment_error(self, assignment, error):
+        """Raise error for a deferred assignment, or add it to the diagnostics."""
+        source_line = assignment.source_line
+        if self.assembler.collect_errors is True:
+            self.assembler.add_diagnostic(self.name, source_line, error)
+            return
+        self.source_line_number = source_line.source_line_number
+        self.current_line = source_line.text.strip()
+        raise error
+
 
 class SecondPassAssembler(BaseAssemblerPass):
     """Class for performing first pass assembly."""
 
+    name = "second pass"
+
+    accumulator_fields = {value: value << 23 for value in range(0o20)}
+    index_register_fields = {value: value << 18 for value in range(0o20)}
+    device_id_fields = {value: value << 24 for value in range(0, 0o775, 4)}
+
+    def run_line(self, source_line):
+        """Process a source line, adding the symbols it refers to as references."""
+        cross_references = self.symbol_table.cross_references
+        if cross_references is not None:
+            cross_references.set_line(source_line.source_line_number)
+        return super().run_line(source_line)
+
     def process_line(self, source_line):
         """Process a line of source."""
         if source_line.is_assignment is True:
+            self.add_assignment_references(source_line)
             return
         elif source_line.is_pseudo_operator is True:
             self.handle_pseudo_operator(source_line)
@@ -120,6 +323,15 @@ class SecondPassAssembler(BaseAssemblerPass):
                 source_line=source_line, binary_values=[instruction_word]
             )
 
+    def add_assignment_references(self, source_line):
+        """Add the symbols referred to by an assignment evaluated by the first pass."""
+        cross_references = self.symbol_table.cross_references
+        if cross_references is None:
+            return
+        for symbol in ExpressionParser.references(source_line.assignment_value)[0]:
+            if self.symbol_table.is_defined(symbol):
+                cross_references.add(symbol)
+
     def add_instructions(self, source_line, binary_values):
         """Add lines to the program."""
         for value in binary_values:
@@ -136,7 +348,7 @@ class SecondPassAssembler(BaseAssemblerPass):
             if source_line.is_text_word is True:
                 return Characters.text_word_value(source_line.value)
             return self.twos_complement_value(source_line.value)
-        operator_binary = self.symbol_value(source_line.operator)
+        instruction_value = self.instruction_value(source_line)
         if source_line.is_primary_instruction is True:
             operand = self.primary_operand_value(
                 memory_address=source_line.memory_address,
@@ -153,7 +365,21 @@ class SecondPassAssembler(BaseAssemblerPass):
             )
         else:
             raise AssemblyError(f"Unable to parse line {source_line.text!r}")
-        return operator_binary | operand
+        return instruction_value | operand
+
+    def instruction_value(self, source_line):
+        """
+        Return the value of the operator of an instruction line.
+
+        The instruction found when the line was parsed is used unless its
+        operator has since been redefined, when the operator's current value
+        is used instead.
+        """
+        operator_id = source_line.operator_id
+        if self.symbol_table.instruction_id(source_line.operator) == operator_id:
+            _, instruction_value = self.symbol_table.instructions[operator_id]
+            return instruction_value
+        return self.symbol_value(source_line.operator)
 
     def handle_pseudo_operator(self, source_line):
         """Execute an assembler instruction."""
@@ -190,8 +416,11 @@ class SecondPassAssembler(BaseAssemblerPass):
         if accumulator is None:
             return 0
         accumulator_value = self.literal_value(accumulator)
-        self.validate_accumulator_value(accumulator_value)
-        return accumulator_value << 23
+        field = self.accumulator_fields.get(accumulator_value)
+        if field is None:
+            self.validate_accumulator_value(accumulator_value)
+            return accumulator_value << 23
+        return field
 
     def validate_accumulator_value(self, value):
         """Raise and exception if value is not a valid accumulator id."""
@@ -214,8 +443,11 @@ class SecondPassAssembler(BaseAssemblerPass):
         if index_register is None:
             return 0
         index_register_value = self.literal_value(index_register)
-        self.validate_index_register_value(index_register_value)
-        return index_register_value << 18
+        field = self.index_register_fields.get(index_register_value)
+        if field is None:
+            self.validate_index_register_value(index_register_value)
+            return index_register_value << 18
+        return field
 
     def validate_index_register_value(self, value):
         """Raise AssemblyError if index register is not valid."""
@@ -227,8 +459,11 @@ class SecondPassAssembler(BaseAssemblerPass):
         if device_id is None:
             return 0
         device_id_value = self.literal_value(device_id)
-        self.validate_device_id(device_id_value)
-        return device_id_value << 24
+        field = self.device_id_fields.get(device_id_value)
+        if field is None:
+            self.validate_device_id(device_id_value)
+            return device_id_value << 24
+        return field
 
     def validate_device_id(self, value):
         """Raise AssemblyError if value is not a valid device ID."""
@@ -2,18 +2,52 @@
 
 from pdp10asm.listing import BinaryListing
 
+from .cross_references import CrossReferences
 from .exceptions import AssemblyError
+from .symbol_table import UserSymbolIndex
 
 
 class AssembledLine:
     """Class for assembled lines of code."""
 
+    __slots__ = ("source_line", "memory_location", "binary_value")
+
     def __init__(self, source_line, memory_location, binary_value):
         """Class for assembled lines of code."""
         self.source_line = source_line
-        source_line.assembled_line = self
         self.memory_location = memory_location
         self.binary_value = binary_value
+        source_line.assembled_line = self
+
+
+class Diagnostic:
+    """Class for errors found in a line of source during assembly."""
+
+    __slots__ = ("source_line_number", "pass_name", "message", "text")
+
+    def __init__(self, source_line_number, pass_name, message, text):
+        """
+        Class for errors found in a line of source during assembly.
+
+        Args:
+            source_line_number (int): The line number of the line.
+            pass_name (str): The stage of assembly that found the error.
+            message (str): A description of the error.
+            text (str): The text of the line.
+        """
+        self.source_line_number = source_line_number
+        self.pass_name = pass_name
+        self.message = message
+        self.text = text
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.source_line_number}>"
+
+    def __str__(self):
+        return (
+            f"During {self.pass_name} on line {self.source_line_number}:\n"
+            f"{self.text!r}\n{self.message}"
+        )
 
 
 class Program:
@@ -27,6 +61,9 @@ class Program:
         self.source_lines = []
         self.by_memory_location = {}
         self.symbols = {}
+        self.symbol_index = UserSymbolIndex()
+        self.cross_references = CrossReferences()
+        self.diagnostics = []
 
     def add_line(self, source_line, memory_location, binary_value):
         """Add a line to the program."""
@@ -49,8 +86,27 @@ class Program:
         self.by_memory_location[memory_location] = assembled_line
         return assembled_line
 
-    def listing_text(self, listing_class=None, radix=8):
+    def set_symbols(self, symbol_table):
+        """Set the program's symbols to the user symbols in symbol_table."""
+        self.symbol_index = symbol_table.user_symbol_index.copy()
+        self.symbols = list(self.symbol_index)
+
+    def symbols_by_name(self):
+        """Return the program's symbols sorted by name."""
+        return self.symbol_index.by_name()
+
+    def symbols_by_value(self):
+        """Return the program's symbols sorted by value."""
+        return self.symbol_index.by_value()
+
+    def references(self, symbol):
+        """Return an array of the source lines that refer to symbol, in order."""
+        return self.cross_references.references(symbol)
+
+    def listing_text(self, listing_class=None, radix=8, symbol_order="defined"):
         """Return a program listing as a string."""
         if listing_class is None:
             listing_class = BinaryListing
-        return listing_class(self, radix=radix).listing_text()
+        return listing_class(
+            self, radix=radix, symbol_order=symbol_order
+        ).listing_text()
@@ -2,7 +2,7 @@
 
 from pdp10asm.characters import Characters
 from pdp10asm.exceptions import AssemblyError
-from pdp10asm.expressions import ExpressionParser
+from pdp10asm.expressions import ExpressionListParser, ExpressionParser
 
 
 class PseudoOp:
@@ -107,10 +107,9 @@ class Exp(PseudoOp):
     @classmethod
     def process(cls, assembler, source_line):
         """Add literals."""
-        values = [
-            ExpressionParser(value, assembler, radix=None).as_twos_complement()
-            for value in source_line.arguments.split(",")
-        ]
+        values = ExpressionListParser(
+            source_line.arguments, assembler, radix=None
+        ).as_twos_complement()
         assembler.current_pass.add_instructions(
             source_line=source_line, binary_values=values
         )
@@ -118,7 +117,7 @@ class Exp(PseudoOp):
     @classmethod
     def source_line_process(cls, source_line):
         """Update source line properties."""
-        source_line.memory_location_count = len(source_line.arguments.split(","))
+        source_line.memory_location_count = source_line.arguments.count(",") + 1
 
 
 class Dec(PseudoOp):
@@ -131,10 +130,9 @@ class Dec(PseudoOp):
     @classmethod
     def process(cls, assembler, source_line):
         """Add decimal literals."""
-        values = [
-            ExpressionParser(value, assembler, radix=10).as_twos_complement()
-            for value in source_line.arguments.split(",")
-        ]
+        values = ExpressionListParser(
+            source_line.arguments, assembler, radix=10
+        ).as_twos_complement()
         assembler.current_pass.add_instructions(
             source_line=source_line, binary_values=values
         )
@@ -142,7 +140,7 @@ class Dec(PseudoOp):
     @classmethod
     def source_line_process(cls, source_line):
         """Update source line properties."""
-        source_line.memory_location_count = len(source_line.arguments.split(","))
+        source_line.memory_location_count = source_line.arguments.count(",") + 1
 
 
 class Oct(PseudoOp):
@@ -155,10 +153,9 @@ class Oct(PseudoOp):
     @classmethod
     def process(cls, assembler, source_line):
         """Add decimal literals."""
-        values = [
-            ExpressionParser(value, assembler, radix=8).as_twos_complement()
-            for value in source_line.arguments.split(",")
-        ]
+        values = ExpressionListParser(
+            source_line.arguments, assembler, radix=8
+        ).as_twos_complement()
         assembler.current_pass.add_instructions(
             source_line=source_line, binary_values=values
         )
@@ -166,7 +163,7 @@ class Oct(PseudoOp):
     @classmethod
     def source_line_process(cls, source_line):
         """Update source line properties."""
-        source_line.memory_location_count = len(source_line.arguments.split(","))
+        source_line.memory_location_count = source_line.arguments.count(",") + 1
 
 
 class Byte(PseudoOp):
@@ -179,11 +176,8 @@ class Byte(PseudoOp):
     @classmethod
     def process(cls, assembler, source_line):
         """Add bytes of n length."""
-        length, arguments = cls.parse(source_line.arguments)
-        values = [
-            ExpressionParser(argument, assembler).as_twos_complement()
-            for argument in arguments
-        ]
+        length, values_text = cls.parse(source_line.arguments)
+        values = ExpressionListParser(values_text, assembler).as_twos_complement()
         binary_values = cls.get_binary_values(length, values)
         assembler.current_pass.add_instructions(
             source_line=source_line, binary_values=binary_values
@@ -207,8 +201,10 @@ class Byte(PseudoOp):
     @classmethod
     def source_line_process(cls, source_line):
         """Update source line properties."""
-        length, values = cls.parse(source_line.arguments)
-        source_line.memory_location_count = cls.word_count(length, len(values))
+        length, values_text = cls.parse(source_line.arguments)
+        source_line.memory_location_count = cls.word_count(
+            length, values_text.count(",") + 1
+        )
 
     @classmethod
     def word_count(cls, length, values):
@@ -220,10 +216,9 @@ class Byte(PseudoOp):
 
     @classmethod
     def parse(cls, text):
-        """Return byte length and values strings."""
+        """Return byte length and the comma separated values text."""
         if text[0] == "(" and ")" in text:
             length_text, values = text[1:].split(")")
-            values = [_.strip() for _ in values.split(",")]
             try:
                 length = int(length_text)
             except ValueError:
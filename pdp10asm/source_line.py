@@ -1,21 +1,92 @@
 """The SourceLine class."""
 
+import re
+
 from pdp10asm.pseudo_operators import PseudoOperators
 
 from .constants import Constants
 from .exceptions import AssemblyError
+from .expressions import ExpressionParser
 from .program import AssembledLine
+from .symbol_table import SymbolKind
+
+LINE_PATTERN = re.compile(
+    rf"""
+    \s*
+    (?P<labels>(?:[^{Constants.LABEL}{Constants.COMMENT}]*{Constants.LABEL})*)
+    \s*
+    (?P<instruction>
+        (?P<operator>[^\s{Constants.COMMENT}]+)
+        (?:\s+(?P<operand>[^\s{Constants.COMMENT}][^{Constants.COMMENT}]*?))?
+    )?
+    \s*
+    (?:{Constants.COMMENT}\s*(?P<comment>.*?)\s*)?
+    $
+    """,
+    re.VERBOSE | re.DOTALL,
+)
 
 
 class SourceLine:
     """Class for parsing source lines."""
 
+    __slots__ = (
+        "assembler",
+        "text",
+        "source_line_number",
+        "memory_location_count",
+        "is_pseudo_operator",
+        "is_assignment",
+        "is_instruction",
+        "is_primary_instruction",
+        "is_io_instruction",
+        "is_value",
+        "is_text_word",
+        "is_empty",
+        "comment",
+        "instruction_text",
+        "labels",
+        "operator",
+        "operator_id",
+        "assignment_symbol",
+        "assignment_value",
+        "accumulator",
+        "index_register",
+        "is_indirect",
+        "memory_address",
+        "device_id",
+        "arguments",
+        "value",
+        "constants",
+        "constants_radix",
+        "_assembled_line",
+    )
+
+    parsed_fields = (
+        "memory_location_count",
+        "is_pseudo_operator",
+        "is_instruction",
+        "is_primary_instruction",
+        "is_io_instruction",
+        "is_value",
+        "operator",
+        "operator_id",
+        "value",
+        "arguments",
+        "accumulator",
+        "device_id",
+        "index_register",
+        "memory_address",
+        "is_indirect",
+        "constants",
+        "constants_radix",
+    )
+
     def __init__(self, assembler, source_line_number, text):
         """Class for parsing source lines."""
         self.assembler = assembler
         self.text = text
         self.source_line_number = source_line_number
-        self.source_text = None
         self.memory_location_count = 0
         self.is_pseudo_operator = False
         self.is_assignment = False
@@ -27,11 +98,11 @@ class SourceLine:
         self.is_empty = True
         self.comment = None
         self.instruction_text = None
-        self.labels = []
+        self.labels = ()
         self.operator = None
+        self.operator_id = 0
         self.assignment_symbol = None
         self.assignment_value = None
-        self.operand = None
         self.accumulator = None
         self.index_register = None
         self.is_indirect = False
@@ -39,19 +110,95 @@ class SourceLine:
         self.device_id = None
         self.arguments = None
         self.value = None
-        self.assembled_line = AssembledLine(self, None, None)
+        self.constants = None
+        self.constants_radix = None
+        self._assembled_line = None
+
+    def __getstate__(self):
+        """Return the line's state without the assembler so it can be pickled."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["assembler"] = None
+        return None, state
+
+    def copy(self, source_line_number):
+        """Return an unassembled copy of the line, numbered source_line_number."""
+        source_line = SourceLine.__new__(SourceLine)
+        source_line.assembler = self.assembler
+        source_line.text = self.text
+        source_line.source_line_number = source_line_number
+        source_line.memory_location_count = self.memory_location_count
+        source_line.is_pseudo_operator = self.is_pseudo_operator
+        source_line.is_assignment = self.is_assignment
+        source_line.is_instruction = self.is_instruction
+        source_line.is_primary_instruction = self.is_primary_instruction
+        source_line.is_io_instruction = self.is_io_instruction
+        source_line.is_value = self.is_value
+        source_line.is_text_word = self.is_text_word
+        source_line.is_empty = self.is_empty
+        source_line.comment = self.comment
+        source_line.instruction_text = self.instruction_text
+        source_line.labels = self.labels
+        source_line.operator = self.operator
+        source_line.operator_id = self.operator_id
+        source_line.assignment_symbol = self.assignment_symbol
+        source_line.assignment_value = self.assignment_value
+        source_line.accumulator = self.accumulator
+        source_line.index_register = self.index_register
+        source_line.is_indirect = self.is_indirect
+        source_line.memory_address = self.memory_address
+        source_line.device_id = self.device_id
+        source_line.arguments = self.arguments
+        source_line.value = self.value
+        source_line.constants = self.constants
+        source_line.constants_radix = self.constants_radix
+        source_line._assembled_line = None
+        return source_line
+
+    @property
+    def assembled_line(self):
+        """
+        Return the AssembledLine created from this line.
+
+        Lines that have not been assembled get a placeholder with no memory
+        location or binary value, created the first time it is asked for.
+        """
+        if self._assembled_line is None:
+            AssembledLine(self, None, None)
+        return self._assembled_line
+
+    @assembled_line.setter
+    def assembled_line(self, assembled_line):
+        self._assembled_line = assembled_line
 
     def read_text(self):
         """Parse self.text."""
-        text = self.text
-        text = self._read_comment(text)
-        text = self._read_labels(text)
-        text = self._read_assignment(text)
-        if self.is_assignment is True:
+        text = self._read_fields(self.text)
+        if self.is_assignment is True or self.operator is None:
             return
-        text = self._read_operator(text)
-        if self.operator is None:
+        parse_cache = self.assembler.parse_cache
+        if parse_cache is None:
+            self._read_instruction(text)
             return
+        fields = parse_cache.get(self.instruction_text)
+        if fields is None:
+            initial_values = self._parsed_field_values()
+            self._read_instruction(text)
+            parse_cache.add(
+                self.instruction_text,
+                tuple(
+                    field
+                    for field in self._parsed_field_values()
+                    if field not in initial_values
+                ),
+            )
+        else:
+            for name, value in fields:
+                setattr(self, name, value)
+
+    def _parsed_field_values(self):
+        return tuple((name, getattr(self, name)) for name in self.parsed_fields)
+
+    def _read_instruction(self, text):
         self._parse_instruction_type(text)
         try:
             self._parse_arguments(text)
@@ -62,6 +209,28 @@ class SourceLine:
         if self.is_pseudo_operator:
             operator = PseudoOperators.get_pseudo_op(self.operator)
             operator.source_line_process(self)
+        elif self.is_text_word is False:
+            self._fold_constants(
+                (
+                    self.accumulator,
+                    self.index_register,
+                    self.memory_address,
+                    self.device_id,
+                    self.value,
+                )
+            )
+
+    def _fold_constants(self, texts):
+        """Set the values of the constant expressions in texts by text."""
+        constants = {}
+        for text in texts:
+            if text is not None and text not in constants:
+                constant = ExpressionParser.constant(text, self.assembler)
+                if constant is not None:
+                    constants[text], radix = constant
+                    if radix is not None:
+                        self.constants_radix = radix
+        self.constants = constants or None
 
     @staticmethod
     def parse_address(text):
@@ -97,59 +266,49 @@ class SourceLine:
             memory_address = text
         return accumulator, index_register, memory_address, is_indirect
 
-    def _read_comment(self, text):
-        if Constants.COMMENT in text:
-            text, comment = text.split(Constants.COMMENT, maxsplit=1)
-            self.comment = comment.strip()
-        text = text.strip()
-        if len(text) > 0:
-            self.is_empty = False
-        return text
+    def _read_fields(self, text):
+        """Split text into its fields with a single match and return the operand."""
+        match = LINE_PATTERN.match(text)
+        labels, instruction, operator, operand, comment = match.group(
+            "labels", "instruction", "operator", "operand", "comment"
+        )
+        self.comment = comment
+        if labels:
+            self._read_labels(labels)
+        if instruction is None:
+            self.is_empty = not labels
+            return ""
+        self.is_empty = False
+        self.instruction_text = instruction
+        if Constants.ASSIGNMENT_OPERATOR in operator:
+            self._read_assignment(instruction)
+        elif instruction[0] in Constants.TEXT_WORD_DELIMITERS:
+            self.is_text_word = True
+            self.is_value = True
+            self.operator = instruction
+        else:
+            self.operator = operator
+            return operand or ""
+        return ""
 
     def _read_labels(self, text):
-        while Constants.LABEL in text:
-            label, text = text.split(Constants.LABEL, maxsplit=1)
-            label = label.strip()
-            if not Constants.is_symbol(label):
+        labels = [label.strip() for label in text.split(Constants.LABEL)[:-1]]
+        for label in labels:
+            if not label or not Constants.is_symbol(label):
                 raise AssemblyError(f"Invalid label {label!r}.")
-            self.labels.append(label.strip())
-        text = text.strip()
-        if len(text) > 0:
-            self.instruction_text = text
-        return text.strip()
+        self.labels = tuple(labels)
 
     def _read_assignment(self, text):
-        operator = Constants.ASSIGNMENT_OPERATOR
-        if text and text.split()[0].count(operator) > 0:
-            try:
-                self.assignment_symbol, self.assignment_value = [
-                    _.strip() for _ in text.split(operator) if _.strip()
-                ]
-            except ValueError as e:
-                raise AssemblyError(f"Invalid assignment {text!r}.") from e
-            else:
-                self.is_assignment = True
-                return ""
-        return text
-
-    def _read_operator(self, text):
-        text = text.strip()
-        if len(text) == 0:
-            self.operator = None
-            return ""
-        if text[0] in Constants.TEXT_WORD_DELIMITERS:
-            self.is_text_word = True
-            self.is_value = True
-            self.operator = text
-            return ""
         try:
-            operator, remainder = text.split(maxsplit=1)
-        except ValueError:
-            self.operator = text.strip()
-            return ""
-        else:
-            self.operator = operator.strip()
-        return remainder.strip()
+            self.assignment_symbol, self.assignment_value = [
+                _.strip()
+                for _ in text.split(Constants.ASSIGNMENT_OPERATOR)
+                if _.strip()
+            ]
+        except ValueError as e:
+            raise AssemblyError(f"Invalid assignment {text!r}.") from e
+        self.is_assignment = True
+        self._fold_constants((self.assignment_value,))
 
     def _parse_instruction_type(self, text):
         symbol_table = self.assembler.symbol_table
@@ -157,13 +316,12 @@ class SourceLine:
             return
         elif PseudoOperators.is_pseudo_op(self.operator) is True:
             self.is_pseudo_operator = True
-        elif symbol_table.is_primary_instruction_symbol(self.operator) is True:
-            self.is_instruction = True
-            self.is_primary_instruction = True
-            self.memory_location_count = 1
-        elif symbol_table.is_io_instruction_symbol(self.operator) is True:
+        elif operator_id := symbol_table.instruction_id(self.operator):
+            kind, _ = symbol_table.instructions[operator_id]
+            self.operator_id = operator_id
             self.is_instruction = True
-            self.is_io_instruction = True
+            self.is_primary_instruction = kind == SymbolKind.PRIMARY_INSTRUCTION
+            self.is_io_instruction = kind == SymbolKind.IO_INSTRUCTION
             self.memory_location_count = 1
         elif len(text.strip()) == 0:
             self.is_value = True
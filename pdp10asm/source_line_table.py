@@ -0,0 +1,296 @@
+"""The SourceLineTable class."""
+
+from array import array
+from collections.abc import Sequence
+from operator import attrgetter
+
+from .program import AssembledLine
+from .source_line import LINE_PATTERN
+
+
+class SourceLineTable(Sequence):
+    """
+    Columnar store for the parsed lines of a program.
+
+    Instead of keeping a SourceLine object for every line the table keeps
+    parallel arrays of line numbers, interned operator ids, flag bits, memory
+    location counts and interned operand records, with the text of every line
+    held in one shared buffer. Lines with the same operands share a record.
+    Indexing the table returns a SourceLineView which exposes the attributes
+    of a SourceLine without parsing the line again.
+    """
+
+    line_flags = (
+        "is_pseudo_operator",
+        "is_assignment",
+        "is_instruction",
+        "is_primary_instruction",
+        "is_io_instruction",
+        "is_value",
+        "is_text_word",
+        "is_empty",
+        "is_indirect",
+    )
+
+    flags = line_flags + ("has_labels", "has_comment", "has_instruction_text")
+
+    operand_fields = (
+        "operator_id",
+        "assignment_symbol",
+        "assignment_value",
+        "accumulator",
+        "index_register",
+        "memory_address",
+        "device_id",
+        "arguments",
+        "value",
+        "constants",
+        "constants_radix",
+    )
+
+    def __init__(self, assembler):
+        """
+        Columnar store for the parsed lines of a program.
+
+        Args:
+            assembler (PDP10Assembler): The assembler used to parse the lines.
+        """
+        self.assembler = assembler
+        self.source_line_numbers = array("L")
+        self.operator_ids = array("L")
+        self.flag_bits = array("H")
+        self.memory_location_counts = array("L")
+        self.operand_ids = array("L")
+        self.text_offsets = array("Q", [0])
+        self.text_buffer = bytearray()
+        self.operators = [None]
+        self.operator_index = {None: 0}
+        self.operands = []
+        self.operand_index = {}
+        self.constants = [None]
+        self.constants_index = {}
+        self.labels = {}
+        self.assembled_lines = []
+
+    def __len__(self):
+        return len(self.source_line_numbers)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("SourceLineTable index out of range")
+        return SourceLineView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield SourceLineView(self, index)
+
+    def append(self, source_line):
+        """Add the columns of a parsed SourceLine to the table."""
+        if source_line.labels:
+            self.labels[len(self)] = source_line.labels
+        self.source_line_numbers.append(source_line.source_line_number)
+        self.operator_ids.append(self.operator_id(source_line.operator))
+        self.flag_bits.append(self.pack_flags(source_line))
+        self.memory_location_counts.append(source_line.memory_location_count)
+        self.operand_ids.append(self.operand_id(source_line))
+        self.text_buffer += source_line.text.encode()
+        self.text_offsets.append(len(self.text_buffer))
+        self.assembled_lines.append(None)
+
+    def extend(self, source_lines):
+        """Add the columns of each SourceLine in source_lines to the table."""
+        for source_line in source_lines:
+            self.append(source_line)
+
+    def operator_id(self, operator):
+        """Return the interned id of operator, adding it if it is new."""
+        try:
+            return self.operator_index[operator]
+        except KeyError:
+            operator_id = len(self.operators)
+            self.operators.append(operator)
+            self.operator_index[operator] = operator_id
+            return operator_id
+
+    def operand_id(self, source_line):
+        """Return the id of the interned operand record of source_line."""
+        operands = _operands(source_line)
+        operands = (
+            operands[:_CONSTANTS]
+            + (self.constants_id(operands[_CONSTANTS]),)
+            + operands[_CONSTANTS + 1 :]
+        )
+        try:
+            return self.operand_index[operands]
+        except KeyError:
+            operand_id = len(self.operands)
+            self.operands.append(operands)
+            self.operand_index[operands] = operand_id
+            return operand_id
+
+    def constants_id(self, constants):
+        """Return the id of an interned dict of folded constants."""
+        if constants is None:
+            return 0
+        key = tuple(constants.items())
+        try:
+            return self.constants_index[key]
+        except KeyError:
+            constants_id = len(self.constants)
+            self.constants.append(constants)
+            self.constants_index[key] = constants_id
+            return constants_id
+
+    def pack_flags(self, source_line):
+        """Return the boolean attributes of source_line packed into an int."""
+        bits = 0
+        for bit, value in enumerate(
+            _line_flags(source_line)
+            + (
+                len(source_line.labels) > 0,
+                source_line.comment is not None,
+                source_line.instruction_text is not None,
+            )
+        ):
+            if value is True:
+                bits |= 1 << bit
+        return bits
+
+    def text(self, index):
+        """Return the text of the line at index."""
+        start, end = self.text_offsets[index], self.text_offsets[index + 1]
+        return self.text_buffer[start:end].decode()
+
+
+_line_flags = attrgetter(*SourceLineTable.line_flags)
+_operands = attrgetter(*SourceLineTable.operand_fields)
+_CONSTANTS = SourceLineTable.operand_fields.index("constants")
+
+
+class SourceLineView:
+    """A SourceLine stored in a SourceLineTable."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        """
+        A SourceLine stored in a SourceLineTable.
+
+        Args:
+            table (SourceLineTable): The table holding the line.
+            index (int): The position of the line in the table.
+        """
+        self.table = table
+        self.index = index
+
+    def __eq__(self, other):
+        if not isinstance(other, SourceLineView):
+            return NotImplemented
+        return self.table is other.table and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.table), self.index))
+
+    def __repr__(self):
+        return f"<SourceLineView: {self.source_line_number}>"
+
+    @property
+    def assembler(self):
+        """Return the assembler that parsed the line."""
+        return self.table.assembler
+
+    @property
+    def source_line_number(self):
+        """Return the line number of the line."""
+        return self.table.source_line_numbers[self.index]
+
+    @property
+    def text(self):
+        """Return the text of the line."""
+        return self.table.text(self.index)
+
+    @property
+    def operator(self):
+        """Return the operator of the line."""
+        return self.table.operators[self.table.operator_ids[self.index]]
+
+    @property
+    def memory_location_count(self):
+        """Return the number of memory locations used by the line."""
+        return self.table.memory_location_counts[self.index]
+
+    @property
+    def labels(self):
+        """Return the labels of the line."""
+        return self.table.labels.get(self.index, ())
+
+    @property
+    def comment(self):
+        """Return the comment of the line."""
+        if not self.has_comment:
+            return None
+        return LINE_PATTERN.match(self.text)["comment"]
+
+    @property
+    def instruction_text(self):
+        """Return the text of the line without its labels and comment."""
+        if not self.has_instruction_text:
+            return None
+        return LINE_PATTERN.match(self.text)["instruction"]
+
+    @property
+    def assembled_line(self):
+        """
+        Return the AssembledLine created from this line.
+
+        Placeholders for lines that have not been assembled are created each
+        time they are asked for and are not kept by the table.
+        """
+        assembled_line = self.table.assembled_lines[self.index]
+        if assembled_line is None:
+            return AssembledLine(self, None, None)
+        return assembled_line
+
+    @assembled_line.setter
+    def assembled_line(self, assembled_line):
+        if assembled_line is not None and assembled_line.memory_location is None:
+            return
+        self.table.assembled_lines[self.index] = assembled_line
+
+
+def _flag_property(bit, flag):
+    def getter(self):
+        return self.table.flag_bits[self.index] & (1 << bit) != 0
+
+    getter.__doc__ = f"Return the {flag} flag of the line."
+    return property(getter)
+
+
+def _operand_property(position, name):
+    if name == "constants":
+
+        def getter(self):
+            table = self.table
+            return table.constants[
+                table.operands[table.operand_ids[self.index]][position]
+            ]
+
+    else:
+
+        def getter(self):
+            table = self.table
+            return table.operands[table.operand_ids[self.index]][position]
+
+    getter.__doc__ = f"Return the {name} of the line."
+    return property(getter)
+
+
+for _bit, _flag in enumerate(SourceLineTable.flags):
+    setattr(SourceLineView, _flag, _flag_property(_bit, _flag))
+
+for _position, _name in enumerate(SourceLineTable.operand_fields):
+    setattr(SourceLineView, _name, _operand_property(_position, _name))
@@ -0,0 +1,92 @@
+"""Symbol classes for the PDP-10 Assembler."""
+
+
+class SymbolKind:
+    """Integer tags for the kinds of symbol."""
+
+    UNDEFINED = 0
+    VALUE = 1
+    PRIMARY_INSTRUCTION = 2
+    IO_INSTRUCTION = 3
+    DEVICE_CODE = 4
+    USER = 5
+
+
+class BaseSymbol:
+    """Base class for symbol table values."""
+
+    __slots__ = ("name", "value")
+
+    kind = SymbolKind.VALUE
+    shift = 0
+    is_primary_instruction = False
+    is_io_instruction = False
+
+    def __init__(self, name, value):
+        """Base class for symbol table values."""
+        self.name = name
+        self.value = value
+        self.value <<= self.shift
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.name}>"
+
+    @classmethod
+    def from_value(cls, name, value):
+        """Return a symbol with a value that is already shifted."""
+        symbol = cls.__new__(cls)
+        symbol.name = name
+        symbol.value = value
+        return symbol
+
+
+class InstructionSymbol(BaseSymbol):
+    """Class for symbols of instruction mnemonics."""
+
+    __slots__ = ()
+
+    kind = SymbolKind.PRIMARY_INSTRUCTION
+    shift = 27
+    is_primary_instruction = True
+
+
+class InstructionShorthand(BaseSymbol):
+    """Class for symbols of instruction shorthands."""
+
+    __slots__ = ()
+
+    kind = SymbolKind.PRIMARY_INSTRUCTION
+    shift = 21
+    is_primary_instruction = True
+
+
+class IOInstructionSymbol(BaseSymbol):
+    """Class for symbols of IO instruction mnemonics."""
+
+    __slots__ = ()
+
+    kind = SymbolKind.IO_INSTRUCTION
+    shift = 21
+    is_io_instruction = True
+
+
+class DeviceCodeSymbol(BaseSymbol):
+    """Class for IO device symbols."""
+
+    __slots__ = ()
+
+    kind = SymbolKind.DEVICE_CODE
+    shift = 0
+
+
+class UserSymbol(BaseSymbol):
+    """Class for user defined symbols."""
+
+    __slots__ = ("source_line",)
+
+    kind = SymbolKind.USER
+
+    def __init__(self, name, value, source_line):
+        """Class for user defined symbols."""
+        super().__init__(name, value)
+        self.source_line = source_line
@@ -0,0 +1,111 @@
+from unittest import mock
+
+import pytest
+
+from pdp10asm.assignments import AssignmentGraph, DeferredAssignment
+
+
+@pytest.fixture
+def graph():
+    return AssignmentGraph()
+
+
+def deferred(source_line_number, symbol, dependencies):
+    source_line = mock.Mock(
+        assignment_symbol=symbol, source_line_number=source_line_number
+    )
+    return DeferredAssignment(
+        source_line=source_line,
+        radix=8,
+        program_counter=0,
+        dependencies=tuple(dependencies),
+    )
+
+
+def test_deferred_assignment_symbol():
+    assert deferred(1, "A", "B").symbol == "A"
+
+
+def test_deferred_assignment_repr():
+    assert repr(deferred(1, "A", "B")) == "<DeferredAssignment: A>"
+
+
+def test_graph_is_empty(graph):
+    assert len(graph) == 0
+    assert graph.deferred_count == 0
+    assert graph.unresolved() == []
+    assert graph.cycles() == {}
+
+
+def test_defer(graph):
+    assignment = deferred(1, "A", "BC")
+    graph.defer(assignment)
+    assert len(graph) == 1
+    assert graph.deferred_count == 1
+    assert graph.pending == {"A": assignment}
+    assert graph.waiting == {"B": {"A"}, "C": {"A"}}
+
+
+def test_defer_replaces_pending_assignment_of_symbol(graph):
+    graph.defer(deferred(1, "A", "B"))
+    assignment = deferred(2, "A", "C")
+    graph.defer(assignment)
+    assert graph.pending == {"A": assignment}
+    assert graph.waiting_for("B") == []
+    assert graph.waiting_for("C") == [assignment]
+
+
+def test_discard(graph):
+    graph.defer(deferred(1, "A", "B"))
+    graph.discard("A")
+    graph.discard("X")
+    assert len(graph) == 0
+    assert graph.waiting_for("B") == []
+
+
+def test_waiting_for_returns_assignments_in_source_order(graph):
+    assignments = [deferred(3, "A", "X"), deferred(1, "B", "X"), deferred(2, "C", "Y")]
+    for assignment in assignments:
+        graph.defer(assignment)
+    assert graph.waiting_for("X") == [assignments[1], assignments[0]]
+    assert list(graph.pending) == ["C"]
+    assert graph.waiting_for("X") == []
+
+
+def test_unresolved(graph):
+    assignments = [deferred(3, "A", "X"), deferred(1, "B", "Y")]
+    for assignment in assignments:
+        graph.defer(assignment)
+    assert graph.unresolved() == [assignments[1], assignments[0]]
+
+
+@pytest.mark.parametrize(
+    "assignments,expected",
+    (
+        ((("A", "B"), ("B", "C")), {}),
+        ((("A", "A"),), {"A": ["A", "A"]}),
+        (
+            (("A", "B"), ("B", "A")),
+            {"A": ["A", "B", "A"], "B": ["B", "A", "B"]},
+        ),
+        (
+            (("A", "B"), ("B", "CX"), ("C", "A"), ("D", "A")),
+            {
+                "A": ["A", "B", "C", "A"],
+                "B": ["B", "C", "A", "B"],
+                "C": ["C", "A", "B", "C"],
+            },
+        ),
+    ),
+)
+def test_cycles(assignments, expected, graph):
+    for number, (symbol, dependencies) in enumerate(assignments, 1):
+        graph.defer(deferred(number, symbol, dependencies))
+    assert graph.cycles() == expected
+
+
+def test_cycles_in_long_chain(graph):
+    count = 5000
+    for number in range(count):
+        graph.defer(deferred(number, f"S{number}", [f"S{(number + 1) % count}"]))
+    assert len(graph.cycles()["S0"]) == count + 1
@@ -78,6 +78,21 @@ def test_cli_does_not_allow_invalid_listing_radix(source_file, runner):
     assert "Error: Invalid value for '-r' / '--radix': 'INVALID'" in result.output
 
 
+def test_cli_does_not_allow_invalid_symbol_order(source_file, runner):
+    result = runner.invoke(cli, [source_file, "-so", "INVALID"])
+    assert result.exit_code == 2
+    assert (
+        "Error: Invalid value for '-so' / '--symbol-order': 'INVALID'" in result.output
+    )
+
+
+def test_cli_lists_symbols_by_name(filesystem, source_file, listing_file, runner):
+    result = runner.invoke(cli, [source_file, "-l", listing_file, "-so", "NAME"])
+    assert result.exit_code == 0
+    with open(listing_file) as f:
+        assert "SYMBOLS" in f.read()
+
+
 @pytest.fixture
 def mock_output_format():
     m = mock.Mock()
@@ -140,6 +155,35 @@ def test_pager_option(mock_echo_via_pager, source_file, runner):
     assert result.exit_code == 0
 
 
+@mock.patch("pdp10asm.cli.PDP10Assembler")
+def test_jobs_option(mock_assembler, source_file, runner):
+    result = runner.invoke(cli, [source_file, "-j", "4"])
+    assert mock_assembler.from_lines.call_args.kwargs["workers"] == 4
+    assert result.exit_code == 0
+
+
+def test_cli_does_not_allow_invalid_jobs(source_file, runner):
+    result = runner.invoke(cli, [source_file, "-j", "0"])
+    assert result.exit_code == 2
+    assert "Error: Invalid value for '-j' / '--jobs'" in result.output
+
+
+def test_stats_option(source_file, runner):
+    result = runner.invoke(cli, [source_file, "-s", "-nl"])
+    assert result.exit_code == 0
+    assert "Parse cache: " in result.output
+    assert "Expression cache: " in result.output
+    assert "hit ratio)." in result.output
+
+
+def test_cache_dir_option(filesystem, source_file, runner):
+    for expected in ("0 chunks loaded", "0 chunks parsed"):
+        result = runner.invoke(cli, [source_file, "--cache-dir", "cache", "-s", "-nl"])
+        assert result.exit_code == 0
+        assert expected in result.output
+    assert os.listdir("cache")
+
+
 def test_no_listing_option(source_file, runner):
     result = runner.invoke(cli, [source_file, "-nl"])
     assert result.exit_code == 0
@@ -148,8 +192,8 @@ def test_no_listing_option(source_file, runner):
 
 @mock.patch("pdp10asm.cli.PDP10Assembler")
 def test_error_creating_assembler(mock_assembler, source_file, runner):
-    mock_assembler.side_effect = exceptions.AssemblyError()
-    mock_assembler.side_effect.add_note("error text")
+    mock_assembler.from_lines.side_effect = exceptions.AssemblyError()
+    mock_assembler.from_lines.side_effect.add_note("error text")
     result = runner.invoke(cli, [source_file])
     assert result.exit_code == 1
     assert "error text" in result.output
@@ -157,8 +201,9 @@ def test_error_creating_assembler(mock_assembler, source_file, runner):
 
 @mock.patch("pdp10asm.cli.PDP10Assembler")
 def test_error_running_assembler(mock_assembler, source_file, runner):
-    mock_assembler.return_value.assemble.side_effect = exceptions.AssemblyError()
-    mock_assembler.return_value.assemble.side_effect.add_note("error text")
+    assemble = mock_assembler.from_lines.return_value.assemble
+    assemble.side_effect = exceptions.AssemblyError()
+    assemble.side_effect.add_note("error text")
     result = runner.invoke(cli, [source_file])
     assert result.exit_code == 1
     assert "error text" in result.output
@@ -166,9 +211,8 @@ def test_error_running_assembler(mock_assembler, source_file, runner):
 
 @mock.patch("pdp10asm.cli.PDP10Assembler")
 def test_error_creating_listing(mock_assembler, source_file, runner):
-    mock_assembler.return_value.assemble.return_value.listing_text.side_effect = (
-        exceptions.ListingError("error text")
-    )
+    program = mock_assembler.from_lines.return_value.assemble.return_value
+    program.listing_text.side_effect = exceptions.ListingError("error text")
     result = runner.invoke(cli, [source_file])
     assert result.exit_code == 1
     assert "error text" in result.output
@@ -186,3 +230,20 @@ def test_second_pass_error(filesystem, runner, second_pass_error_text):
         "Error: During second pass on line 1:\n'DATAO 777,0'\n"
         "777 is not a valid device id.\n"
     )
+
+
+@pytest.mark.integration_test
+def test_all_errors_option(filesystem, runner):
+    source_path = "source.asm"
+    with open(source_path, "w") as f:
+        f.write("MOVE 1,FOO\nDATAO 777,0\nEND\n")
+    result = runner.invoke(cli, [source_path, "-e"])
+    assert result.exit_code == 1
+    assert result.output == (
+        "Assembling source.asm.\n\n"
+        "Error: During second pass on line 1:\n'MOVE 1,FOO'\n"
+        "Symbol 'FOO' is not defined.\n\n"
+        "During second pass on line 2:\n'DATAO 777,0'\n"
+        "777 is not a valid device id.\n\n"
+        "2 errors found.\n"
+    )
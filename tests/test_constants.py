@@ -21,7 +21,18 @@ from pdp10asm.constants import Constants
         ("LAB%", True),
         ("LA%B", True),
         (".", False),
+        ("..", True),
+        ("5LAB", False),
+        ("LAB_1", False),
+        ("ÉTAT", True),
+        ("½LAB", False),
+        ("LAB É", False),
     ),
 )
 def test_is_symbol(word, expected):
     assert Constants.is_symbol(word) is expected
+
+
+def test_is_symbol_with_empty_word():
+    with pytest.raises(IndexError):
+        Constants.is_symbol("")
@@ -0,0 +1,48 @@
+from array import array
+
+import pytest
+
+from pdp10asm.cross_references import CrossReferences
+
+
+@pytest.fixture
+def cross_references():
+    return CrossReferences()
+
+
+def test_cross_references_are_empty(cross_references):
+    assert len(cross_references) == 0
+    assert cross_references.references("LOOP") == array("L")
+
+
+def test_add(cross_references):
+    cross_references.set_line(3)
+    cross_references.add("LOOP")
+    cross_references.set_line(5)
+    cross_references.add("LOOP")
+    cross_references.add("FOO")
+    assert cross_references.references("LOOP") == array("L", [3, 5])
+    assert cross_references.references("FOO") == array("L", [5])
+    assert list(cross_references) == ["LOOP", "FOO"]
+    assert "FOO" in cross_references
+
+
+def test_references_on_the_same_line_are_added_once(cross_references):
+    cross_references.set_line(3)
+    cross_references.add_all(("LOOP", "FOO", "LOOP"))
+    assert cross_references.references("LOOP") == array("L", [3])
+    assert cross_references.line_symbols == ["LOOP", "FOO"]
+
+
+def test_set_line_clears_line_symbols(cross_references):
+    cross_references.set_line(3)
+    cross_references.add("LOOP")
+    cross_references.set_line(4)
+    assert cross_references.line_symbols == []
+
+
+def test_references_returns_a_copy(cross_references):
+    cross_references.set_line(3)
+    cross_references.add("LOOP")
+    cross_references.references("LOOP").append(9)
+    assert cross_references.references("LOOP") == array("L", [3])
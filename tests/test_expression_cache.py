@@ -0,0 +1,148 @@
+from unittest import mock
+
+import pytest
+
+from pdp10asm.assembler import PDP10Assembler
+from pdp10asm.exceptions import AssemblyError
+from pdp10asm.expression_cache import ExpressionCache
+
+
+@pytest.fixture
+def assembler():
+    assembler = PDP10Assembler("", expression_cache_size=0)
+    assembler.symbol_table.add_user_symbol("FOO", 0o100, 1)
+    assembler.symbol_table.add_user_symbol("BAR", 0o5, 2)
+    assembler.current_pass.program_counter = 0o1000
+    return assembler
+
+
+@pytest.fixture
+def expression_cache():
+    return ExpressionCache(maxsize=4)
+
+
+def value_twice(expression_cache, text, assembler):
+    expression_cache.value(text, assembler)
+    return expression_cache.value(text, assembler)
+
+
+def test_default_maxsize():
+    assert ExpressionCache().maxsize == ExpressionCache.default_maxsize
+
+
+def test_cache_is_empty(expression_cache):
+    assert len(expression_cache) == 0
+    assert expression_cache.hits == 0
+    assert expression_cache.misses == 0
+
+
+def test_value(expression_cache, assembler):
+    assert expression_cache.value("FOO+BAR", assembler) == 0o105
+    assert expression_cache.misses == 1
+
+
+def test_expression_is_cached_when_evaluated_again(expression_cache, assembler):
+    assert value_twice(expression_cache, "FOO+BAR", assembler) == 0o105
+    assert len(expression_cache) == 1
+    assert expression_cache.value("FOO+BAR", assembler) == 0o105
+    assert expression_cache.hits == 1
+    assert expression_cache.misses == 2
+
+
+@mock.patch("pdp10asm.expression_cache.ExpressionParser")
+def test_cached_value_is_not_evaluated(mock_ExpressionParser, expression_cache):
+    mock_ExpressionParser.references.return_value = ((), 0)
+    mock_ExpressionParser.return_value.value = 5
+    assembler = PDP10Assembler("")
+    value_twice(expression_cache, "5", assembler)
+    mock_ExpressionParser.reset_mock()
+    assert expression_cache.value("5", assembler) == 5
+    mock_ExpressionParser.assert_not_called()
+
+
+def test_redefined_symbol_invalidates_value(expression_cache, assembler):
+    value_twice(expression_cache, "FOO+BAR", assembler)
+    assembler.symbol_table.add_user_symbol("BAR", 0o6, 3)
+    assert expression_cache.value("FOO+BAR", assembler) == 0o106
+    assert expression_cache.hits == 0
+
+
+def test_other_symbols_do_not_invalidate_value(expression_cache, assembler):
+    value_twice(expression_cache, "FOO+BAR", assembler)
+    assembler.symbol_table.add_user_symbol("BAZ", 0o7, 3)
+    assert expression_cache.value("FOO+BAR", assembler) == 0o105
+    assert expression_cache.hits == 1
+
+
+def test_deleted_symbol_invalidates_value(expression_cache, assembler):
+    value_twice(expression_cache, "FOO+BAR", assembler)
+    assembler.symbol_table.delete_symbol("BAR")
+    with pytest.raises(AssemblyError):
+        expression_cache.value("FOO+BAR", assembler)
+
+
+def test_radix_change_invalidates_value(expression_cache, assembler):
+    value_twice(expression_cache, "10", assembler)
+    assembler.radix = 10
+    assert expression_cache.value("10", assembler) == 10
+    assert expression_cache.hits == 0
+
+
+@pytest.mark.parametrize("text,expected", ((".+1", 0o2001), ("FOO-.", -0o1700)))
+def test_program_counter_relative_value(text, expected, expression_cache, assembler):
+    value_twice(expression_cache, text, assembler)
+    assembler.current_pass.program_counter = 0o2000
+    assert expression_cache.value(text, assembler) == expected
+    assert expression_cache.hits == 1
+
+
+def test_other_uses_of_program_counter_are_not_cached(expression_cache, assembler):
+    assert value_twice(expression_cache, ".*2", assembler) == 0o2000
+    assert len(expression_cache) == 0
+    assembler.current_pass.program_counter = 0o2000
+    assert expression_cache.value(".*2", assembler) == 0o4000
+
+
+def test_errors_are_not_cached(expression_cache, assembler):
+    for _ in range(2):
+        with pytest.raises(AssemblyError):
+            expression_cache.value("BAZ", assembler)
+    assert len(expression_cache) == 0
+
+
+def test_least_recently_used_value_is_evicted(expression_cache, assembler):
+    for text in ("1", "2", "3", "4", "1", "5"):
+        value_twice(expression_cache, text, assembler)
+    assert list(expression_cache.entries) == ["3", "4", "1", "5"]
+
+
+def test_seen_expressions_are_limited_to_maxsize(expression_cache, assembler):
+    for text in ("1", "2", "3", "4", "5"):
+        expression_cache.value(text, assembler)
+    assert expression_cache.seen == {"5"}
+
+
+def test_summary(expression_cache):
+    expression_cache.record(3, 1)
+    assert expression_cache.summary() == (
+        "Expression cache: 3 hits, 1 misses (75.0% hit ratio)."
+    )
+
+
+@pytest.mark.integration_test
+def test_assembly_with_expression_cache_matches_assembly(memory_to_paper_tape_raw_text):
+    expected = PDP10Assembler(
+        memory_to_paper_tape_raw_text, expression_cache_size=0
+    ).assemble()
+    assembler = PDP10Assembler(memory_to_paper_tape_raw_text)
+    program = assembler.assemble()
+    assert program.listing_text() == expected.listing_text()
+
+
+@pytest.mark.integration_test
+def test_assembly_uses_expression_cache():
+    lines = ["        LOC 100", "LOOP:   MOVE 1,LOOP+1"]
+    text = "\n".join(lines + ["        MOVE 1,LOOP+1"] * 2 + ["        END"])
+    assembler = PDP10Assembler(text)
+    assembler.assemble()
+    assert assembler.expression_cache.hits > 0
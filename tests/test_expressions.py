@@ -4,7 +4,7 @@ import pytest
 
 from pdp10asm.constants import Constants
 from pdp10asm.exceptions import AssemblyError
-from pdp10asm.expressions import ExpressionParser, Operations
+from pdp10asm.expressions import ExpressionListParser, ExpressionParser, Operations
 
 
 @pytest.fixture
@@ -112,6 +112,23 @@ def test_handle_magnitude(text, value, magnitude, parser):
     assert parser.handle_magnitude(text) == (value, magnitude)
 
 
+@pytest.mark.parametrize(
+    "text,expected",
+    (
+        ("10", ("10", None, 1)),
+        ("^D10", ("10", 10, 1)),
+        ("^O 10", ("10", 8, 1)),
+        ("^B101K", ("101", 2, 1000)),
+        ("5 M", ("5", None, 1000000)),
+        ("10^D", ("10", 10, 1)),
+        ("^d10", ("^d10", None, 1)),
+        ("5k", ("5k", None, 1)),
+    ),
+)
+def test_split_number(text, expected):
+    assert ExpressionParser.split_number(text) == expected
+
+
 def test_parse_expression_with_no_operators(assembler):
     get_symbol_value = assembler.symbol_table.get_symbol_value
     get_symbol_value.return_value = 25
@@ -179,12 +196,45 @@ def test_get_token(text, token, string):
         ("5 + <3 * 2>", ["5", "+", ["3", "*", "2"]]),
         ("<5 + 3> * 2", [["5", "+", "3"], "*", "2"]),
         ("5 + <3 + <6 + 9>>", ["5", "+", ["3", "+", ["6", "+", "9"]]]),
+        ("<1+2>*<3+4>", [["1", "+", "2"], "*", ["3", "+", "4"]]),
+        ("<<1>+<2>>-<3>", [[["1"], "+", ["2"]], "-", ["3"]]),
+        ("<>", [[]]),
+        ("A.B", ["A", ".", "B"]),
     ),
 )
 def test_expression_lexer(string, expected):
     assert ExpressionParser.expression_lexer(string) == expected
 
 
+@pytest.mark.parametrize(
+    "string,bracket",
+    (("<1+2", "<"), ("1+2>", ">"), ("<1>>", ">"), ("<<1>", "<")),
+)
+def test_expression_lexer_with_unmatched_bracket(string, bracket):
+    with pytest.raises(AssemblyError) as exc_info:
+        ExpressionParser.expression_lexer(string)
+    assert str(exc_info.value) == f"Unmatched {bracket!r} in {string!r}."
+
+
+def test_expression_lexer_with_deeply_nested_brackets():
+    tokens = ExpressionParser.expression_lexer("<" * 5000 + "1" + ">" * 5000)
+    for _ in range(5000):
+        (tokens,) = tokens
+    assert tokens == ["1"]
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    (
+        ("", []),
+        ("  ", []),
+        (" FOO 5 + <3 -.> ", ["FOO 5", "+", "<", "3", "-", ".", ">"]),
+    ),
+)
+def test_expression_tokens(string, expected):
+    assert list(ExpressionParser.expression_tokens(string)) == expected
+
+
 @mock.patch("pdp10asm.expressions.ExpressionParser.parse")
 def test_as_literal(mock_parse):
     parser = ExpressionParser("", None)
@@ -313,3 +363,219 @@ def test_validate_half_word_raises_if_value_too_large():
     with pytest.raises(AssemblyError) as exc_info:
         ExpressionParser.validate_half_word(0o1000000)
     assert str(exc_info.value) == "262144 is not an 18-bit number."
+
+
+def test_compile_returns_function(assembler):
+    assembler.symbol_table.get_symbol_value.return_value = 25
+    parser = ExpressionParser("1", assembler)
+    assert ExpressionParser.compile("FOO+<3*2>")(parser) == 31
+
+
+def test_compile_is_cached():
+    assert ExpressionParser.compile("FOO+1") is ExpressionParser.compile("FOO+1")
+
+
+def test_compiled_expression_looks_up_symbols_when_evaluated(assembler):
+    get_symbol_value = assembler.symbol_table.get_symbol_value
+    get_symbol_value.return_value = 1
+    assert ExpressionParser("FOO+BAR", assembler).value == 2
+    get_symbol_value.return_value = 5
+    assert ExpressionParser("FOO+BAR", assembler).value == 10
+    get_symbol_value.assert_has_calls([mock.call("FOO"), mock.call("BAR")] * 2)
+
+
+def test_compiled_expression_uses_radix_when_evaluated(assembler):
+    assert ExpressionParser("10+^D10", assembler).value == 18
+    assembler.radix = 10
+    assert ExpressionParser("10+^D10", assembler).value == 20
+    assert ExpressionParser("10+^D10", assembler, radix=2).value == 12
+
+
+def test_compiled_expression_uses_program_counter_when_evaluated(assembler):
+    assembler.current_pass.program_counter = 5
+    assert ExpressionParser(".+1", assembler).value == 6
+    assembler.current_pass.program_counter = 7
+    assert ExpressionParser(".+1", assembler).value == 8
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    (
+        ("", "Value operator mismatch []."),
+        ("A.B", "Value operator mismatch ['A', '.', 'B']."),
+        ("<3>4", "Value operator mismatch [3, '4']."),
+    ),
+)
+def test_compiled_expression_without_operator(text, expected, assembler):
+    with pytest.raises(AssemblyError) as exc_info:
+        ExpressionParser(text, assembler)
+    assert str(exc_info.value) == expected
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    (
+        ("<" * 5000 + "1+2" + ">" * 5000, 3),
+        ("<" * 3000 + "2*" * 3000 + "1" + ">" * 3000, 2**3000),
+        ("-<" * 3001 + "1" + ">" * 3001, -1),
+        ("<1+" * 4000 + "FOO" + ">" * 4000, 4000 + 25),
+        ("<" * 2000 + "5" + ">" * 2000 + "-" + "<" * 2000 + "3" + ">" * 2000, 2),
+    ),
+)
+def test_parse_deeply_nested_expressions(text, expected, assembler):
+    assembler.symbol_table.get_symbol_value.return_value = 25
+    assert ExpressionParser(text, assembler).value == expected
+
+
+def test_deeply_nested_expression_without_operator(assembler):
+    with pytest.raises(AssemblyError) as exc_info:
+        ExpressionParser("<" * 5000 + "1<2>" + ">" * 5000, assembler)
+    assert str(exc_info.value) == "Value operator mismatch ['1', 2]."
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    (
+        ("7-5-2", 4),
+        ("40/4/2", 16),
+        ("5-3+1", 1),
+        ("5+3-1", 7),
+        ("2*3+4*5", 26),
+        ("1|2&3", 3),
+        ("6&3|4", 6),
+        ("-5-3", -8),
+        ("5*-3", -15),
+        ("5+-3-2", 0),
+        ("-<2+3>*2", -10),
+        ("<1+2>*<3+4>", 21),
+        ("<7-5>-<2-1>", 1),
+    ),
+)
+def test_parse_precedence(text, expected, assembler):
+    assert ExpressionParser(text, assembler).value == expected
+
+
+def test_parse_long_expression(assembler):
+    text = "+".join(["1", "2|4"] * 5000)
+    assert ExpressionParser(text, assembler).value == 35000
+
+
+def test_parse_long_subtraction(assembler):
+    text = "-".join(["1"] * 5001)
+    assert ExpressionParser(text, assembler).value == 1
+
+
+@pytest.mark.parametrize("text", ("5+", "5-", "+5", "5+*3", "--5", "5 <6>"))
+def test_parse_with_missing_operand_or_operator(text, assembler):
+    with pytest.raises(AssemblyError, match="Value operator mismatch"):
+        ExpressionParser(text, assembler)
+
+
+@pytest.mark.parametrize(
+    "text,radix,expected",
+    (
+        ("10", 8, (8, 8)),
+        ("10", 10, (10, 10)),
+        ("^D10", 8, (10, None)),
+        ("<^D10+^B11>*^D2", 8, (26, None)),
+        ("^D10+10", 8, (18, 8)),
+        ("-5K", 8, (-5000, 8)),
+        ("FOO+1", 8, None),
+        (".+1", 8, None),
+        ("5+", 8, None),
+        ("8", 8, None),
+        ("1/0", 8, None),
+    ),
+)
+def test_constant(text, radix, expected):
+    assert ExpressionParser.constant(text, mock.Mock(radix=radix)) == expected
+
+
+def test_constant_does_not_hide_unexpected_errors():
+    with mock.patch.object(ExpressionParser, "parse", side_effect=TypeError):
+        with pytest.raises(TypeError):
+            ExpressionParser.constant("10", mock.Mock(radix=8))
+
+
+@pytest.mark.parametrize(
+    "text,symbols,program_counter",
+    (
+        ("10", (), 0),
+        ("FOO", ("FOO",), 0),
+        ("<FOO+BAR>*FOO", ("FOO", "BAR"), 0),
+        (".", (), 1),
+        (".+1", (), 1),
+        ("FOO-.", ("FOO",), -1),
+        ("-.+FOO", ("FOO",), -1),
+        ("FOO-1-.", ("FOO",), 1),
+        ("FOO-BAR+.", ("FOO", "BAR"), -1),
+        ("2*3+.", (), 1),
+        ("FOO+-.", ("FOO",), -1),
+        (".*2", (), None),
+        ("FOO&.", ("FOO",), None),
+        ("<.+1>", (), None),
+        (".-.", (), None),
+    ),
+)
+def test_references(text, symbols, program_counter):
+    assert ExpressionParser.references(text) == (symbols, program_counter)
+
+
+@pytest.mark.parametrize(
+    "text,radix,expected",
+    (
+        ("1,2,10", None, [1, 2, 8]),
+        (" 1 , 2 ,10 ", 10, [1, 2, 10]),
+        ("FOO,FOO+1,<2*3>", None, [25, 26, 6]),
+        ("-1,^D10,.", None, [0o777777777777, 10, 5]),
+    ),
+)
+def test_list_as_twos_complement(text, radix, expected, assembler):
+    assembler.symbol_table.get_symbol_value.return_value = 25
+    assembler.current_pass.program_counter = 5
+    parser = ExpressionListParser(text, assembler, radix=radix)
+    assert parser.as_twos_complement() == expected
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    (
+        ("1, 2,10", [1, 2, 8]),
+        ("1,FOO", None),
+        ("1,-2", None),
+        ("1,,2", None),
+        ("1,8", None),
+        ("1,1000000000000", None),
+    ),
+)
+def test_list_numbers(text, expected, assembler):
+    assert ExpressionListParser(text, assembler).numbers() == expected
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    (
+        ("1,1000000000000,FOO", "68719476736 is not a 36-bit number."),
+        ("1,,2", "Value operator mismatch []."),
+        ("1,<2,3>", "Unmatched '<' in '<2'."),
+        ("1,2>,3", "Unmatched '>' in '2>'."),
+        ("FOO,<2,3>", "Symbol 'FOO' is not defined."),
+    ),
+)
+def test_list_errors_are_raised_in_order(text, expected, assembler):
+    get_symbol_value = assembler.symbol_table.get_symbol_value
+    get_symbol_value.side_effect = AssemblyError("Symbol 'FOO' is not defined.")
+    with pytest.raises(AssemblyError) as exc_info:
+        ExpressionListParser(text, assembler).as_twos_complement()
+    assert str(exc_info.value) == expected
+
+
+def test_list_of_deeply_nested_expressions(assembler):
+    text = ",".join(["<" * 4000 + "1" + ">" * 4000, "<" * 4000 + "2" + ">" * 4000])
+    assert ExpressionListParser(text, assembler).as_twos_complement() == [1, 2]
+
+
+def test_compile_list_is_cached():
+    functions = ExpressionListParser.compile_list("FOO,1+2")
+    assert len(functions) == 2
+    assert ExpressionListParser.compile_list("FOO,1+2") is functions
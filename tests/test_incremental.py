@@ -0,0 +1,206 @@
+import re
+
+import pytest
+
+from pdp10asm.assembler import PDP10Assembler
+from pdp10asm.exceptions import AssemblyError
+from pdp10asm.incremental import AssemblyHistory, IncrementalAssembly
+from pdp10asm.listing import SourceListing
+
+SOURCE = """        TITLE Test
+        X=5
+        LOC 1000
+START:  MOVE 1,X
+        JRST LOOP       ; Comment
+LOOP:   MOVEI 2,3
+        EXP 1,2,3
+        RADIX 10
+        EXP 10
+        END
+        EXP 7"""
+
+
+def program_state(program):
+    return (
+        program.listing_text(),
+        program.listing_text(SourceListing),
+        {
+            memory_location: assembled_line.binary_value
+            for memory_location, assembled_line in program.by_memory_location.items()
+        },
+        [(symbol.name, symbol.value, symbol.source_line) for symbol in program.symbols],
+        program.title,
+        program.subtitle,
+        [source_line.source_line_number for source_line in program.source_lines],
+        {
+            symbol: list(program.references(symbol))
+            for symbol in program.cross_references
+        },
+    )
+
+
+def edit(text, index, *lines):
+    source = text.splitlines()
+    source[index : index + 1] = lines
+    return "\n".join(source)
+
+
+@pytest.fixture
+def assembler():
+    _assembler = PDP10Assembler("")
+    _assembler.update(SOURCE)
+    return _assembler
+
+
+def assert_update_matches_assembly(assembler, text):
+    try:
+        expected = program_state(PDP10Assembler(text).assemble())
+    except AssemblyError as e:
+        with pytest.raises(AssemblyError, match=re.escape(str(e))):
+            assembler.update(text)
+    else:
+        assert program_state(assembler.update(text)) == expected
+
+
+def test_assembler_has_no_incremental_assembly():
+    assert PDP10Assembler("").incremental is None
+
+
+def test_update_assembles_from_scratch():
+    assembler = PDP10Assembler("")
+    program = assembler.update(SOURCE)
+    assert isinstance(assembler.incremental, IncrementalAssembly)
+    assert isinstance(assembler.incremental.history, AssemblyHistory)
+    assert assembler.text == SOURCE
+    assert program is assembler.program
+    assert program_state(program) == program_state(PDP10Assembler(SOURCE).assemble())
+
+
+def test_update_with_unchanged_source(assembler):
+    assert_update_matches_assembly(assembler, SOURCE)
+
+
+@pytest.mark.parametrize(
+    "lines",
+    (
+        ("START:  MOVE 1,X       ; New comment",),
+        ("START:  MOVE 2,X",),
+        ("        X=6",),
+        ("        X=5", "        Y=X"),
+        ("        X=LOOP-START",),
+        ("        X=Y", "        Y=LOOP+1"),
+        ("        TITLE Other",),
+        ("        RADIX 10",),
+        ("        END",),
+        (),
+    ),
+)
+@pytest.mark.parametrize("index", range(len(SOURCE.splitlines())))
+def test_update_matches_assembly(assembler, index, lines):
+    assert_update_matches_assembly(assembler, edit(SOURCE, index, *lines))
+
+
+def test_update_reuses_unchanged_lines(assembler):
+    previous = assembler.incremental.history
+    text = edit(SOURCE, 3, "START:  MOVE 1,X       ; New comment")
+    program = assembler.update(text)
+    assert program.source_lines[0].text == previous.source_lines[0].text
+    assert program.source_lines[3].text != previous.source_lines[3].text
+    assert program.source_lines[5].text == previous.source_lines[5].text
+    history = assembler.incremental.history
+    assert history.assembled_words[program.source_lines[5]] == (
+        previous.assembled_words[previous.source_lines[5]]
+    )
+
+
+def test_update_renumbers_lines_after_inserted_line(assembler):
+    text = edit(SOURCE, 1, "        X=5", "        Y=1")
+    program = assembler.update(text)
+    assert [line.source_line_number for line in program.source_lines] == list(
+        range(1, len(text.splitlines()) + 1)
+    )
+    assert {symbol.name: symbol.source_line for symbol in program.symbols} == {
+        "X": 2,
+        "Y": 3,
+        "START": 5,
+        "LOOP": 7,
+    }
+
+
+def test_update_does_not_change_previous_program():
+    text = "LOC 100\nA: MOVE 1,A\nJRST A\nEND\n"
+    assembler = PDP10Assembler("")
+    previous = assembler.update(text)
+    expected = program_state(previous)
+    program = assembler.update(edit(text, 0, "LOC 100", "EXP 1"))
+    assert program_state(previous) == expected
+    assert previous.source_lines[1].source_line_number == 2
+    assert previous.source_lines[1].assembled_line.memory_location == 0o100
+    assert program.source_lines[2].source_line_number == 3
+    assert program.source_lines[2].assembled_line.memory_location == 0o101
+    assert previous.source_lines[1] is not program.source_lines[2]
+
+
+def test_update_after_error_assembles_from_scratch(assembler):
+    with pytest.raises(AssemblyError):
+        assembler.update(edit(SOURCE, 4, "        JRST NOWHERE"))
+    assert assembler.incremental.history is None
+    assert_update_matches_assembly(assembler, SOURCE)
+
+
+def test_update_with_columnar_lines():
+    assembler = PDP10Assembler("", columnar=True)
+    assembler.update(SOURCE)
+    assert_update_matches_assembly(assembler, edit(SOURCE, 1, "        X=6"))
+
+
+def test_update_with_deferred_assignments():
+    text = edit(SOURCE, 1, "        X=Y*2", "        Y=LOOP+1")
+    assembler = PDP10Assembler("")
+    assembler.update(text)
+    assert assembler.incremental.history.first_deferral == 1
+    assert_update_matches_assembly(assembler, edit(text, 6, "LOOP:   MOVEI 3,3"))
+    assert_update_matches_assembly(assembler, edit(text, 5, "        JRST LOOP", ""))
+
+
+def test_update_restores_order_of_reassigned_symbols():
+    text = "\n".join(
+        (
+            "        LOC 100",
+            "        X=1",
+            "A:      MOVE 1,X",
+            "        X=L",
+            "B:      MOVE 2,X",
+            "L:      MOVE 3,A",
+            "        END",
+        )
+    )
+    assembler = PDP10Assembler("")
+    assembler.update(text)
+    text = edit(edit(text, 5), 3, "L:      MOVE 3,A", "        X=L")
+    assert_update_matches_assembly(assembler, text)
+    assert [symbol.name for symbol in assembler.program.symbols] == [
+        "X",
+        "A",
+        "L",
+        "B",
+    ]
+
+
+@pytest.mark.integration_test
+def test_update_hello_world(hello_world_text):
+    assembler = PDP10Assembler("")
+    assembler.update(hello_world_text)
+    for index in range(len(hello_world_text.splitlines())):
+        assert_update_matches_assembly(assembler, edit(hello_world_text, index))
+        assert_update_matches_assembly(assembler, hello_world_text)
+
+
+@pytest.mark.integration_test
+def test_update_memory_to_paper_tape_raw(memory_to_paper_tape_raw_text):
+    text = memory_to_paper_tape_raw_text
+    assembler = PDP10Assembler("")
+    assembler.update(text)
+    for index, line in enumerate(text.splitlines()):
+        assert_update_matches_assembly(assembler, edit(text, index, line, "EXP 1"))
+        assert_update_matches_assembly(assembler, text)
@@ -29,6 +29,10 @@ def test_listing_radix_defaults_to_8(program):
     assert BinaryListing(program).radix == 8
 
 
+def test_listing_symbol_order_defaults_to_defined(program):
+    assert BinaryListing(program).symbol_order == "defined"
+
+
 def test_listing_text(listing):
     listing.heading_text = mock.Mock(return_value="heading")
     listing.symbols_listing_text = mock.Mock(return_value="symbols")
@@ -54,6 +58,25 @@ def test_symbols_listing_text(listing):
     )
 
 
+@pytest.mark.parametrize(
+    "symbol_order,method", (("name", "symbols_by_name"), ("value", "symbols_by_value"))
+)
+def test_symbols_listing_text_with_symbol_order(symbol_order, method, listing):
+    symbols = [mock.Mock(), mock.Mock()]
+    getattr(listing.program, method).return_value = symbols
+    listing.symbol_order = symbol_order
+    listing._symbol_line = mock.Mock(return_value="text")
+    assert listing.symbols_listing_text() == "SYMBOLS\n_______\ntext\ntext"
+    listing._symbol_line.assert_has_calls((mock.call(_) for _ in symbols))
+
+
+def test_symbols_listing_text_raises_for_unsupported_symbol_order(listing):
+    listing.symbol_order = "size"
+    with pytest.raises(ListingError) as exc_info:
+        listing.symbols_listing_text()
+    assert str(exc_info.value) == "Unsupported symbol order 'size'."
+
+
 def test_program_listing_text(listing):
     assembled_lines = [mock.Mock()] * 3
     listing.program.by_memory_location.values.return_value = assembled_lines
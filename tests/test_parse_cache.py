@@ -0,0 +1,199 @@
+import json
+import pickle
+import zlib
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pdp10asm.assembler import PDP10Assembler
+from pdp10asm.parse_cache import ParseCache, ParseCacheDirectory
+from pdp10asm.symbol_table import SymbolTable
+
+
+@pytest.fixture
+def parse_cache():
+    return ParseCache(maxsize=2)
+
+
+def test_default_maxsize():
+    assert ParseCache().maxsize == ParseCache.default_maxsize
+
+
+def test_maxsize(parse_cache):
+    assert parse_cache.maxsize == 2
+
+
+def test_cache_is_empty(parse_cache):
+    assert len(parse_cache) == 0
+    assert parse_cache.hits == 0
+    assert parse_cache.misses == 0
+
+
+def test_get_missing_key(parse_cache):
+    assert parse_cache.get("MOVE 1,2") is None
+    assert parse_cache.misses == 1
+    assert parse_cache.hits == 0
+
+
+def test_get_cached_key(parse_cache):
+    parse_cache.add("MOVE 1,2", (1, True))
+    assert parse_cache.get("MOVE 1,2") == (1, True)
+    assert parse_cache.hits == 1
+    assert parse_cache.misses == 0
+
+
+def test_add_evicts_least_recently_used(parse_cache):
+    parse_cache.add("A", 1)
+    parse_cache.add("B", 2)
+    parse_cache.get("A")
+    parse_cache.add("C", 3)
+    assert len(parse_cache) == 2
+    assert parse_cache.get("B") is None
+    assert parse_cache.get("A") == 1
+    assert parse_cache.get("C") == 3
+
+
+def test_add_with_zero_maxsize():
+    parse_cache = ParseCache(maxsize=0)
+    parse_cache.add("A", 1)
+    assert len(parse_cache) == 0
+
+
+def test_record(parse_cache):
+    parse_cache.record(3, 1)
+    assert parse_cache.hits == 3
+    assert parse_cache.misses == 1
+
+
+@pytest.mark.parametrize(
+    "hits,misses,lookups,hit_ratio",
+    ((0, 0, 0, 0.0), (1, 0, 1, 1.0), (1, 3, 4, 0.25), (0, 2, 2, 0.0)),
+)
+def test_hit_ratio(hits, misses, lookups, hit_ratio, parse_cache):
+    parse_cache.record(hits, misses)
+    assert parse_cache.lookups == lookups
+    assert parse_cache.hit_ratio == hit_ratio
+
+
+def test_summary(parse_cache):
+    parse_cache.record(3, 1)
+    assert parse_cache.summary() == "Parse cache: 3 hits, 1 misses (75.0% hit ratio)."
+
+
+@pytest.fixture
+def symbol_table():
+    return SymbolTable()
+
+
+@pytest.fixture
+def cache_dir(tmp_path, symbol_table):
+    return ParseCacheDirectory(tmp_path / "cache", symbol_table)
+
+
+@pytest.fixture
+def lines():
+    return ["LABEL: MOVE 1,@2(3) ; comment", "", "X=5", "EXP 1,2"]
+
+
+@pytest.fixture
+def source_lines(lines):
+    assembler = PDP10Assembler("")
+    return list(assembler._read_lines(lines, 1))
+
+
+def test_cache_dir_creates_directory(cache_dir, tmp_path):
+    assert cache_dir.path == tmp_path / "cache"
+    assert cache_dir.path.is_dir()
+
+
+def test_cache_dir_key_depends_on_lines(cache_dir, lines):
+    assert cache_dir.key(lines) == cache_dir.key(list(lines))
+    assert cache_dir.key(lines) != cache_dir.key(lines[1:])
+    assert cache_dir.key(["AB", "C"]) != cache_dir.key(["A", "BC"])
+
+
+def test_cache_dir_key_depends_on_instructions(tmp_path, symbol_table, lines):
+    other_symbol_table = SymbolTable()
+    other_symbol_table.delete_symbol("MOVE")
+    assert ParseCacheDirectory(tmp_path, symbol_table).key(lines) != (
+        ParseCacheDirectory(tmp_path, other_symbol_table).key(lines)
+    )
+
+
+def test_cache_dir_load_missing_key(cache_dir, lines):
+    assert cache_dir.load(cache_dir.key(lines), lines, 1, None) is None
+    assert cache_dir.misses == 1
+
+
+def test_cache_dir_load_corrupt_file(cache_dir, lines):
+    key = cache_dir.key(lines)
+    cache_dir.key_path(key).write_bytes(b"not a cache file")
+    assert cache_dir.load(key, lines, 1, None) is None
+    assert cache_dir.misses == 1
+
+
+class Payload:
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return Path.touch, (self.path,)
+
+
+def test_cache_dir_load_does_not_unpickle(cache_dir, lines, tmp_path):
+    key = cache_dir.key(lines)
+    marker = tmp_path / "marker"
+    payload = pickle.dumps([Payload(marker)] * len(lines))
+    cache_dir.key_path(key).write_bytes(zlib.compress(payload))
+    assert cache_dir.load(key, lines, 1, None) is None
+    assert not marker.exists()
+    assert cache_dir.misses == 1
+
+
+def test_cache_dir_load_unknown_field(cache_dir, lines):
+    key = cache_dir.key(lines)
+    records = [{"assembler": None}] + [{}] * (len(lines) - 1)
+    cache_dir.key_path(key).write_bytes(zlib.compress(json.dumps(records).encode()))
+    assert cache_dir.load(key, lines, 1, None) is None
+    assert cache_dir.misses == 1
+
+
+def test_cache_dir_key_depends_on_parser_source(tmp_path, symbol_table, lines):
+    key = ParseCacheDirectory(tmp_path, symbol_table).key(lines)
+    with mock.patch("pdp10asm.parse_cache.parser_source_hash", return_value=b"changed"):
+        assert ParseCacheDirectory(tmp_path, symbol_table).key(lines) != key
+
+
+def test_cache_dir_load_wrong_line_count(cache_dir, lines, source_lines):
+    key = cache_dir.key(lines)
+    cache_dir.store(key, source_lines[:2])
+    assert cache_dir.load(key, lines, 1, None) is None
+
+
+def test_cache_dir_store_and_load(cache_dir, lines, source_lines):
+    key = cache_dir.key(lines)
+    cache_dir.store(key, source_lines)
+    assembler = PDP10Assembler("")
+    loaded = cache_dir.load(key, lines, 10, assembler)
+    assert cache_dir.hits == 1
+    assert len(loaded) == len(source_lines)
+    for number, (line, expected) in enumerate(zip(loaded, source_lines, strict=True)):
+        assert line.assembler is assembler
+        assert line.source_line_number == 10 + number
+        for name in ("text",) + ParseCacheDirectory.fields:
+            assert getattr(line, name) == getattr(expected, name)
+
+
+def test_cache_dir_store_leaves_no_temporary_files(cache_dir, lines, source_lines):
+    key = cache_dir.key(lines)
+    cache_dir.store(key, source_lines)
+    assert [path.name for path in cache_dir.path.iterdir()] == [f"{key}.parse"]
+
+
+def test_cache_dir_summary(cache_dir):
+    cache_dir.hits = 3
+    cache_dir.misses = 1
+    assert cache_dir.summary() == (
+        "Parse cache directory: 3 chunks loaded, 1 chunks parsed."
+    )
@@ -106,6 +106,53 @@ def test_run_method_stops_when_done_is_true(base_pass):
     base_pass.process_line.assert_not_called()
 
 
+def test_run_line(base_pass):
+    base_pass.process_line = mock.Mock()
+    source_line = mock.Mock(is_empty=False, source_line_number=5, text="  MOVE 1,2 ")
+    assert base_pass.run_line(source_line) is True
+    base_pass.process_line.assert_called_once_with(source_line)
+    assert base_pass.source_line_number == 5
+    assert base_pass.current_line == "MOVE 1,2"
+
+
+def test_run_line_skips_empty_line(base_pass):
+    base_pass.process_line = mock.Mock()
+    assert base_pass.run_line(mock.Mock(is_empty=True)) is True
+    base_pass.process_line.assert_not_called()
+
+
+def test_run_line_returns_false_when_done_is_true(base_pass):
+    base_pass.done = True
+    base_pass.process_line = mock.Mock()
+    assert base_pass.run_line(mock.Mock(is_empty=False)) is False
+    base_pass.process_line.assert_not_called()
+
+
+def test_run_line_raises_error(base_pass):
+    base_pass.assembler.collect_errors = False
+    base_pass.process_line = mock.Mock(side_effect=AssemblyError("error"))
+    with pytest.raises(AssemblyError):
+        base_pass.run_line(mock.Mock(is_empty=False))
+
+
+def test_run_line_collects_error(base_pass):
+    base_pass.assembler.collect_errors = True
+    base_pass.program_counter = 10
+    error = AssemblyError("error")
+
+    def process_line(source_line):
+        base_pass.program_counter += 1
+        raise error
+
+    base_pass.process_line = process_line
+    source_line = mock.Mock(is_empty=False, memory_location_count=3)
+    assert base_pass.run_line(source_line) is True
+    base_pass.assembler.add_diagnostic.assert_called_once_with(
+        base_pass.name, source_line, error
+    )
+    assert base_pass.program_counter == 13
+
+
 def test_symbol_value(base_pass, symbol):
     base_pass.symbol_table.add_user_symbol(symbol, 10, 10)
     assert base_pass.symbol_value(symbol) == 10
@@ -128,20 +175,102 @@ def test_validate_value_raises_if_value_too_large(base_pass):
     assert str(exc_info.value) == "68719476736 is not a 36-bit number."
 
 
-@mock.patch("pdp10asm.passes.ExpressionParser")
-def test_literal_value(mock_ExpressionParser, base_pass):
-    return_value = base_pass.literal_value("text")
-    mock_ExpressionParser.assert_called_once_with("text", base_pass.assembler)
-    mock_ExpressionParser.return_value.as_literal.assert_called_once_with()
-    assert return_value == mock_ExpressionParser.return_value.as_literal.return_value
+def test_literal_value(base_pass):
+    base_pass.expression_value = mock.Mock(return_value=0o777)
+    assert base_pass.literal_value("text") == 0o777
+    base_pass.expression_value.assert_called_once_with("text")
+
+
+def test_literal_value_raises_for_invalid_word(base_pass):
+    base_pass.expression_value = mock.Mock(return_value=-1)
+    with pytest.raises(AssemblyError):
+        base_pass.literal_value("text")
+
+
+def test_twos_complement_value(base_pass):
+    base_pass.expression_value = mock.Mock(return_value=-1)
+    assert base_pass.twos_complement_value("text") == 0o777777777777
+    base_pass.expression_value.assert_called_once_with("text")
+
+
+def test_literal_value_uses_symbol_value(base_pass):
+    base_pass.expression_value = mock.Mock()
+    base_pass.symbol_table.add_user_symbol("FOO", 0o100, 1)
+    assert base_pass.literal_value("FOO") == 0o100
+    base_pass.expression_value.assert_not_called()
+
+
+def test_literal_value_uses_program_counter(base_pass):
+    base_pass.expression_value = mock.Mock()
+    base_pass.program_counter = 0o1000
+    assert base_pass.literal_value(".") == 0o1000
+    base_pass.expression_value.assert_not_called()
+
+
+@pytest.mark.parametrize("text", ("FOO", "FOO+1", "10"))
+def test_trivial_value_is_none_for_other_text(text, base_pass):
+    assert base_pass.trivial_value(text) is None
 
 
 @mock.patch("pdp10asm.passes.ExpressionParser")
-def test_twos_complement_value(mock_ExpressionParser, base_pass):
-    return_value = base_pass.twos_complement_value("text")
+def test_expression_value(mock_ExpressionParser, base_pass):
+    base_pass.assembler.expression_cache = None
+    return_value = base_pass.expression_value("text")
     mock_ExpressionParser.assert_called_once_with("text", base_pass.assembler)
-    mock_ExpressionParser.return_value.as_twos_complement.assert_called_once_with()
-    assert (
-        return_value
-        == mock_ExpressionParser.return_value.as_twos_complement.return_value
+    assert return_value == mock_ExpressionParser.return_value.value
+
+
+def test_expression_value_uses_expression_cache(base_pass):
+    return_value = base_pass.expression_value("text")
+    base_pass.assembler.expression_cache.value.assert_called_once_with(
+        "text", base_pass.assembler
     )
+    assert return_value == base_pass.assembler.expression_cache.value.return_value
+
+
+def test_run_line_sets_constants(base_pass):
+    base_pass.process_line = mock.Mock()
+    source_line = mock.Mock(is_empty=False, constants={"5": 5}, constants_radix=8)
+    base_pass.run_line(source_line)
+    assert base_pass.constants == {"5": 5}
+    assert base_pass.constants_radix == 8
+
+
+@pytest.mark.parametrize(
+    "constants,constants_radix,radix,expected",
+    (
+        (None, None, 8, None),
+        ({"10": 8}, 8, 8, 8),
+        ({"10": 8}, 8, 10, None),
+        ({"10": 8}, None, 10, 8),
+        ({"5": 5}, 8, 8, None),
+    ),
+)
+def test_constant_value(constants, constants_radix, radix, expected, base_pass):
+    base_pass.constants = constants
+    base_pass.constants_radix = constants_radix
+    base_pass.assembler.radix = radix
+    assert base_pass.constant_value("10") == expected
+
+
+@mock.patch("pdp10asm.passes.ExpressionParser")
+def test_literal_value_uses_constant(mock_ExpressionParser, base_pass):
+    base_pass.constants = {"10": 8}
+    assert base_pass.literal_value("10") == 8
+    mock_ExpressionParser.assert_not_called()
+
+
+@mock.patch("pdp10asm.passes.ExpressionParser")
+def test_twos_complement_value_uses_constant(mock_ExpressionParser, base_pass):
+    base_pass.constants = {"-1": -1}
+    mock_ExpressionParser.to_twos_complement.return_value = 0o777777777777
+    assert base_pass.twos_complement_value("-1") == 0o777777777777
+    mock_ExpressionParser.assert_not_called()
+    mock_ExpressionParser.to_twos_complement.assert_called_once_with(-1)
+    mock_ExpressionParser.validate_word.assert_called_once_with(0o777777777777)
+
+
+def test_literal_value_validates_constant(base_pass):
+    base_pass.constants = {"-1": -1}
+    with pytest.raises(AssemblyError):
+        base_pass.literal_value("-1")
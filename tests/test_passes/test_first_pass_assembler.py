@@ -2,6 +2,7 @@ from unittest import mock
 
 import pytest
 
+from pdp10asm.exceptions import AssemblyError
 from pdp10asm.passes import FirstPassAssembler
 from pdp10asm.symbol_table import SymbolTable
 
@@ -188,3 +189,120 @@ def test_handle_assignment_with_non_assignment(first_pass_assembler, source_line
     first_pass_assembler.handle_assignments(source_line)
     first_pass_assembler.parse_expression.assert_not_called()
     first_pass_assembler.symbol_table.add_user_symbol.assert_not_called()
+
+
+@pytest.fixture
+def assembling_pass(mock_assembler, first_pass_assembler):
+    mock_assembler.radix = 8
+    mock_assembler.collect_errors = False
+    mock_assembler.expression_cache = None
+    mock_assembler.current_pass = first_pass_assembler
+    return first_pass_assembler
+
+
+def assignment(source_line_number, symbol, value):
+    return mock.Mock(
+        is_assignment=True,
+        assignment_symbol=symbol,
+        assignment_value=value,
+        source_line_number=source_line_number,
+        text=f"{symbol}={value}",
+    )
+
+
+def symbol_value(first_pass_assembler, symbol):
+    return first_pass_assembler.symbol_table.get_symbol_value(symbol)
+
+
+def test_handle_assignment_defers_assignment_with_undefined_symbol(
+    assembling_pass,
+):
+    assembling_pass.handle_assignments(assignment(1, "A", "B+1"))
+    assert not assembling_pass.symbol_table.is_defined("A")
+    assert list(assembling_pass.assignments.pending) == ["A"]
+
+
+def test_handle_assignment_raises_for_invalid_assignment(assembling_pass):
+    with pytest.raises(AssemblyError):
+        assembling_pass.handle_assignments(assignment(1, "A", "1+"))
+    assert len(assembling_pass.assignments) == 0
+
+
+def test_deferred_assignment_removes_earlier_value(assembling_pass):
+    assembling_pass.handle_assignments(assignment(1, "A", "1"))
+    assembling_pass.handle_assignments(assignment(2, "A", "B+1"))
+    assert not assembling_pass.symbol_table.is_defined("A")
+
+
+def test_deferred_assignments_are_resolved_when_defined(assembling_pass):
+    assembling_pass.handle_assignments(assignment(1, "A", "B+1"))
+    assembling_pass.handle_assignments(assignment(2, "B", "C*2"))
+    assert len(assembling_pass.assignments) == 2
+    assembling_pass.handle_assignments(assignment(3, "C", "3"))
+    assert len(assembling_pass.assignments) == 0
+    assert symbol_value(assembling_pass, "B") == 6
+    assert symbol_value(assembling_pass, "A") == 7
+    assert assembling_pass.symbol_table.symbol_table["A"].source_line == 1
+
+
+def test_deferred_assignment_is_resolved_by_label(assembling_pass):
+    assembling_pass.handle_assignments(assignment(1, "A", "LABEL+1"))
+    assembling_pass.program_counter = 0o100
+    assembling_pass.add_label("LABEL", 2)
+    assert symbol_value(assembling_pass, "A") == 0o101
+
+
+def test_deferred_assignment_uses_its_radix_and_program_counter(assembling_pass):
+    assembling_pass.program_counter = 0o100
+    assembling_pass.assembler.radix = 10
+    assembling_pass.handle_assignments(assignment(1, "A", ".+B+10"))
+    assembling_pass.program_counter = 0o200
+    assembling_pass.assembler.radix = 8
+    assembling_pass.handle_assignments(assignment(2, "B", "10"))
+    assert symbol_value(assembling_pass, "A") == 0o100 + 8 + 10
+    assert assembling_pass.program_counter == 0o200
+    assert assembling_pass.assembler.radix == 8
+
+
+def test_redefined_symbol_replaces_deferred_assignment(assembling_pass):
+    assembling_pass.handle_assignments(assignment(1, "A", "B+1"))
+    assembling_pass.handle_assignments(assignment(2, "A", "7"))
+    assembling_pass.handle_assignments(assignment(3, "B", "1"))
+    assert symbol_value(assembling_pass, "A") == 7
+
+
+def test_check_assignments_with_undefined_symbol(assembling_pass):
+    assembling_pass.handle_assignments(assignment(1, "A", "B+1"))
+    with pytest.raises(AssemblyError, match="Symbol 'B' is not defined."):
+        assembling_pass.check_assignments()
+    assert assembling_pass.source_line_number == 1
+    assert assembling_pass.current_line == "A=B+1"
+
+
+def test_check_assignments_with_circular_assignments(assembling_pass):
+    assembling_pass.handle_assignments(assignment(1, "A", "B+1"))
+    assembling_pass.handle_assignments(assignment(2, "B", "C"))
+    assembling_pass.handle_assignments(assignment(3, "C", "A"))
+    with pytest.raises(AssemblyError, match="Circular assignment A -> B -> C -> A."):
+        assembling_pass.check_assignments()
+
+
+def test_check_assignments_collects_errors(assembling_pass):
+    assembling_pass.assembler.collect_errors = True
+    lines = [assignment(1, "A", "B"), assignment(2, "B", "A"), assignment(3, "X", "Y")]
+    for line in lines:
+        assembling_pass.handle_assignments(line)
+    assembling_pass.check_assignments()
+    calls = assembling_pass.assembler.add_diagnostic.call_args_list
+    assert [(call.args[1], str(call.args[2])) for call in calls] == [
+        (lines[0], "Circular assignment A -> B -> A."),
+        (lines[1], "Circular assignment B -> A -> B."),
+        (lines[2], "Symbol 'Y' is not defined."),
+    ]
+
+
+def test_invalid_deferred_assignment_raises_on_its_line(assembling_pass):
+    assembling_pass.handle_assignments(assignment(1, "A", "B+1"))
+    with pytest.raises(AssemblyError, match="is not a 36-bit number"):
+        assembling_pass.handle_assignments(assignment(2, "B", "777777777777"))
+    assert assembling_pass.source_line_number == 1
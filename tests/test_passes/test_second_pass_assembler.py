@@ -4,7 +4,7 @@ import pytest
 
 from pdp10asm.exceptions import AssemblyError
 from pdp10asm.passes import SecondPassAssembler
-from pdp10asm.symbol_table import SymbolTable
+from pdp10asm.symbol_table import SymbolKind, SymbolTable
 
 
 @pytest.fixture
@@ -208,9 +208,11 @@ def mock_twos_complement_value(second_pass):
 
 
 @pytest.fixture
-def mock_symbol_value(second_pass):
-    second_pass.symbol_value = mock.Mock(return_value=634)
-    return second_pass.symbol_value
+def mock_instruction(mock_symbol_table, source_line):
+    instruction = (SymbolKind.PRIMARY_INSTRUCTION, 634)
+    mock_symbol_table.instructions = {source_line.operator_id: instruction}
+    mock_symbol_table.instruction_id.return_value = source_line.operator_id
+    return instruction
 
 
 @pytest.fixture
@@ -253,7 +255,7 @@ def test_handle_pseudo_operator_with_non_second_pass_operator(
 def test_assemble_line_returns_parsed_expression_when_passed_value(
     mock_symbol_table,
     mock_twos_complement_value,
-    mock_symbol_value,
+    mock_instruction,
     mock_primary_operand_value,
     mock_io_operand_value,
     second_pass,
@@ -267,7 +269,7 @@ def test_assemble_line_returns_parsed_expression_when_passed_value(
 
 def test_assemble_line_with_primary_instruction(
     mock_symbol_table,
-    mock_symbol_value,
+    mock_instruction,
     mock_primary_operand_value,
     mock_io_operand_value,
     second_pass,
@@ -281,15 +283,27 @@ def test_assemble_line_with_primary_instruction(
         index_register=source_line.index_register,
         is_indirect=source_line.is_indirect,
     )
-    assert (
-        return_value
-        == mock_symbol_value.return_value | mock_primary_operand_value.return_value
-    )
+    assert return_value == mock_instruction[1] | mock_primary_operand_value.return_value
+
+
+def test_assemble_line_with_redefined_instruction(
+    mock_symbol_table,
+    mock_instruction,
+    mock_primary_operand_value,
+    second_pass,
+    source_line,
+):
+    source_line.is_primary_instruction = True
+    mock_symbol_table.instruction_id.return_value = 0
+    mock_symbol_table.get_symbol_value.return_value = 5
+    return_value = second_pass.assemble_line(source_line)
+    mock_symbol_table.get_symbol_value.assert_called_once_with(source_line.operator)
+    assert return_value == 5 | mock_primary_operand_value.return_value
 
 
 def test_assemble_line_with_io_instruction(
     mock_symbol_table,
-    mock_symbol_value,
+    mock_instruction,
     mock_primary_operand_value,
     mock_io_operand_value,
     second_pass,
@@ -303,17 +317,14 @@ def test_assemble_line_with_io_instruction(
         index_register=source_line.index_register,
         is_indirect=source_line.is_indirect,
     )
-    assert (
-        return_value
-        == mock_symbol_value.return_value | mock_io_operand_value.return_value
-    )
+    assert return_value == mock_instruction[1] | mock_io_operand_value.return_value
 
 
 @mock.patch("pdp10asm.passes.Characters")
 def test_assemble_line_with_text_word(
     mock_characters,
     mock_symbol_table,
-    mock_symbol_value,
+    mock_instruction,
     mock_primary_operand_value,
     mock_io_operand_value,
     second_pass,
@@ -328,7 +339,7 @@ def test_assemble_line_with_text_word(
 
 def test_assemble_line_with_invalid_instruction(
     mock_symbol_table,
-    mock_symbol_value,
+    mock_instruction,
     mock_primary_operand_value,
     mock_io_operand_value,
     second_pass,
@@ -362,13 +373,22 @@ def test_assemble_line_with_invalid_instruction(
     ),
 )
 def test_accumulator_value(mock_literal_value, value, expected, second_pass):
-    second_pass.validate_accumulator_value = mock.Mock()
     mock_literal_value.return_value = value
     assert second_pass.accumulator_value("AC") == expected
     mock_literal_value.assert_called_once_with("AC")
-    second_pass.validate_accumulator_value.assert_called_once_with(
-        mock_literal_value.return_value
-    )
+
+
+def test_accumulator_value_validates_value(mock_literal_value, second_pass):
+    mock_literal_value.return_value = 16
+    with pytest.raises(AssemblyError) as exc_info:
+        second_pass.accumulator_value("AC")
+    assert str(exc_info.value) == "0020 is not a valid accumulator."
+
+
+def test_accumulator_value_without_field(mock_literal_value, second_pass):
+    mock_literal_value.return_value = 0o17
+    with mock.patch.dict(second_pass.accumulator_fields, clear=True):
+        assert second_pass.accumulator_value("AC") == 0o000740000000
 
 
 def test_accumulator_value_with_none(second_pass):
@@ -501,13 +521,22 @@ def test_io_operand_value(
     ),
 )
 def test_index_register_value(mock_literal_value, value, expected, second_pass):
-    second_pass.validate_index_register_value = mock.Mock()
     mock_literal_value.return_value = value
     assert second_pass.index_register_value("AC") == expected
     mock_literal_value.assert_called_once_with("AC")
-    second_pass.validate_index_register_value.assert_called_once_with(
-        mock_literal_value.return_value
-    )
+
+
+def test_index_register_value_validates_value(mock_literal_value, second_pass):
+    mock_literal_value.return_value = -1
+    with pytest.raises(AssemblyError) as exc_info:
+        second_pass.index_register_value("AC")
+    assert str(exc_info.value) == "-1 is not a valid index register."
+
+
+def test_index_register_value_without_field(mock_literal_value, second_pass):
+    mock_literal_value.return_value = 0o17
+    with mock.patch.dict(second_pass.index_register_fields, clear=True):
+        assert second_pass.index_register_value("AC") == 0o000017000000
 
 
 def test_index_register_value_with_none(second_pass):
@@ -519,13 +548,22 @@ def test_index_register_value_with_none(second_pass):
 
 
 def test_device_id_value(mock_literal_value, second_pass):
-    second_pass.validate_device_id = mock.Mock()
     mock_literal_value.return_value = 0o104
     assert second_pass.device_id_value("TTY,12") == 0o010400000000
     mock_literal_value.assert_called_once_with("TTY,12")
-    second_pass.validate_device_id.assert_called_once_with(
-        mock_literal_value.return_value
-    )
+
+
+def test_device_id_value_validates_value(mock_literal_value, second_pass):
+    mock_literal_value.return_value = 0o105
+    with pytest.raises(AssemblyError) as exc_info:
+        second_pass.device_id_value("TTY,12")
+    assert str(exc_info.value) == "105 is not a valid device id."
+
+
+def test_device_id_value_without_field(mock_literal_value, second_pass):
+    mock_literal_value.return_value = 0o104
+    with mock.patch.dict(second_pass.device_id_fields, clear=True):
+        assert second_pass.device_id_value("TTY,12") == 0o010400000000
 
 
 def test_device_id_value_with_none(second_pass):
@@ -553,3 +591,13 @@ def test_validate_device_id_raises_if_too_large(second_pass):
 def test_validate_device_id_raises_if_too_small(second_pass):
     with pytest.raises(AssemblyError):
         second_pass.validate_device_id(-1)
+
+
+def test_assemble_line_uses_operator_id(mock_primary_operand_value, second_pass):
+    source_line = mock.Mock(
+        is_value=False,
+        is_primary_instruction=True,
+        operator="MOVE",
+        operator_id=second_pass.symbol_table.instruction_id("MOVE"),
+    )
+    assert second_pass.assemble_line(source_line) == 0o200000000000 | 457
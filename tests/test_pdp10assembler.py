@@ -1,11 +1,19 @@
+from array import array
 from unittest import mock
 
 import pytest
 
-from pdp10asm.assembler import PDP10Assembler
+from pdp10asm.assembler import (
+    PDP10Assembler,
+    _content_chunks,
+    _split_lines,
+    _text_lines,
+)
 from pdp10asm.exceptions import AssemblyError
+from pdp10asm.expression_cache import ExpressionCache
+from pdp10asm.parse_cache import ParseCache, ParseCacheDirectory
 from pdp10asm.passes import FirstPassAssembler, SecondPassAssembler
-from pdp10asm.program import AssembledLine, Program
+from pdp10asm.program import AssembledLine, Diagnostic, Program
 from pdp10asm.symbol_table import SymbolTable, UserSymbol
 
 
@@ -79,6 +87,67 @@ def test_assembler_has_radix(pdp10assembler):
     assert pdp10assembler.radix == 8
 
 
+def test_assembler_has_workers(pdp10assembler):
+    assert pdp10assembler.workers == 1
+
+
+def test_assembler_takes_workers(text):
+    assert PDP10Assembler(text, workers=4).workers == 4
+
+
+def test_assembler_has_no_lines(pdp10assembler):
+    assert pdp10assembler.lines is None
+
+
+def test_from_lines():
+    lines = iter(["LOC 100\n", "END\n"])
+    assembler = PDP10Assembler.from_lines(lines, workers=2)
+    assert assembler.text is None
+    assert assembler.lines is lines
+    assert assembler.workers == 2
+
+
+def test_from_path_does_not_open_file_before_parsing(tmp_path):
+    path = tmp_path / "source.asm"
+    assembler = PDP10Assembler.from_path(path)
+    path.write_text("LOC 100\nEND\n")
+    assembler.run_text_parse()
+    assert [_.text for _ in assembler.program.source_lines] == ["LOC 100", "END"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    (
+        "",
+        "\n",
+        "1",
+        "1\n",
+        "1\n2",
+        "1\n\n2\n",
+        "1\r\n2\r\n",
+        "1\r2\r",
+        "1\f\n2",
+        "1\x0c2\n\n",
+    ),
+)
+def test_text_lines_matches_splitlines(text):
+    assert list(_text_lines(text)) == text.splitlines()
+
+
+@pytest.mark.parametrize(
+    "lines,expected",
+    (
+        ([], []),
+        (["1", "", "2"], ["1", "", "2"]),
+        (["1\n", "\n", "2\n"], ["1", "", "2"]),
+        (["1\r\n", "2"], ["1", "2"]),
+        (["1\f\n", "2\n"], ["1", "", "2"]),
+    ),
+)
+def test_split_lines(lines, expected):
+    assert list(_split_lines(lines)) == expected
+
+
 def test_assembler_has_curent_pass(pdp10assembler):
     assert pdp10assembler.current_pass == pdp10assembler.first_pass
 
@@ -140,11 +209,12 @@ def test_assemble_method_sets_program_symbols(
     mock_run_second_pass_assembly,
     pdp10assembler,
 ):
-    pdp10assembler.symbol_table = mock.Mock()
+    pdp10assembler.symbol_table.add_user_symbol("FOO", 5, 1)
     pdp10assembler.assemble()
+    assert pdp10assembler.program.symbols == pdp10assembler.symbol_table.user_symbols()
     assert (
-        pdp10assembler.program.symbols
-        == pdp10assembler.symbol_table.user_symbols.return_value
+        pdp10assembler.program.symbol_index
+        is not pdp10assembler.symbol_table.user_symbol_index
     )
 
 
@@ -162,6 +232,14 @@ def test_run_text_parse(mock_parse_text, pdp10assembler):
     mock_parse_text.assert_called_once_with(pdp10assembler.text)
 
 
+def test_run_text_parse_with_lines(mock_parse_text):
+    assembler = PDP10Assembler.from_lines(["1\n", "2\n"])
+    assembler.parse_lines = mock.Mock()
+    assembler.run_text_parse()
+    assert list(assembler.parse_lines.call_args.args[0]) == ["1", "2"]
+    assert assembler.program.source_lines == assembler.parse_lines.return_value
+
+
 def test_run_text_parse_with_error(mock_parse_text, pdp10assembler):
     pdp10assembler.current_pass = mock_parse_text
     mock_parse_text.source_line_number = 12
@@ -235,6 +313,328 @@ def test_parse_text(mock_SourceLine, pdp10assembler):
     assert return_value == [mock_SourceLine.return_value] * 3
 
 
+@mock.patch("pdp10asm.assembler.SourceLine")
+def test_parse_text_does_not_use_workers_for_short_text(mock_SourceLine, text):
+    assembler = PDP10Assembler(text, workers=4)
+    assembler._parse_chunks_in_parallel = mock.Mock()
+    assembler.parse_text("1\n2\n3\n")
+    assembler._parse_chunks_in_parallel.assert_not_called()
+    assert mock_SourceLine.call_count == 3
+
+
+def test_parse_text_uses_workers_for_long_text(text):
+    assembler = PDP10Assembler(text, workers=4)
+    assembler.parse_chunk_size = 2
+    assembler._parse_chunks_in_parallel = mock.Mock()
+    return_value = assembler.parse_text("1\n2\n3\n")
+    chunks = assembler._parse_chunks_in_parallel.call_args.args[0]
+    assert list(chunks) == [(["1", "2"], 1), (["3"], 3)]
+    assert return_value == assembler._parse_chunks_in_parallel.return_value
+
+
+def test_parse_lines_numbers_lines_from_first_line_number(pdp10assembler):
+    source_lines = pdp10assembler.parse_lines(["1", "2"], first_line_number=10)
+    assert [_.source_line_number for _ in source_lines] == [10, 11]
+
+
+def test_has_parse_cache(pdp10assembler):
+    assert isinstance(pdp10assembler.parse_cache, ParseCache)
+    assert pdp10assembler.parse_cache.maxsize == ParseCache.default_maxsize
+
+
+def test_parse_cache_size_kwarg():
+    assert PDP10Assembler("", parse_cache_size=10).parse_cache.maxsize == 10
+
+
+def test_parse_cache_can_be_disabled():
+    assert PDP10Assembler("", parse_cache_size=0).parse_cache is None
+
+
+def test_parse_text_reuses_repeated_lines():
+    assembler = PDP10Assembler("LOOP: JRST LOOP\n JRST LOOP\n JRST LOOP ; again")
+    assembler.parse_text(assembler.text)
+    assert assembler.parse_cache.hits == 2
+    assert assembler.parse_cache.misses == 1
+
+
+def test_has_expression_cache(pdp10assembler):
+    assert isinstance(pdp10assembler.expression_cache, ExpressionCache)
+    assert pdp10assembler.expression_cache.maxsize == ExpressionCache.default_maxsize
+
+
+def test_expression_cache_size_kwarg():
+    assembler = PDP10Assembler("", expression_cache_size=10)
+    assert assembler.expression_cache.maxsize == 10
+
+
+def test_expression_cache_can_be_disabled():
+    assert PDP10Assembler("", expression_cache_size=0).expression_cache is None
+
+
+def test_has_no_parse_cache_dir_by_default(pdp10assembler):
+    assert pdp10assembler.parse_cache_dir is None
+
+
+def test_cache_dir_kwarg(tmp_path):
+    assembler = PDP10Assembler("", cache_dir=tmp_path)
+    assert isinstance(assembler.parse_cache_dir, ParseCacheDirectory)
+    assert assembler.parse_cache_dir.path == tmp_path
+
+
+@pytest.mark.parametrize("size", (1, 2, 3, 10))
+def test_content_chunks(size):
+    lines = [f"LINE {i}" for i in range(40)]
+    chunks = list(_content_chunks(lines, 5, size))
+    assert [line for chunk, _ in chunks for line in chunk] == lines
+    assert [number for _, number in chunks] == [
+        5 + sum(len(chunk) for chunk, _ in chunks[:i]) for i in range(len(chunks))
+    ]
+    assert all(size // 2 <= len(chunk) <= size * 4 for chunk, _ in chunks[:-1])
+
+
+def test_content_chunks_are_resynchronised_after_an_insertion():
+    lines = [f"LINE {i}" for i in range(200)]
+    chunks = [chunk for chunk, _ in _content_chunks(lines, 1, 10)]
+    edited = lines[:50] + ["INSERTED"] + lines[50:]
+    edited_chunks = [chunk for chunk, _ in _content_chunks(edited, 1, 10)]
+    assert len([chunk for chunk in edited_chunks if chunk not in chunks]) == 1
+
+
+def _source_line_state(source_line):
+    return {
+        name: getattr(source_line, name)
+        for name in source_line.__slots__
+        if name not in ("assembler", "_assembled_line")
+    }
+
+
+@pytest.mark.integration_test
+def test_parallel_parse_matches_serial_parse(memory_to_paper_tape_raw_text):
+    serial = PDP10Assembler(memory_to_paper_tape_raw_text)
+    parallel = PDP10Assembler(memory_to_paper_tape_raw_text, workers=2)
+    parallel.parse_chunk_size = 4
+    serial_lines = serial.parse_text(serial.text)
+    parallel_lines = parallel.parse_text(parallel.text)
+    assert len(parallel_lines) == len(serial_lines)
+    for serial_line, parallel_line in zip(serial_lines, parallel_lines, strict=True):
+        assert parallel_line.assembler is parallel
+        assert _source_line_state(parallel_line) == _source_line_state(serial_line)
+
+
+@pytest.mark.integration_test
+def test_parallel_parse_records_parse_cache_hits():
+    assembler = PDP10Assembler("JRST 0\n" * 6, workers=2)
+    assembler.parse_chunk_size = 3
+    assembler.parse_text(assembler.text)
+    assert assembler.parse_cache.hits == 4
+    assert assembler.parse_cache.misses == 2
+
+
+@pytest.mark.integration_test
+def test_parallel_assembly_matches_serial_assembly(hello_world_text):
+    serial = PDP10Assembler(hello_world_text).assemble()
+    assembler = PDP10Assembler(hello_world_text, workers=2)
+    assembler.parse_chunk_size = 5
+    parallel = assembler.assemble()
+    assert parallel.listing_text() == serial.listing_text()
+
+
+@pytest.mark.integration_test
+def test_assembly_from_path_matches_assembly_from_text(tmp_path, hello_world_text):
+    path = tmp_path / "hello_world.asm"
+    path.write_text(hello_world_text)
+    expected = PDP10Assembler(hello_world_text).assemble()
+    program = PDP10Assembler.from_path(path).assemble()
+    assert program.listing_text() == expected.listing_text()
+
+
+@pytest.mark.integration_test
+def test_parallel_assembly_from_lines_matches_serial_assembly(hello_world_text):
+    expected = PDP10Assembler(hello_world_text).assemble()
+    lines = iter(hello_world_text.splitlines(keepends=True))
+    assembler = PDP10Assembler.from_lines(lines, workers=2)
+    assembler.parse_chunk_size = 3
+    assert assembler.assemble().listing_text() == expected.listing_text()
+
+
+@pytest.mark.integration_test
+def test_assembly_with_cache_dir_matches_assembly(tmp_path, hello_world_text):
+    expected = PDP10Assembler(hello_world_text).assemble()
+    for chunks_loaded in (0, 1):
+        assembler = PDP10Assembler(hello_world_text, cache_dir=tmp_path)
+        assembler.parse_chunk_size = 4
+        assert assembler.assemble().listing_text() == expected.listing_text()
+        assert bool(assembler.parse_cache_dir.hits) is bool(chunks_loaded)
+    assert assembler.parse_cache_dir.misses == 0
+
+
+@pytest.mark.integration_test
+def test_assembly_with_cache_dir_reparses_edited_chunks(tmp_path, hello_world_text):
+    PDP10Assembler(hello_world_text, cache_dir=tmp_path).assemble()
+    text = hello_world_text.replace("; ", ";; ", 1)
+    expected = PDP10Assembler(text).assemble()
+    assembler = PDP10Assembler(text, cache_dir=tmp_path)
+    assert assembler.assemble().listing_text() == expected.listing_text()
+    assert assembler.parse_cache_dir.misses == 1
+
+
+@pytest.mark.integration_test
+def test_assembly_with_cache_dir_parses_chunks_in_workers(tmp_path, hello_world_text):
+    expected = PDP10Assembler(hello_world_text).assemble()
+    for chunks_loaded in (False, True):
+        assembler = PDP10Assembler(hello_world_text, workers=2, cache_dir=tmp_path)
+        assembler.parse_chunk_size = 4
+        with mock.patch.object(
+            assembler,
+            "_parse_chunks_in_workers",
+            wraps=assembler._parse_chunks_in_workers,
+        ) as parse_chunks_in_workers:
+            assert assembler.assemble().listing_text() == expected.listing_text()
+        assert parse_chunks_in_workers.called is not chunks_loaded
+        assert bool(assembler.parse_cache_dir.misses) is not chunks_loaded
+
+
+@pytest.mark.integration_test
+def test_assembly_with_cache_dir_parses_one_edited_chunk_without_workers(
+    tmp_path, hello_world_text
+):
+    PDP10Assembler(hello_world_text, cache_dir=tmp_path).assemble()
+    text = hello_world_text.replace("; ", ";; ", 1)
+    expected = PDP10Assembler(text).assemble()
+    assembler = PDP10Assembler(text, workers=2, cache_dir=tmp_path)
+    assembler._parse_chunks_in_workers = mock.Mock()
+    assert assembler.assemble().listing_text() == expected.listing_text()
+    assert assembler.parse_cache_dir.misses == 1
+    assembler._parse_chunks_in_workers.assert_not_called()
+
+
+@pytest.mark.integration_test
+def test_parallel_parse_raises_assembly_error():
+    assembler = PDP10Assembler("LOC 100\n500: MOVE 1,2\nEND", workers=2)
+    assembler.parse_chunk_size = 1
+    with pytest.raises(AssemblyError) as exc_info:
+        assembler.run_text_parse()
+    assert str(exc_info.value) == "Invalid label '500'."
+
+
+def test_collect_errors_default(pdp10assembler):
+    assert pdp10assembler.collect_errors is False
+
+
+def test_add_diagnostic(pdp10assembler):
+    source_line = mock.Mock(source_line_number=4, text="  MOVE 1,FOO ")
+    pdp10assembler.add_diagnostic("second pass", source_line, AssemblyError("error"))
+    (diagnostic,) = pdp10assembler.program.diagnostics
+    assert isinstance(diagnostic, Diagnostic)
+    assert diagnostic.source_line_number == 4
+    assert diagnostic.pass_name == "second pass"
+    assert diagnostic.message == "error"
+    assert diagnostic.text == "MOVE 1,FOO"
+
+
+def test_parse_text_collects_errors():
+    assembler = PDP10Assembler("", collect_errors=True)
+    source_lines = assembler.parse_text("MOVE 1,2\n500: MOVE 1,2\nX=")
+    assert [line.is_empty for line in source_lines] == [False, True, True]
+    assert [line.text for line in source_lines] == ["MOVE 1,2", "500: MOVE 1,2", "X="]
+    assert [
+        (diagnostic.source_line_number, diagnostic.pass_name, diagnostic.message)
+        for diagnostic in assembler.program.diagnostics
+    ] == [
+        (2, "source processing", "Invalid label '500'."),
+        (3, "source processing", "Invalid assignment 'X='."),
+    ]
+
+
+@pytest.fixture
+def error_text():
+    return "\n".join(
+        (
+            "LOC 100",
+            "MOVE 1,FOO",
+            "X=",
+            "MOVEI 2,3",
+            "JRST 7777777",
+            "DATAO 777,0",
+            "HALT",
+            "END",
+        )
+    )
+
+
+@pytest.fixture
+def error_diagnostics():
+    return [
+        (3, "source processing", "Invalid assignment 'X='."),
+        (2, "second pass", "Symbol 'FOO' is not defined."),
+        (5, "second pass", "7777777 is not a valid memory address."),
+        (6, "second pass", "777 is not a valid device id."),
+    ]
+
+
+def _diagnostics(program):
+    return [
+        (diagnostic.source_line_number, diagnostic.pass_name, diagnostic.message)
+        for diagnostic in program.diagnostics
+    ]
+
+
+@pytest.mark.integration_test
+def test_assembly_collects_errors(error_text, error_diagnostics):
+    program = PDP10Assembler(error_text, collect_errors=True).assemble()
+    assert _diagnostics(program) == error_diagnostics
+    assert {
+        memory_location: assembled_line.source_line.source_line_number
+        for memory_location, assembled_line in program.by_memory_location.items()
+    } == {0o101: 4, 0o104: 7}
+
+
+@pytest.mark.integration_test
+def test_parallel_assembly_collects_errors(error_text, error_diagnostics):
+    assembler = PDP10Assembler(error_text, workers=2, collect_errors=True)
+    assembler.parse_chunk_size = 2
+    assert _diagnostics(assembler.assemble()) == error_diagnostics
+
+
+@pytest.mark.integration_test
+def test_columnar_assembly_collects_errors(error_text, error_diagnostics):
+    assembler = PDP10Assembler(error_text, columnar=True, collect_errors=True)
+    assert _diagnostics(assembler.assemble()) == error_diagnostics
+
+
+@pytest.mark.integration_test
+def test_cache_dir_does_not_store_chunks_with_errors(
+    tmp_path, error_text, error_diagnostics
+):
+    for _ in range(2):
+        assembler = PDP10Assembler(error_text, cache_dir=tmp_path, collect_errors=True)
+        assert _diagnostics(assembler.assemble()) == error_diagnostics
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.integration_test
+def test_cache_dir_with_workers_collects_errors(
+    tmp_path, error_text, error_diagnostics
+):
+    for chunks_loaded in (False, True):
+        assembler = PDP10Assembler(
+            error_text, workers=2, cache_dir=tmp_path, collect_errors=True
+        )
+        assembler.parse_chunk_size = 2
+        assert _diagnostics(assembler.assemble()) == error_diagnostics
+        assert bool(assembler.parse_cache_dir.hits) is chunks_loaded
+
+
+@pytest.mark.integration_test
+def test_assembly_without_errors_has_no_diagnostics(hello_world_text):
+    program = PDP10Assembler(hello_world_text, collect_errors=True).assemble()
+    assert program.diagnostics == []
+    assert (
+        program.listing_text()
+        == PDP10Assembler(hello_world_text).assemble().listing_text()
+    )
+
+
 # Integration Tests
 @pytest.fixture
 def test_symbol():
@@ -521,3 +921,89 @@ def test_assembly_with_sixbit_pseudo_op(assembly_test):
         0o102: 0b000001000000000000000000000000000000,
     }
     assembly_test(text, symbols, program_values)
+
+
+@pytest.mark.integration_test
+def test_assembly_with_constants_after_radix_change(assembly_test):
+    text = """LOC 100
+        MOVEI 1,10
+        RADIX 10
+        MOVEI 1,10
+        MOVEI 1,^O10
+        END
+    """
+    symbols = []
+    program_values = {
+        0o100: 0o201040000010,
+        0o101: 0o201040000012,
+        0o102: 0o201040000010,
+    }
+    assembly_test(text, symbols, program_values)
+
+
+@pytest.mark.integration_test
+def test_assembly_with_forward_referencing_assignments(assembly_test):
+    text = """LOC 100
+        A=B+1
+        B=C*2
+        MOVEI 1,A
+C:      MOVEI 2,B
+        END
+    """
+    symbols = [("C", 0o101, 5), ("B", 0o202, 3), ("A", 0o203, 2)]
+    program_values = {0o100: 0o201040000203, 0o101: 0o201100000202}
+    assembly_test(text, symbols, program_values)
+
+
+@pytest.mark.integration_test
+def test_assembly_with_redefined_instruction(assembly_test):
+    text = """LOC 100
+        MOVE 1,2
+        MOVE=5
+        MOVE 1,2
+        END
+    """
+    symbols = [("MOVE", 5, 3)]
+    program_values = {0o100: 0o000040000007, 0o101: 0o000040000007}
+    assembly_test(text, symbols, program_values)
+
+
+@pytest.mark.integration_test
+def test_assembly_with_circular_assignments():
+    text = """LOC 100
+        A=B+1
+        B=A+1
+        END
+    """
+    with pytest.raises(AssemblyError) as exc_info:
+        PDP10Assembler(text).assemble()
+    assert exc_info.value.__notes__[-1] == "Circular assignment A -> B -> A."
+
+
+@pytest.mark.integration_test
+def test_assembly_records_references():
+    text = """        LOC 100
+        A=B+1
+        B=C*2
+LOOP:   MOVE 1,A
+C:      MOVE 1,LOOP+<C*C>
+        DATAO TTY,LOOP
+        EXP LOOP,A,2
+        POINT 6,LOOP,5
+        JRST LOOP
+        END
+    """
+    program = PDP10Assembler(text).assemble()
+    assert program.references("LOOP") == array("L", [5, 6, 7, 8, 9])
+    assert program.references("C") == array("L", [3, 5])
+    assert program.references("A") == array("L", [4, 7])
+    assert program.references("B") == array("L", [2])
+    assert program.references("TTY") == array("L", [6])
+    assert program.references("MOVE") == array("L")
+
+
+@pytest.mark.integration_test
+def test_references_are_recorded_for_cached_expressions():
+    text = "\n".join(["LOOP:   MOVE 1,LOOP+1"] * 4)
+    program = PDP10Assembler(text).assemble()
+    assert program.references("LOOP") == array("L", [1, 2, 3, 4])
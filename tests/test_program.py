@@ -3,7 +3,8 @@ from unittest import mock
 import pytest
 
 from pdp10asm.exceptions import AssemblyError
-from pdp10asm.program import AssembledLine, Program
+from pdp10asm.program import AssembledLine, Diagnostic, Program
+from pdp10asm.symbol_table import SymbolTable
 
 
 @pytest.fixture
@@ -45,6 +46,14 @@ def test_program_has_symbols():
     assert Program().symbols == {}
 
 
+def test_program_has_no_references():
+    assert list(Program().references("LOOP")) == []
+
+
+def test_program_has_diagnostics():
+    assert Program().diagnostics == []
+
+
 def test_add_line_returns_assembled_line(source_line, memory_location, binary_value):
     returned_value = Program().add_line(
         source_line=source_line,
@@ -90,7 +99,7 @@ def test_listing_text_returns_listing():
     listing_class = mock.Mock()
     returned_value = program.listing_text(listing_class=listing_class, radix=16)
     assert returned_value == listing_class.return_value.listing_text.return_value
-    listing_class.assert_called_once_with(program, radix=16)
+    listing_class.assert_called_once_with(program, radix=16, symbol_order="defined")
     listing_class.return_value.listing_text.assert_called_once_with()
 
 
@@ -99,5 +108,59 @@ def test_listng_text_uses_defaults(mock_listing):
     program = Program()
     returned_value = program.listing_text()
     assert returned_value == mock_listing.return_value.listing_text.return_value
-    mock_listing.assert_called_once_with(program, radix=8)
+    mock_listing.assert_called_once_with(program, radix=8, symbol_order="defined")
     mock_listing.return_value.listing_text.assert_called_once_with()
+
+
+def test_listing_text_passes_symbol_order():
+    program = Program()
+    listing_class = mock.Mock()
+    program.listing_text(listing_class=listing_class, symbol_order="name")
+    listing_class.assert_called_once_with(program, radix=8, symbol_order="name")
+
+
+def test_set_symbols():
+    symbol_table = SymbolTable()
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    program = Program()
+    program.set_symbols(symbol_table)
+    symbol_table.add_user_symbol("BAR", 4, 2)
+    assert [symbol.name for symbol in program.symbols] == ["FOO"]
+    assert [symbol.name for symbol in program.symbols_by_name()] == ["FOO"]
+
+
+def test_symbols_by_name_and_value():
+    symbol_table = SymbolTable()
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    symbol_table.add_user_symbol("BAR", 6, 2)
+    program = Program()
+    program.set_symbols(symbol_table)
+    assert [symbol.name for symbol in program.symbols_by_name()] == ["BAR", "FOO"]
+    assert [symbol.name for symbol in program.symbols_by_value()] == ["FOO", "BAR"]
+
+
+@pytest.fixture
+def diagnostic():
+    return Diagnostic(
+        source_line_number=3,
+        pass_name="second pass",
+        message="Symbol 'FOO' is not defined.",
+        text="MOVE 1,FOO",
+    )
+
+
+def test_diagnostic_has_attributes(diagnostic):
+    assert diagnostic.source_line_number == 3
+    assert diagnostic.pass_name == "second pass"
+    assert diagnostic.message == "Symbol 'FOO' is not defined."
+    assert diagnostic.text == "MOVE 1,FOO"
+
+
+def test_diagnostic_repr(diagnostic):
+    assert repr(diagnostic) == "<Diagnostic: 3>"
+
+
+def test_diagnostic_str(diagnostic):
+    assert str(diagnostic) == (
+        "During second pass on line 3:\n'MOVE 1,FOO'\nSymbol 'FOO' is not defined."
+    )
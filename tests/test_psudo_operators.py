@@ -185,6 +185,28 @@ def test_byte_get_binary_values(length, values, expected):
     assert po.Byte.get_binary_values(length, values) == expected
 
 
+def test_exp_process_with_expressions(mock_assembler):
+    mock_assembler.symbol_table.get_symbol_value.return_value = 5
+    source_line = mock.Mock(arguments="FOO,FOO+1,-1")
+    po.Exp.process(mock_assembler, source_line)
+    mock_assembler.current_pass.add_instructions.assert_called_once_with(
+        source_line=source_line, binary_values=[5, 6, 0o777777777777]
+    )
+
+
+def test_byte_process_evaluates_values_text_once(mock_assembler):
+    source_line = mock.Mock(arguments="(18) 1,FOO")
+    mock_assembler.symbol_table.get_symbol_value.return_value = 2
+    with mock.patch.object(
+        po, "ExpressionListParser", wraps=po.ExpressionListParser
+    ) as parser:
+        po.Byte.process(mock_assembler, source_line)
+    parser.assert_called_once_with(" 1,FOO", mock_assembler)
+    mock_assembler.current_pass.add_instructions.assert_called_once_with(
+        source_line=source_line, binary_values=[0o000001000002]
+    )
+
+
 def test_byte_process(mock_assembler):
     source_line = mock.Mock(arguments="(18) 1,1,1,1+1")
     po.Byte.process(mock_assembler, source_line)
@@ -196,8 +218,8 @@ def test_byte_process(mock_assembler):
 @pytest.mark.parametrize(
     "argument,length,value",
     (
-        ("(18) 1,2,3, 4", 18, ["1", "2", "3", "4"]),
-        ("(3)1,2,3+5", 3, ["1", "2", "3+5"]),
+        ("(18) 1,2,3, 4", 18, " 1,2,3, 4"),
+        ("(3)1,2,3+5", 3, "1,2,3+5"),
     ),
 )
 def test_byte_parse_with_valid_argument(argument, length, value):
@@ -1,10 +1,14 @@
+import pickle
 from unittest import mock
 
 import pytest
 
 from pdp10asm.assembler import PDP10Assembler
 from pdp10asm.exceptions import AssemblyError
+from pdp10asm.parse_cache import ParseCache
+from pdp10asm.program import AssembledLine
 from pdp10asm.source_line import SourceLine
+from pdp10asm.symbol_table import SymbolKind
 
 
 @pytest.fixture
@@ -20,7 +24,9 @@ def source_line_number():
 @pytest.fixture
 def source_line(text, source_line_number):
     return SourceLine(
-        assembler=mock.Mock(), source_line_number=source_line_number, text=text
+        assembler=mock.Mock(parse_cache=None, radix=8),
+        source_line_number=source_line_number,
+        text=text,
     )
 
 
@@ -32,64 +38,139 @@ def test_has_memory_location_count(source_line):
     assert source_line.memory_location_count == 0
 
 
+def test_has_no_labels(source_line):
+    assert source_line.labels == ()
+
+
+def test_does_not_have_a_dict(source_line):
+    assert not hasattr(source_line, "__dict__")
+
+
+def test_assembled_line_is_created_when_needed(source_line):
+    assert source_line._assembled_line is None
+    assembled_line = source_line.assembled_line
+    assert isinstance(assembled_line, AssembledLine)
+    assert assembled_line.source_line is source_line
+    assert assembled_line.memory_location is None
+    assert assembled_line.binary_value is None
+    assert source_line.assembled_line is assembled_line
+
+
+def test_assembled_line_can_be_set(source_line):
+    assembled_line = AssembledLine(source_line, 0o100, 0o777)
+    assert source_line.assembled_line is assembled_line
+
+
+def test_pickle_does_not_include_assembler(source_line_number):
+    source_line = SourceLine(
+        assembler=PDP10Assembler(""),
+        source_line_number=source_line_number,
+        text="LABEL: MOVE 1,2",
+    )
+    source_line.read_text()
+    unpickled = pickle.loads(pickle.dumps(source_line))
+    assert unpickled.assembler is None
+    assert unpickled.text == source_line.text
+    assert unpickled.operator == source_line.operator
+    assert unpickled.labels == source_line.labels
+
+
+def test_copy(source_line_number):
+    source_line = SourceLine(
+        assembler=PDP10Assembler(""),
+        source_line_number=source_line_number,
+        text="LABEL: MOVE 1,2",
+    )
+    source_line.read_text()
+    AssembledLine(source_line, 0o100, 0o777)
+    copy = source_line.copy(source_line_number + 1)
+    assert copy.source_line_number == source_line_number + 1
+    assert copy._assembled_line is None
+    assert source_line.source_line_number == source_line_number
+    assert source_line.assembled_line.memory_location == 0o100
+    for name in SourceLine.__slots__:
+        if name not in ("source_line_number", "_assembled_line"):
+            assert getattr(copy, name) == getattr(source_line, name)
+
+
 @pytest.mark.parametrize(
-    "string,return_value,comment",
+    "string,comment",
     (
-        ("", "", None),
-        ("FOO BAR", "FOO BAR", None),
-        ("FOO", "FOO", None),
-        ("FOO BAR ; some comment", "FOO BAR", "some comment"),
-        (";", "", ""),
-        ("; some comment", "", "some comment"),
-        ("   ;   some comment", "", "some comment"),
+        ("", None),
+        ("FOO BAR", None),
+        ("FOO", None),
+        ("FOO BAR ; some comment", "some comment"),
+        (";", ""),
+        ("; some comment", "some comment"),
+        ("   ;   some comment", "some comment"),
+        ("FOO ; some; comment ", "some; comment"),
     ),
 )
-def test_read_comment(string, return_value, comment, source_line):
-    assert source_line._read_comment(string) == return_value
+def test_read_fields_reads_comment(string, comment, source_line):
+    source_line._read_fields(string)
     assert source_line.comment == comment
 
 
 @pytest.mark.parametrize(
-    "string,labels,return_value",
+    "string,is_empty",
     (
-        ("", [], ""),
-        ("LABEL:", ["LABEL"], ""),
-        ("HELLO:", ["HELLO"], ""),
-        (".LAB:", [".LAB"], ""),
-        ("L.AB:", ["L.AB"], ""),
-        ("LAB.:", ["LAB."], ""),
-        ("%LAB:", ["%LAB"], ""),
-        ("LAB%:", ["LAB%"], ""),
-        ("LA%B:", ["LA%B"], ""),
-        ("F500:", ["F500"], ""),
-        ("LABEL: more text", ["LABEL"], "more text"),
-        ("LABEL: LABEL2: more text", ["LABEL", "LABEL2"], "more text"),
-        ("LABEL:LABEL2: more text", ["LABEL", "LABEL2"], "more text"),
+        ("", True),
+        ("   ", True),
+        ("; some comment", True),
+        ("LABEL:", False),
+        ("FOO", False),
+        ("  FOO ; some comment", False),
     ),
 )
-def test_read_labels(string, labels, return_value, source_line):
-    assert source_line._read_labels(string) == return_value
+def test_read_fields_sets_is_empty(string, is_empty, source_line):
+    source_line._read_fields(string)
+    assert source_line.is_empty is is_empty
+
+
+@pytest.mark.parametrize(
+    "string,labels,instruction_text",
+    (
+        ("", (), None),
+        ("LABEL:", ("LABEL",), None),
+        ("HELLO:", ("HELLO",), None),
+        (".LAB:", (".LAB",), None),
+        ("L.AB:", ("L.AB",), None),
+        ("LAB.:", ("LAB.",), None),
+        ("%LAB:", ("%LAB",), None),
+        ("LAB%:", ("LAB%",), None),
+        ("LA%B:", ("LA%B",), None),
+        ("F500:", ("F500",), None),
+        ("LABEL: more text", ("LABEL",), "more text"),
+        ("LABEL: LABEL2: more text", ("LABEL", "LABEL2"), "more text"),
+        ("LABEL:LABEL2: more text", ("LABEL", "LABEL2"), "more text"),
+        ("  LABEL:  more  text  ; comment: text", ("LABEL",), "more  text"),
+    ),
+)
+def test_read_fields_reads_labels(string, labels, instruction_text, source_line):
+    source_line._read_fields(string)
     assert source_line.labels == labels
+    assert source_line.instruction_text == instruction_text
 
 
-def test_read_labels_sets_instruction_text(source_line):
-    source_line._read_labels("LABEL: MOV 200")
+def test_read_fields_sets_instruction_text(source_line):
+    source_line._read_fields("LABEL: MOV 200")
     assert source_line.instruction_text == "MOV 200"
 
 
-def test_read_assignment_with_assignment(source_line):
+def test_read_fields_with_assignment(source_line):
     text = "A= B"
-    assert source_line._read_assignment(text) == ""
+    assert source_line._read_fields(text) == ""
     assert source_line.is_assignment is True
     assert source_line.is_text_word is False
     assert source_line.memory_location_count == 0
     assert source_line.assignment_symbol == "A"
     assert source_line.assignment_value == "B"
+    assert source_line.operator is None
 
 
-def test_read_assignment_with_non_assignment(source_line):
+def test_read_fields_with_non_assignment(source_line):
     text = "A: B"
-    assert source_line._read_assignment(text) == text
+    assert source_line._read_fields(text) == ""
     assert source_line.is_assignment is False
     assert source_line.is_text_word is False
     assert source_line.memory_location_count == 0
@@ -97,13 +178,14 @@ def test_read_assignment_with_non_assignment(source_line):
     assert source_line.assignment_value is None
 
 
-def test_read_assignment_with_empty_string(source_line):
-    assert source_line._read_assignment("") == ""
+def test_read_fields_with_empty_string(source_line):
+    assert source_line._read_fields("") == ""
     assert source_line.is_assignment is False
     assert source_line.is_text_word is False
     assert source_line.memory_location_count == 0
     assert source_line.assignment_symbol is None
     assert source_line.assignment_value is None
+    assert source_line.operator is None
 
 
 @pytest.mark.parametrize(
@@ -112,22 +194,23 @@ def test_read_assignment_with_empty_string(source_line):
         ("A=B", "A", "B"),
         ("A= B", "A", "B"),
         ("LABEL= VALUE WORDS", "LABEL", "VALUE WORDS"),
+        ("LABEL: A=B ; comment", "A", "B"),
     ),
 )
-def test_read_assignment_with_valid_assignment(string, symbol, value, source_line):
-    assert source_line._read_assignment(string) == ""
+def test_read_fields_with_valid_assignment(string, symbol, value, source_line):
+    assert source_line._read_fields(string) == ""
     assert source_line.assignment_symbol == symbol
     assert source_line.assignment_value == value
 
 
 @pytest.mark.parametrize(
-    "string,",
+    "string",
     (("A="), ("A= "), ("=B"), (" = B")),
 )
-def test_read_assignment_with_invalid_assignment(string, source_line):
+def test_read_fields_with_invalid_assignment(string, source_line):
     with pytest.raises(AssemblyError) as exc_info:
-        source_line._read_assignment(string)
-    assert str(exc_info.value) == f"Invalid assignment {string!r}."
+        source_line._read_fields(string)
+    assert str(exc_info.value) == f"Invalid assignment {string.strip()!r}."
 
 
 @pytest.mark.parametrize(
@@ -139,8 +222,8 @@ def test_read_assignment_with_invalid_assignment(string, source_line):
         ("A = B", False),
     ),
 )
-def test_read_assignment_finds_valid_labels(string, expected, source_line):
-    source_line._read_assignment(string)
+def test_read_fields_finds_valid_assignments(string, expected, source_line):
+    source_line._read_fields(string)
     assert source_line.is_assignment is expected
 
 
@@ -151,11 +234,12 @@ def test_read_assignment_finds_valid_labels(string, expected, source_line):
         ("TTY,50:", "TTY,50"),
         ("AB@C:", "AB@C"),
         ("LABEL:AB@C:", "AB@C"),
+        (" : MOVE", ""),
     ),
 )
-def test_read_labels_raises_for_invalid_label(string, error_text, source_line):
+def test_read_fields_raises_for_invalid_label(string, error_text, source_line):
     with pytest.raises(AssemblyError) as exc_info:
-        source_line._read_labels(string)
+        source_line._read_fields(string)
     assert str(exc_info.value) == f"Invalid label {error_text!r}."
 
 
@@ -166,23 +250,25 @@ def test_read_labels_raises_for_invalid_label(string, error_text, source_line):
         ("MOVE AC0,@13", "MOVE", "AC0,@13"),
         ("BYTE 890 3993 288", "BYTE", "890 3993 288"),
         ("7000", "7000", ""),
+        ("  7000  ; comment", "7000", ""),
+        ("  MOVE   1, 2  ; comment", "MOVE", "1, 2"),
         ('"WOR D"', '"WOR D"', ""),
         ("'WOR D'", "'WOR D'", ""),
     ),
 )
-def test_read_operator(string, operator, return_value, source_line):
-    assert source_line._read_operator(string) == return_value
+def test_read_fields_reads_operator(string, operator, return_value, source_line):
+    assert source_line._read_fields(string) == return_value
     assert source_line.operator == operator
 
 
-def test_read_operator_handles_seven_bit_text_word(source_line):
-    source_line._read_operator('"WOR D"')
+def test_read_fields_handles_seven_bit_text_word(source_line):
+    source_line._read_fields('"WOR D"')
     assert source_line.is_text_word is True
     assert source_line.is_value is True
 
 
-def test_read_operator_handles_six_bit_text_word(source_line):
-    source_line._read_operator("'WOR D'")
+def test_read_fields_handles_six_bit_text_word(source_line):
+    source_line._read_fields("'WOR D'")
     assert source_line.is_text_word is True
     assert source_line.is_value is True
 
@@ -216,11 +302,22 @@ def test_parse_instruction_type_with_pseudo_operator(
     assert source_line.is_value is False
 
 
-def test_parse_instruction_type_with_primary_instruction(source_line):
+@pytest.fixture
+def mock_instructions(source_line):
+    symbol_table = source_line.assembler.symbol_table
+    symbol_table.instruction_id.return_value = 5
+    symbol_table.instructions = {}
+    return symbol_table.instructions
+
+
+def test_parse_instruction_type_with_primary_instruction(
+    mock_instructions, source_line
+):
     source_line.operator = "text"
-    source_line.assembler.pseudo_operators.is_pseudo_operator.return_value = False
-    source_line.assembler.symbol_table.is_primary_instruction_symbol.return_value = True
+    mock_instructions[5] = (SymbolKind.PRIMARY_INSTRUCTION, 0o200000000000)
     source_line._parse_instruction_type("")
+    source_line.assembler.symbol_table.instruction_id.assert_called_once_with("text")
+    assert source_line.operator_id == 5
     assert source_line.is_pseudo_operator is False
     assert source_line.is_assignment is False
     assert source_line.is_instruction is True
@@ -231,14 +328,11 @@ def test_parse_instruction_type_with_primary_instruction(source_line):
     assert source_line.is_value is False
 
 
-def test_parse_instruction_type_with_io_instruction(source_line):
+def test_parse_instruction_type_with_io_instruction(mock_instructions, source_line):
     source_line.operator = "text"
-    source_line.assembler.pseudo_operators.is_pseudo_operator.return_value = False
-    source_line.assembler.symbol_table.is_primary_instruction_symbol.return_value = (
-        False
-    )
-    source_line.assembler.symbol_table.is_io_instruction_symbol.return_value = True
+    mock_instructions[5] = (SymbolKind.IO_INSTRUCTION, 0o700140000000)
     source_line._parse_instruction_type("")
+    assert source_line.operator_id == 5
     assert source_line.is_pseudo_operator is False
     assert source_line.is_assignment is False
     assert source_line.is_instruction is True
@@ -251,12 +345,9 @@ def test_parse_instruction_type_with_io_instruction(source_line):
 
 def test_parse_instruction_type_with_value(source_line):
     source_line.operator = "text"
-    source_line.assembler.pseudo_operators.is_pseudo_operator.return_value = False
-    source_line.assembler.symbol_table.is_primary_instruction_symbol.return_value = (
-        False
-    )
-    source_line.assembler.symbol_table.is_io_instruction_symbol.return_value = False
+    source_line.assembler.symbol_table.instruction_id.return_value = 0
     source_line._parse_instruction_type("")
+    assert source_line.operator_id == 0
     assert source_line.is_pseudo_operator is False
     assert source_line.is_assignment is False
     assert source_line.is_instruction is False
@@ -269,128 +360,57 @@ def test_parse_instruction_type_with_value(source_line):
 
 def test_parse_instruction_type_with_invalid_value(source_line):
     source_line.operator = "text"
-    source_line.assembler.pseudo_operators.is_pseudo_operator.return_value = False
-    source_line.assembler.symbol_table.is_primary_instruction_symbol.return_value = (
-        False
-    )
-    source_line.assembler.symbol_table.is_io_instruction.return_value = False
+    source_line.assembler.symbol_table.instruction_id.return_value = 0
     with pytest.raises(AssemblyError) as exc_info:
         source_line._parse_instruction_type("invalid")
     assert str(exc_info.value) == "Unable to parse 'text'."
 
 
 @pytest.fixture
-def mock_read_comment(source_line):
-    source_line._read_comment = mock.Mock()
-    return source_line._read_comment
-
-
-@pytest.fixture
-def mock_read_labels(source_line):
-    source_line._read_labels = mock.Mock()
-    return source_line._read_labels
-
-
-@pytest.fixture
-def mock_read_assignment(source_line):
-    source_line._read_assignment = mock.Mock()
-    return source_line._read_assignment
+def mock_read_fields():
+    with mock.patch.object(SourceLine, "_read_fields") as m:
+        yield m
 
 
 @pytest.fixture
-def mock_read_operator(source_line):
-    source_line._read_operator = mock.Mock()
-    return source_line._read_operator
+def mock_parse_instruction_type():
+    with mock.patch.object(SourceLine, "_parse_instruction_type") as m:
+        yield m
 
 
 @pytest.fixture
-def mock_parse_instruction_type(source_line):
-    source_line._parse_instruction_type = mock.Mock()
-    return source_line._parse_instruction_type
-
-
-@pytest.fixture
-def mock_parse_arguments(source_line):
-    source_line._parse_arguments = mock.Mock()
-    return source_line._parse_arguments
-
-
-def test_read_text_calls_read_comment(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
-    mock_parse_instruction_type,
-    mock_parse_arguments,
-    source_line,
-    text,
-):
-    source_line.read_text()
-    mock_read_comment.assert_called_once_with(text)
-
-
-def test_read_text_calls_read_labels(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
-    mock_parse_instruction_type,
-    mock_parse_arguments,
-    source_line,
-    text,
-):
-    source_line.read_text()
-    mock_read_labels.assert_called_once_with(mock_read_comment.return_value)
+def mock_parse_arguments():
+    with mock.patch.object(SourceLine, "_parse_arguments") as m:
+        yield m
 
 
-def test_read_text_calls_read_assignment(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
+def test_read_text_calls_read_fields(
+    mock_read_fields,
     mock_parse_instruction_type,
     mock_parse_arguments,
     source_line,
     text,
 ):
     source_line.read_text()
-    mock_read_assignment.assert_called_once_with(mock_read_labels.return_value)
+    mock_read_fields.assert_called_once_with(text)
 
 
-def test_read_text_calls_read_operator(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
-    mock_parse_instruction_type,
-    mock_parse_arguments,
-    source_line,
-    text,
-):
-    source_line.read_text()
-    mock_read_operator.assert_called_once_with(mock_read_assignment.return_value)
-
-
-def test_read_text_does_not_call_read_operator_with_assignment(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
+def test_read_text_does_not_call_parse_instruction_type_with_assignment(
+    mock_read_fields,
     mock_parse_instruction_type,
     mock_parse_arguments,
     source_line,
     text,
 ):
     source_line.is_assignment = True
+    source_line.operator = "text"
     source_line.read_text()
-    mock_read_operator.assert_not_called()
+    mock_parse_instruction_type.assert_not_called()
+    mock_parse_arguments.assert_not_called()
 
 
 def test_read_text_does_not_call_parse_instruction_type_with_non_operator(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
+    mock_read_fields,
     mock_parse_instruction_type,
     mock_parse_arguments,
     source_line,
@@ -402,10 +422,7 @@ def test_read_text_does_not_call_parse_instruction_type_with_non_operator(
 
 
 def test_read_text_does_not_call_parse_instruction_type_with_operator(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
+    mock_read_fields,
     mock_parse_instruction_type,
     mock_parse_arguments,
     source_line,
@@ -413,14 +430,11 @@ def test_read_text_does_not_call_parse_instruction_type_with_operator(
 ):
     source_line.operator = "text"
     source_line.read_text()
-    mock_parse_instruction_type.assert_called_once_with(mock_read_operator.return_value)
+    mock_parse_instruction_type.assert_called_once_with(mock_read_fields.return_value)
 
 
 def test_read_text_does_not_call_parse_arguments_with_non_operator(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
+    mock_read_fields,
     mock_parse_instruction_type,
     mock_parse_arguments,
     source_line,
@@ -432,10 +446,7 @@ def test_read_text_does_not_call_parse_arguments_with_non_operator(
 
 
 def test_read_text_does_not_call_parse_arguments_with_operator(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
+    mock_read_fields,
     mock_parse_instruction_type,
     mock_parse_arguments,
     source_line,
@@ -443,14 +454,11 @@ def test_read_text_does_not_call_parse_arguments_with_operator(
 ):
     source_line.operator = "text"
     source_line.read_text()
-    mock_parse_arguments.assert_called_once_with(mock_read_operator.return_value)
+    mock_parse_arguments.assert_called_once_with(mock_read_fields.return_value)
 
 
 def test_read_text_raises_for_invalid_operator(
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
+    mock_read_fields,
     mock_parse_instruction_type,
     mock_parse_arguments,
     source_line,
@@ -458,7 +466,7 @@ def test_read_text_raises_for_invalid_operator(
 ):
     source_line.operator = "text"
     mock_parse_arguments.side_effect = Exception()
-    mock_read_operator.return_value = "invalid text"
+    mock_read_fields.return_value = "invalid text"
     with pytest.raises(AssemblyError) as e:
         source_line.read_text()
     assert str(e.value) == "Unable to parse argument 'invalid text'."
@@ -467,10 +475,7 @@ def test_read_text_raises_for_invalid_operator(
 @mock.patch("pdp10asm.source_line.PseudoOperators")
 def test_read_text_handles_pseudo_operator_if_pseudo_operator(
     mock_pseduo_operators,
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
+    mock_read_fields,
     mock_parse_instruction_type,
     mock_parse_arguments,
     source_line,
@@ -489,10 +494,7 @@ def test_read_text_handles_pseudo_operator_if_pseudo_operator(
 @mock.patch("pdp10asm.source_line.PseudoOperators")
 def test_read_text_does_not_handle_pseudo_operator_if_not_pseudo_operator(
     mock_pseduo_operators,
-    mock_read_comment,
-    mock_read_labels,
-    mock_read_assignment,
-    mock_read_operator,
+    mock_read_fields,
     mock_parse_instruction_type,
     mock_parse_arguments,
     source_line,
@@ -506,21 +508,74 @@ def test_read_text_does_not_handle_pseudo_operator_if_not_pseudo_operator(
 
 
 @pytest.fixture
-def mock_parse_primary_operand(source_line):
-    source_line._parse_primary_operand = mock.Mock()
-    return source_line._parse_primary_operand
+def parse_cache(source_line):
+    source_line.assembler.parse_cache = ParseCache()
+    return source_line.assembler.parse_cache
+
+
+def test_read_text_adds_parsed_fields_to_parse_cache(
+    mock_read_fields,
+    mock_parse_instruction_type,
+    mock_parse_arguments,
+    parse_cache,
+    source_line,
+):
+    def parse_instruction_type(text):
+        source_line.memory_location_count = 1
+        source_line.is_instruction = True
+
+    mock_parse_instruction_type.side_effect = parse_instruction_type
+    source_line.operator = "MOVE"
+    source_line.instruction_text = "MOVE 1,2"
+    source_line.read_text()
+    assert parse_cache.get("MOVE 1,2") == (
+        ("memory_location_count", 1),
+        ("is_instruction", True),
+    )
+
+
+def test_read_text_uses_parse_cache(
+    mock_read_fields,
+    mock_parse_instruction_type,
+    mock_parse_arguments,
+    parse_cache,
+    source_line,
+):
+    parse_cache.add("MOVE 1,2", (("memory_location_count", 1), ("accumulator", "1")))
+    source_line.operator = "MOVE"
+    source_line.instruction_text = "MOVE 1,2"
+    source_line.read_text()
+    mock_parse_instruction_type.assert_not_called()
+    mock_parse_arguments.assert_not_called()
+    assert source_line.memory_location_count == 1
+    assert source_line.accumulator == "1"
+    assert source_line.memory_address is None
+
+
+def test_read_text_does_not_use_parse_cache_with_assignment(
+    mock_read_fields, parse_cache, source_line
+):
+    source_line.is_assignment = True
+    source_line.read_text()
+    assert parse_cache.lookups == 0
+
+
+@pytest.fixture
+def mock_parse_primary_operand():
+    with mock.patch.object(SourceLine, "_parse_primary_operand") as m:
+        yield m
 
 
 @pytest.fixture
-def mock_parse_io_operand(source_line):
-    source_line._parse_io_operand = mock.Mock()
-    return source_line._parse_io_operand
+def mock_parse_io_operand():
+    with mock.patch.object(SourceLine, "_parse_io_operand") as m:
+        yield m
 
 
 @pytest.fixture
-def mock_parse_value(source_line):
-    source_line._parse_value = mock.Mock()
-    return source_line._parse_value
+def mock_parse_value():
+    with mock.patch.object(SourceLine, "_parse_value") as m:
+        yield m
 
 
 def test_parse_arguments_with_pseudo_operator(
@@ -658,9 +713,11 @@ def indirect():
 
 
 @pytest.fixture
-def mock_parse_address(source_line, ac, index, memory, indirect):
-    source_line.parse_address = mock.Mock(return_value=(ac, index, memory, indirect))
-    return source_line.parse_address
+def mock_parse_address(ac, index, memory, indirect):
+    with mock.patch.object(
+        SourceLine, "parse_address", return_value=(ac, index, memory, indirect)
+    ) as m:
+        yield m
 
 
 def test_parse_primary_operand(
@@ -710,7 +767,7 @@ def test_source_line_with_pseudo_operator(assembler):
     assert source_line.memory_address is None
     assert source_line.device_id is None
     assert source_line.is_indirect is False
-    assert source_line.labels == []
+    assert source_line.labels == ()
     assert source_line.comment == "comment"
 
 
@@ -731,7 +788,7 @@ def test_source_line_with_instruction(assembler):
     assert source_line.memory_address == "MEM"
     assert source_line.device_id is None
     assert source_line.is_indirect is True
-    assert source_line.labels == ["LABEL1", "LABEL2", "LABEL3"]
+    assert source_line.labels == ("LABEL1", "LABEL2", "LABEL3")
     assert source_line.comment == "Some Words"
 
 
@@ -752,7 +809,7 @@ def test_source_line_with_io_instruction(assembler):
     assert source_line.index_register == "INDEX"
     assert source_line.memory_address == "MEM"
     assert source_line.is_indirect is False
-    assert source_line.labels == ["LABEL1", "LABEL2", "LABEL3"]
+    assert source_line.labels == ("LABEL1", "LABEL2", "LABEL3")
     assert source_line.comment == "Some Words"
 
 
@@ -775,7 +832,7 @@ def test_source_line_with_assignment(assembler):
     assert source_line.index_register is None
     assert source_line.memory_address is None
     assert source_line.is_indirect is False
-    assert source_line.labels == []
+    assert source_line.labels == ()
     assert source_line.comment == "Some Words"
 
 
@@ -799,7 +856,7 @@ def test_source_line_with_empty_string(assembler):
     assert source_line.index_register is None
     assert source_line.memory_address is None
     assert source_line.is_indirect is False
-    assert source_line.labels == []
+    assert source_line.labels == ()
     assert source_line.comment is None
 
 
@@ -823,7 +880,7 @@ def test_source_line_with_only_comment(assembler):
     assert source_line.index_register is None
     assert source_line.memory_address is None
     assert source_line.is_indirect is False
-    assert source_line.labels == []
+    assert source_line.labels == ()
     assert source_line.comment == "comment text"
 
 
@@ -847,7 +904,7 @@ def test_source_line_with_halt(assembler):
     assert source_line.index_register is None
     assert source_line.memory_address == "100"
     assert source_line.is_indirect is False
-    assert source_line.labels == ["FIN"]
+    assert source_line.labels == ("FIN",)
     assert source_line.comment is None
 
 
@@ -873,7 +930,7 @@ def test_source_line_with_value(assembler):
     assert source_line.memory_address is None
     assert source_line.value == "7000"
     assert source_line.is_indirect is False
-    assert source_line.labels == []
+    assert source_line.labels == ()
     assert source_line.comment is None
 
 
@@ -899,5 +956,55 @@ def test_source_line_with_seven_bit_value(assembler):
     assert source_line.memory_address is None
     assert source_line.value == '"WORD"'
     assert source_line.is_indirect is False
-    assert source_line.labels == []
+    assert source_line.labels == ()
     assert source_line.comment is None
+
+
+@pytest.mark.integration_test
+@pytest.mark.parametrize(
+    "text",
+    (
+        "LABEL: MOVE AC1,@MEM(INDEX) ; comment",
+        "DATAO PTP,@MEM(INDEX)",
+        "EXP 1,2,3",
+        "7000",
+        '"WORD"',
+    ),
+)
+def test_cached_parse_matches_parse(text, assembler):
+    expected = SourceLine(
+        assembler=PDP10Assembler("", parse_cache_size=0),
+        source_line_number=1,
+        text=text,
+    )
+    expected.read_text()
+    for _ in range(2):
+        source_line = SourceLine(assembler=assembler, source_line_number=1, text=text)
+        source_line.read_text()
+        for name in SourceLine.__slots__:
+            if name not in ("assembler", "_assembled_line"):
+                assert getattr(source_line, name) == getattr(expected, name)
+    assert assembler.parse_cache.hits == 1
+
+
+@pytest.mark.integration_test
+@pytest.mark.parametrize(
+    "text,constants,radix",
+    (
+        ("MOVE 1,@10(3)", {"1": 1, "10": 8, "3": 3}, 8),
+        ("MOVE 1,FOO", {"1": 1}, 8),
+        ("DATAO PTP,^D10", {"^D10": 10}, None),
+        ("X=^D10*2", {"^D10*2": 20}, 8),
+        ("7000", {"7000": 0o7000}, 8),
+        ("MOVE FOO,.+1", None, None),
+        ("EXP 1,2", None, None),
+        ('"WORD"', None, None),
+    ),
+)
+def test_read_text_folds_constants(text, constants, radix):
+    source_line = SourceLine(
+        assembler=PDP10Assembler(""), source_line_number=1, text=text
+    )
+    source_line.read_text()
+    assert source_line.constants == constants
+    assert source_line.constants_radix == radix
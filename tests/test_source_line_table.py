@@ -0,0 +1,255 @@
+import tracemalloc
+from unittest import mock
+
+import pytest
+
+from pdp10asm.assembler import PDP10Assembler
+from pdp10asm.listing import SourceListing
+from pdp10asm.program import AssembledLine
+from pdp10asm.source_line import SourceLine
+from pdp10asm.source_line_table import SourceLineTable, SourceLineView
+
+
+@pytest.fixture
+def assembler():
+    return PDP10Assembler("")
+
+
+@pytest.fixture
+def table(assembler):
+    return SourceLineTable(assembler=assembler)
+
+
+@pytest.fixture
+def source_lines(assembler):
+    lines = []
+    for number, text in enumerate(
+        (
+            "LABEL: MOVE 1,2 ; Comment",
+            "",
+            "X=5",
+            "  EXP 1,2,3",
+            "A: B: DATAO TTY,@LOOP(3);",
+            "   ; Comment only",
+            "  5K",
+        ),
+        start=1,
+    ):
+        source_line = SourceLine(
+            assembler=assembler, source_line_number=number, text=text
+        )
+        source_line.read_text()
+        lines.append(source_line)
+    return lines
+
+
+@pytest.fixture
+def filled_table(table, source_lines):
+    table.extend(source_lines)
+    return table
+
+
+def test_table_is_empty(table):
+    assert len(table) == 0
+
+
+def test_table_has_assembler(table, assembler):
+    assert table.assembler is assembler
+
+
+def test_append_adds_line(table, source_lines):
+    table.append(source_lines[0])
+    assert len(table) == 1
+
+
+def test_extend_adds_lines(filled_table, source_lines):
+    assert len(filled_table) == len(source_lines)
+
+
+def test_getitem_returns_view(filled_table):
+    view = filled_table[0]
+    assert isinstance(view, SourceLineView)
+    assert view.table is filled_table
+    assert view.index == 0
+
+
+def test_getitem_negative_index(filled_table):
+    assert filled_table[-1].index == 6
+
+
+def test_getitem_out_of_range(filled_table):
+    with pytest.raises(IndexError):
+        filled_table[7]
+
+
+def test_getitem_slice(filled_table):
+    assert [view.index for view in filled_table[1:3]] == [1, 2]
+
+
+def test_iteration(filled_table):
+    assert [view.index for view in filled_table] == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_operators_are_interned(table, assembler):
+    for number in range(3):
+        source_line = SourceLine(
+            assembler=assembler, source_line_number=number, text="MOVE 1,2"
+        )
+        source_line.read_text()
+        table.append(source_line)
+    assert table.operators == [None, "MOVE"]
+    assert list(table.operator_ids) == [1, 1, 1]
+
+
+def test_operands_are_interned(table, assembler):
+    for number, text in enumerate(("MOVE 1,2", "LOOP: MOVE 1,2", "MOVE 2,1")):
+        source_line = SourceLine(
+            assembler=assembler, source_line_number=number, text=text
+        )
+        source_line.read_text()
+        table.append(source_line)
+    assert list(table.operand_ids) == [0, 0, 1]
+    assert len(table.operands) == 2
+
+
+def test_text_is_stored_in_shared_buffer(table, source_lines):
+    table.extend(source_lines[:4])
+    assert table.text_buffer == bytearray(b"LABEL: MOVE 1,2 ; CommentX=5  EXP 1,2,3")
+
+
+def test_text_with_non_ascii_characters(table, assembler):
+    source_line = SourceLine(
+        assembler=assembler, source_line_number=1, text="MOVE 1,2 ; été"
+    )
+    source_line.read_text()
+    table.append(source_line)
+    assert table.text(0) == "MOVE 1,2 ; été"
+
+
+@pytest.mark.parametrize(
+    "name",
+    ("source_line_number", "text", "operator", "memory_location_count", "labels")
+    + SourceLineTable.line_flags
+    + SourceLineTable.operand_fields
+    + ("comment", "instruction_text"),
+)
+def test_view_matches_source_line(filled_table, source_lines, name):
+    for view, source_line in zip(filled_table, source_lines, strict=True):
+        assert getattr(view, name) == getattr(source_line, name)
+
+
+def test_view_has_labels_flag(filled_table):
+    assert [view.has_labels for view in filled_table] == [
+        True,
+        False,
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_view_of_unparsed_line(table, assembler):
+    table.append(SourceLine(assembler=assembler, source_line_number=1, text="A ; B"))
+    assert table[0].comment is None
+    assert table[0].instruction_text is None
+    assert table[0].is_empty is True
+
+
+def test_view_assembler(filled_table, assembler):
+    assert filled_table[0].assembler is assembler
+
+
+def test_view_equality(filled_table):
+    assert filled_table[0] == filled_table[0]
+    assert filled_table[0] != filled_table[1]
+    assert hash(filled_table[0]) == hash(filled_table[0])
+
+
+def test_view_repr(filled_table):
+    assert repr(filled_table[0]) == "<SourceLineView: 1>"
+
+
+def test_view_assembled_line_placeholder(filled_table):
+    assembled_line = filled_table[0].assembled_line
+    assert assembled_line.memory_location is None
+    assert assembled_line.binary_value is None
+    assert filled_table.assembled_lines[0] is None
+
+
+def test_view_assembled_line_is_stored(filled_table):
+    assembled_line = AssembledLine(filled_table[0], 0o100, 0o200040000002)
+    assert filled_table[0].assembled_line is assembled_line
+    assert filled_table.assembled_lines[0] is assembled_line
+
+
+def test_columnar_default():
+    assert PDP10Assembler("").columnar is False
+
+
+def test_parse_text_returns_table_when_columnar():
+    assembler = PDP10Assembler("MOVE 1,2\nMOVE 2,3", columnar=True)
+    source_lines = assembler.parse_text(assembler.text)
+    assert isinstance(source_lines, SourceLineTable)
+    assert len(source_lines) == 2
+
+
+@pytest.mark.integration_test
+def test_columnar_assembly_matches_assembly(memory_to_paper_tape_raw_text):
+    expected = PDP10Assembler(memory_to_paper_tape_raw_text).assemble()
+    program = PDP10Assembler(memory_to_paper_tape_raw_text, columnar=True).assemble()
+    assert isinstance(program.source_lines, SourceLineTable)
+    assert program.listing_text() == expected.listing_text()
+    assert program.listing_text(SourceListing) == expected.listing_text(SourceListing)
+
+
+@pytest.mark.integration_test
+def test_parallel_columnar_assembly_matches_assembly(hello_world_text):
+    expected = PDP10Assembler(hello_world_text).assemble()
+    assembler = PDP10Assembler(hello_world_text, workers=2, columnar=True)
+    assembler.parse_chunk_size = 5
+    program = assembler.assemble()
+    assert isinstance(program.source_lines, SourceLineTable)
+    assert program.listing_text(SourceListing) == expected.listing_text(SourceListing)
+
+
+def generated_source(count):
+    lines = ["        LOC 100", "X=5"]
+    for number in range(count):
+        lines += [
+            f"L{number}:  MOVE 1,L{number}+X ; Comment {number}",
+            f"        JRST L{number}",
+            "        EXP 1,2,3",
+            f"        DATAO TTY,@L{number}(2)",
+        ]
+    lines.append("        END")
+    return "\n".join(lines)
+
+
+def test_columnar_assembly_parses_each_line_once():
+    text = generated_source(50)
+    with mock.patch.object(
+        SourceLine, "read_text", autospec=True, side_effect=SourceLine.read_text
+    ) as read_text:
+        PDP10Assembler(text, columnar=True).assemble()
+    assert read_text.call_count == len(text.splitlines())
+
+
+def parsed_size(text, columnar):
+    assembler = PDP10Assembler(text, columnar=columnar, parse_cache_size=0)
+    assembler.parse_text(text)
+    tracemalloc.start()
+    try:
+        source_lines = assembler.parse_text(text)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del source_lines
+    return size
+
+
+@pytest.mark.integration_test
+def test_columnar_source_lines_use_less_memory():
+    text = generated_source(1000)
+    assert parsed_size(text, columnar=True) < parsed_size(text, columnar=False) * 0.7
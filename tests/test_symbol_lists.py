@@ -0,0 +1,61 @@
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pdp10asm import opcode_tables, symbol_lists
+from pdp10asm.symbol_lists import (
+    SymbolList,
+    opcode_tables_source,
+    write_opcode_tables,
+)
+from pdp10asm.symbol_table import SymbolTable
+
+
+def test_opcode_tables_are_up_to_date():
+    assert Path(opcode_tables.__file__).read_text() == opcode_tables_source()
+
+
+def test_write_opcode_tables(tmp_path):
+    path = tmp_path / "opcode_tables.py"
+    write_opcode_tables(path)
+    assert path.read_text() == opcode_tables_source()
+
+
+def test_symbol_table_matches_symbol_lists():
+    symbol_table = SymbolTable()
+    symbols = {symbol.name: symbol for symbol in SymbolList.get_system_symbols()}
+    for name, symbol in symbols.items():
+        assert symbol_table.lookup(name) == (symbol.kind, symbol.value)
+
+
+@pytest.mark.integration_test
+@pytest.mark.parametrize("opcode_tables_text", (None, "SYMBOLS = {\n"))
+def test_opcode_tables_are_generated_when_missing_or_broken(
+    tmp_path, opcode_tables_text
+):
+    package = tmp_path / "pdp10asm"
+    shutil.copytree(
+        Path(symbol_lists.__file__).parent,
+        package,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    path = package / "opcode_tables.py"
+    if opcode_tables_text is None:
+        path.unlink()
+    else:
+        path.write_text(opcode_tables_text)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (str(tmp_path), env.get("PYTHONPATH")))
+    )
+    subprocess.run(
+        [sys.executable, "-m", "pdp10asm.symbol_lists"],
+        cwd=tmp_path,
+        env=env,
+        check=True,
+    )
+    assert path.read_text() == opcode_tables_source()
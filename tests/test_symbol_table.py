@@ -2,8 +2,16 @@ from unittest import mock
 
 import pytest
 
+from pdp10asm.cross_references import CrossReferences
 from pdp10asm.exceptions import AssemblyError
-from pdp10asm.symbol_table import SymbolTable, UserSymbol
+from pdp10asm.symbol_table import (
+    InstructionSymbol,
+    SymbolKind,
+    SymbolTable,
+    SystemSymbols,
+    UserSymbol,
+    system_symbols,
+)
 
 
 @pytest.fixture
@@ -52,16 +60,109 @@ def test_get_symbol_value_with_no_symbol_set(symbol_table):
     assert str(exc_info.value) == "Symbol 'SYMBOL' is not defined."
 
 
-@mock.patch("pdp10asm.symbol_table.SymbolList")
-def test_load_system_symbols(mock_symbol_list, symbol_table):
-    mock_symbols = [mock.Mock()] * 3
-    mock_symbol_list.get_system_symbols.return_value = mock_symbols
-    symbol_table.add_symbol = mock.Mock()
+def test_find_symbol_value(symbol_table, symbol, value):
+    symbol_table.add_user_symbol(symbol, value, 1)
+    assert symbol_table.find_symbol_value(symbol) == value
+
+
+def test_find_symbol_value_with_no_symbol_set(symbol_table):
+    assert symbol_table.find_symbol_value("SYMBOL") is None
+
+
+def test_find_symbol_value_adds_cross_references(symbol_table):
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    symbol_table.cross_references = CrossReferences()
+    symbol_table.cross_references.set_line(7)
+    symbol_table.get_symbol_value("FOO")
+    symbol_table.find_symbol_value("BAR")
+    assert list(symbol_table.cross_references) == ["FOO"]
+
+
+def test_load_system_symbols(symbol_table):
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    symbol_table.add_user_symbol("MOVE", 5, 2)
     symbol_table.load_system_symbols()
-    mock_symbol_list.get_system_symbols.assert_called_once_with()
-    symbol_table.add_symbol.assert_has_calls(
-        (mock.call(_) for _ in mock_symbols), any_order=False
+    assert symbol_table.user_symbols() == []
+    assert symbol_table.instruction_id("MOVE") > 0
+    assert symbol_table.instructions is system_symbols().instructions
+
+
+def test_system_symbols_are_shared(symbol_table):
+    assert SymbolTable().system is symbol_table.system
+    assert SymbolTable().get_symbol("MOVE") is symbol_table.get_symbol("MOVE")
+
+
+def test_system_symbols_cannot_be_changed(symbol_table):
+    with pytest.raises(TypeError):
+        symbol_table.system.records["FOO"] = (SymbolKind.USER, 5)
+
+
+def test_system_symbols_are_not_created_for_lookups():
+    system = SystemSymbols(
+        records={"MOVE": (SymbolKind.PRIMARY_INSTRUCTION, 0o200000000000)},
+        instructions=(None, (SymbolKind.PRIMARY_INSTRUCTION, 0o200000000000)),
+        instruction_ids={"MOVE": 1},
+        opcodes={0o200000000000: "MOVE"},
+    )
+    with mock.patch("pdp10asm.symbol_table.system_symbols", return_value=system):
+        symbol_table = SymbolTable()
+    assert symbol_table.lookup("MOVE") == (
+        SymbolKind.PRIMARY_INSTRUCTION,
+        0o200000000000,
     )
+    assert symbol_table.instruction_id("MOVE") == 1
+    assert system._symbols == {}
+
+
+def test_system_symbol_objects_are_created_once(symbol_table):
+    move = symbol_table.get_symbol("MOVE")
+    assert move.value == 0o200000000000
+    assert SymbolTable().get_symbol("MOVE") is move
+
+
+def test_opcodes(symbol_table):
+    assert symbol_table.system.opcodes[0o200000000000] == "MOVE"
+    assert symbol_table.system.opcodes[0o254200000000] == "HALT"
+
+
+def test_get_symbol(symbol_table):
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    assert symbol_table.get_symbol("FOO").value == 5
+    assert isinstance(symbol_table.get_symbol("MOVE"), InstructionSymbol)
+    assert symbol_table.get_symbol("BAR") is None
+
+
+def test_deleted_system_symbol_is_not_defined(symbol_table):
+    symbol_table.delete_symbol("TTY")
+    assert symbol_table.is_defined("TTY") is False
+    assert symbol_table.symbol_versions(("TTY",)) == (None,)
+
+
+def test_delete_undefined_symbol(symbol_table):
+    with pytest.raises(KeyError):
+        symbol_table.delete_symbol("FOO")
+
+
+def test_changes_do_not_affect_other_symbol_tables(symbol_table):
+    symbol_table.add_user_symbol("MOVE", 55, 1)
+    symbol_table.delete_symbol("TTY")
+    other_symbol_table = SymbolTable()
+    assert other_symbol_table.get_symbol_value("MOVE") == 0o200000000000
+    assert other_symbol_table.instruction_id("MOVE") > 0
+    assert other_symbol_table.is_defined("TTY") is True
+
+
+def test_instructions_are_copied_when_changed(symbol_table):
+    symbol_table.add_user_symbol("FOO", 55, 1)
+    assert symbol_table.instructions is system_symbols().instructions
+    symbol_table.add_user_symbol("MOVE", 55, 2)
+    assert symbol_table.instructions is not system_symbols().instructions
+
+
+def test_symbol_version_of_system_symbol(symbol_table):
+    assert symbol_table.symbol_versions(("MOVE",)) == (0,)
+    symbol_table.add_user_symbol("MOVE", 55, 1)
+    assert symbol_table.symbol_versions(("MOVE",)) != (0,)
 
 
 def test_user_symbols(symbol_table, symbol, value):
@@ -72,6 +173,118 @@ def test_user_symbols(symbol_table, symbol, value):
     assert return_value[0].name == symbol
 
 
+def test_user_symbols_are_in_definition_order(symbol_table):
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    symbol_table.add_user_symbol("BAR", 6, 2)
+    symbol_table.add_user_symbol("FOO", 7, 3)
+    assert [symbol.name for symbol in symbol_table.user_symbols()] == ["FOO", "BAR"]
+    assert symbol_table.get_symbol_value("FOO") == 7
+
+
+def test_user_symbols_exclude_system_symbols(symbol_table):
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    symbol_table.add_symbol(InstructionSymbol("FOO", 0o200))
+    symbol_table.add_user_symbol("BAR", 6, 2)
+    symbol_table.delete_symbol("BAR")
+    assert symbol_table.user_symbols() == []
+
+
+def test_user_symbols_by_name(symbol_table):
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    symbol_table.add_user_symbol("BAR", 6, 2)
+    names = [symbol.name for symbol in symbol_table.user_symbols_by_name()]
+    assert names == ["BAR", "FOO"]
+
+
+def test_user_symbols_by_value(symbol_table):
+    symbol_table.add_user_symbol("FOO", 6, 1)
+    symbol_table.add_user_symbol("BAZ", 5, 2)
+    symbol_table.add_user_symbol("BAR", 6, 3)
+    names = [symbol.name for symbol in symbol_table.user_symbols_by_value()]
+    assert names == ["BAZ", "BAR", "FOO"]
+
+
+def test_sorted_user_symbols_are_kept_until_symbols_change(symbol_table):
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    view = symbol_table.user_symbols_by_name()
+    assert symbol_table.user_symbols_by_name() is view
+    symbol_table.add_user_symbol("BAR", 6, 2)
+    view = symbol_table.user_symbols_by_name()
+    assert [symbol.name for symbol in view] == ["BAR", "FOO"]
+    symbol_table.delete_symbol("BAR")
+    assert [symbol.name for symbol in symbol_table.user_symbols_by_name()] == ["FOO"]
+
+
+def test_journal_is_off_by_default(symbol_table):
+    assert symbol_table.journal is None
+
+
+def test_journal_records_changes(symbol_table):
+    symbol_table.journal = []
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    new_symbol = symbol_table.symbol_table["FOO"]
+    move = symbol_table.get_symbol("MOVE")
+    symbol_table.delete_symbol("MOVE")
+    assert symbol_table.journal == [("FOO", None, new_symbol), ("MOVE", move, None)]
+
+
+def test_symbol_versions_change_when_symbols_are_defined(symbol_table):
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    symbol_table.add_user_symbol("BAR", 6, 2)
+    versions = symbol_table.symbol_versions(("FOO", "BAR"))
+    symbol_table.add_user_symbol("FOO", 5, 3)
+    new_versions = symbol_table.symbol_versions(("FOO", "BAR"))
+    assert new_versions[0] != versions[0]
+    assert new_versions[1] == versions[1]
+
+
+def test_symbol_version_of_undefined_symbol(symbol_table):
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    symbol_table.delete_symbol("FOO")
+    assert symbol_table.symbol_versions(("FOO", "BAR")) == (None, None)
+
+
+def test_version_changes_when_symbols_change(symbol_table):
+    versions = [symbol_table.version]
+    symbol_table.add_user_symbol("FOO", 5, 1)
+    versions.append(symbol_table.version)
+    symbol_table.delete_symbol("FOO")
+    versions.append(symbol_table.version)
+    assert len(set(versions)) == 3
+
+
+def test_versions_are_unique_between_symbol_tables(symbol_table):
+    assert SymbolTable().version != symbol_table.version
+
+
+@pytest.mark.parametrize("value", ("MOVE", "HALT", "DATAO"))
+def test_instruction_id(value, symbol_table):
+    instruction_id = symbol_table.instruction_id(value)
+    assert instruction_id > 0
+    assert symbol_table.instructions[instruction_id] == symbol_table.lookup(value)
+
+
+@pytest.mark.parametrize("value", ("TTY", "FOO", "BAR"))
+def test_instruction_id_of_non_instruction(value, symbol_table):
+    symbol_table.add_user_symbol("FOO", 55, 1)
+    assert symbol_table.instruction_id(value) == 0
+    assert symbol_table.instructions[0] is None
+
+
+def test_instruction_id_of_redefined_instruction(symbol_table):
+    symbol_table.add_user_symbol("MOVE", 55, 1)
+    assert symbol_table.instruction_id("MOVE") == 0
+
+
+def test_instruction_id_of_deleted_instruction(symbol_table):
+    symbol_table.delete_symbol("MOVE")
+    assert symbol_table.instruction_id("MOVE") == 0
+
+
+def test_instruction_ids_are_the_same_for_every_symbol_table(symbol_table):
+    assert SymbolTable().instruction_ids == symbol_table.instruction_ids
+
+
 @pytest.mark.parametrize(
     "value,expected",
     (
@@ -148,6 +361,29 @@ def test_is_defined(value, expected, symbol_table):
     assert symbol_table.is_defined(value) == expected
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        ("MOVE", (SymbolKind.PRIMARY_INSTRUCTION, 0o200000000000)),
+        ("JRST", (SymbolKind.PRIMARY_INSTRUCTION, 0o254000000000)),
+        ("DATAO", (SymbolKind.IO_INSTRUCTION, 0o700140000000)),
+        ("TTY", (SymbolKind.DEVICE_CODE, 0o120)),
+        ("FOO", (SymbolKind.USER, 55)),
+        ("BAR", (SymbolKind.UNDEFINED, None)),
+    ),
+)
+def test_lookup(value, expected, symbol_table):
+    symbol_table.add_user_symbol("FOO", 55, 1)
+    assert symbol_table.lookup(value) == expected
+
+
+def test_lookup_of_redefined_system_symbol(symbol_table):
+    symbol_table.add_user_symbol("TTY", 55, 1)
+    assert symbol_table.lookup("TTY") == (SymbolKind.USER, 55)
+    symbol_table.delete_symbol("TTY")
+    assert symbol_table.lookup("TTY") == (SymbolKind.UNDEFINED, None)
+
+
 def test_base_symbol_repr_method():
     symbol = UserSymbol("SYMBOL", 10, 10)
     assert repr(symbol) == "<UserSymbol: SYMBOL>"